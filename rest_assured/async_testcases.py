@@ -0,0 +1,360 @@
+import asyncio
+from timeit import default_timer
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Model
+from rest_framework import status
+
+from rest_assured.testcases import (CreateAPITestCaseMixin, DestroyAPITestCaseMixin, DetailAPITestCaseMixin,
+                                    ListAPITestCaseMixin, UpdateAPITestCaseMixin)
+
+try:
+    from django.test import AsyncClient
+except ImportError:
+    AsyncClient = None
+
+
+def _get_data(response):
+    # DRF's responses keep their data, otherwise decode the JSON content
+    if hasattr(response, 'data'):
+        return response.data
+
+    return response.json()
+
+
+class AsyncAPITestCaseMixin(object):
+
+    """Adds an async test client and helpers for sending concurrent requests to the test case.
+
+    The async mixins cover the same endpoint definitions as their sync counterparts, using async test methods.
+    Requires Django 3.1 or later for its ``AsyncClient``, otherwise the tests are skipped.
+
+    The user instance, if it's a model instance, is logged in using the client's ``force_login()``.
+    """
+
+    #: The async client class. Defaults to Django's ``AsyncClient``.
+    async_client_class = AsyncClient
+    #: The async client instance.
+    async_client = None
+
+    def setUp(self):
+        """Creates the async client, after generating the main object and user instance."""
+
+        super(AsyncAPITestCaseMixin, self).setUp()
+
+        if self.async_client_class is None:
+            self.skipTest('Async tests require Django 3.1 or later.')
+
+        self.async_client = self.async_client_class()
+
+        if isinstance(self.user, Model):
+            self.async_client.force_login(self.user)
+
+    async def async_send_request(self, operation, method, *args, **kwargs):
+        """Send a request using the async client and return the response.
+
+        Like ``send_request()``, the response is verified against the operation's ``latency_budget_ms`` and
+        ``max_payload_bytes``. The ``max_queries``, ``max_memory_kb`` and ``profile_dir`` checks do not apply
+        to async requests, since their views run in another thread, and concurrently with other requests.
+
+        :param operation: Name of the operation, e.g. ``'list'``.
+        :param method: Name of the client's method to call, e.g. ``'get'``.
+        :param args: Positional arguments that are passed to the client's method.
+        :param kwargs: Extra arguments that are passed to the client's method.
+        :returns: The response object.
+        """
+
+        client_method = getattr(self.async_client, method)
+        samples = []
+
+        start = default_timer()
+        response = await client_method(*args, **kwargs)
+        samples.append((default_timer() - start) * 1000)
+
+        for _ in range(self.get_latency_repeat(operation, method)):
+            start = default_timer()
+            await client_method(*args, **kwargs)
+            samples.append((default_timer() - start) * 1000)
+
+        self.check_response_budgets(operation, response, samples)
+
+        return response
+
+    async def gather_requests(self, operation, count, **kwargs):
+        """Send simultaneous requests of an operation using ``asyncio.gather()``.
+
+        :param operation: Name of the operation, e.g. ``'list'``.
+        :param count: Number of requests to send.
+        :param kwargs: Extra arguments that are passed to the operation's ``aget_*_response()`` method.
+        :returns: A tuple ``responses, throughput`` of the list of responses and the number of requests per second.
+        """
+
+        get_response = getattr(self, 'aget_%s_response' % operation)
+
+        start = default_timer()
+        responses = await asyncio.gather(*[get_response(**kwargs) for _ in range(count)])
+        elapsed = default_timer() - start
+
+        return responses, count / elapsed
+
+    async def assert_concurrent_requests(self, operation, count, status_code=status.HTTP_200_OK, min_throughput=None,
+                                         **kwargs):
+        """Send simultaneous requests of an operation and verify all of them succeeded.
+
+        .. admonition:: example
+
+            .. code:: python
+
+                class EntryAsyncAPITestCase(AsyncReadRESTAPITestCaseMixin, BaseRESTAPITestCase):
+
+                    async def test_concurrent_detail(self):
+                        await self.assert_concurrent_requests('detail', 50, min_throughput=200)
+
+        :param operation: Name of the operation, e.g. ``'list'``.
+        :param count: Number of requests to send.
+        :param status_code: The expected status code of all the responses. Defaults to ``200``.
+        :param min_throughput: The minimum number of requests per second, or ``None`` for no minimum.
+        :param kwargs: Extra arguments that are passed to the operation's ``aget_*_response()`` method.
+        :returns: A tuple ``responses, throughput`` of the list of responses and the number of requests per second.
+        """
+
+        responses, throughput = await self.gather_requests(operation, count, **kwargs)
+
+        for response in responses:
+            self.assertEqual(response.status_code, status_code, response.content)
+
+        if min_throughput is not None:
+            self.assertGreaterEqual(throughput, min_throughput, '%d concurrent %s requests ran at %.1f requests/s' % (
+                count, operation, throughput))
+
+        return responses, throughput
+
+
+class AsyncListAPITestCaseMixin(AsyncAPITestCaseMixin, ListAPITestCaseMixin):
+
+    """Adds an async list view test to the test case."""
+
+    async def aget_list_response(self, **kwargs):
+        """Send the list request using the async client and return the response.
+
+        :param kwargs: Extra arguments that are passed to the client's ``get()`` call.
+        :returns: The response object.
+        """
+
+        return await self.async_send_request('list', 'get', self.get_list_url(), **kwargs)
+
+    async def test_list(self, **kwargs):
+        """Send request to the list view endpoint, verify and return the response.
+
+        :param kwargs: Extra arguments that are passed to the client's ``get()`` call.
+        :returns: The view's response.
+        """
+
+        if self.list_seed_count:
+            await sync_to_async(self.create_list_objects, thread_sensitive=True)(self.list_seed_count)
+
+        response = await self.aget_list_response(**kwargs)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+
+        results = _get_data(response)
+
+        if self.pagination_results_field:
+            self.assertIn(self.pagination_results_field, results)
+            results = results[self.pagination_results_field]
+
+        self.assertTrue(len(results) >= 1)
+
+        return response
+
+
+class AsyncDetailAPITestCaseMixin(AsyncAPITestCaseMixin, DetailAPITestCaseMixin):
+
+    """Adds an async detail view test to the test case."""
+
+    async def aget_detail_response(self, **kwargs):
+        """Send the detail request using the async client and return the response.
+
+        :param kwargs: Extra arguments that are passed to the client's ``get()`` call.
+        :returns: The response object.
+        """
+
+        return await self.async_send_request('detail', 'get', self.get_detail_url(), **kwargs)
+
+    async def test_detail(self, **kwargs):
+        """Send request to the detail view endpoint, verify and return the response.
+
+        :param kwargs: Extra arguments that are passed to the client's ``get()`` call.
+        :returns: The view's response.
+        """
+
+        response = await self.aget_detail_response(**kwargs)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+        self._check_attributes(_get_data(response))
+
+        return response
+
+
+class AsyncCreateAPITestCaseMixin(AsyncAPITestCaseMixin, CreateAPITestCaseMixin):
+
+    """Adds an async create view test to the test case."""
+
+    async def aget_create_response(self, data=None, **kwargs):
+        """Send the create request using the async client and return the response.
+
+        The data is sent JSON encoded.
+
+        :param data: A dictionary of the data to use for the create request.
+        :param kwargs: Extra arguments that are passed to the client's ``post()`` call.
+        :returns: The response object.
+        """
+
+        if data is None:
+            data = self.get_create_data()
+        self.__data = data
+
+        kwargs.setdefault('content_type', 'application/json')
+
+        return await self.async_send_request('create', 'post', self.get_create_url(), data or {}, **kwargs)
+
+    async def test_create(self, data=None, **kwargs):
+        """Send request to the create view endpoint, verify and return the response.
+
+        Also verifies that the object actually exists in the database.
+
+        :param data: A dictionary of the data to use for the create request.
+        :param kwargs: Extra arguments that are passed to the client's ``post()`` call.
+        :returns: A tuple ``response, created`` of the view's response the created instance.
+        """
+
+        response = await self.aget_create_response(data, **kwargs)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.content)
+
+        queryset = self.get_db_queryset(self.__data or ())
+        lookup = {self.lookup_field: self.get_lookup_from_response(_get_data(response))}
+        created = await sync_to_async(queryset.get, thread_sensitive=True)(**lookup)
+
+        return response, created
+
+
+class AsyncUpdateAPITestCaseMixin(AsyncAPITestCaseMixin, UpdateAPITestCaseMixin):
+
+    """Adds an async update view test to the test case."""
+
+    async def aget_update_response(self, data=None, use_patch=None, **kwargs):
+        """Send the update request using the async client and return the response.
+
+        The data is sent JSON encoded.
+
+        :param data: Data dictionary for the update request.
+        :param use_patch: Whether to send a PATCH request instead of PUT. Defaults to ``use_patch``.
+        :param kwargs: Extra arguments that are passed to the client's ``put()`` or ``patch()`` call.
+        :returns: The response object.
+        """
+
+        if data is None:
+            data = self.get_update_data()
+
+        if use_patch is None:
+            use_patch = self.use_patch
+
+        kwargs.setdefault('content_type', 'application/json')
+
+        return await self.async_send_request('update', 'patch' if use_patch else 'put',
+                                             self.get_update_url(), data, **kwargs)
+
+    async def test_update(self, data=None, results=None, use_patch=None, **kwargs):
+        """Send request to the update view endpoint, verify and return the response.
+
+        :param data: Data dictionary for the update request.
+        :param results: Dictionary mapping instance properties to expected values.
+        :param kwargs: Extra arguments that are passed to the client's ``put()`` or ``patch()`` call.
+        :returns: A tuple ``response, updated`` of the view's response the updated instance.
+        """
+
+        if data is None:
+            data = self.get_update_data()
+
+        if results is None:
+            results = self.get_update_results(data)
+
+        response = await self.aget_update_response(data, use_patch, **kwargs)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+
+        def check_db():
+            updated = self.get_db_queryset(data).get(**{self.lookup_field: self.object_id})
+            self._update_check_db(updated, data, results or {})
+            return updated
+
+        updated = await sync_to_async(check_db, thread_sensitive=True)()
+
+        return response, updated
+
+
+class AsyncDestroyAPITestCaseMixin(AsyncAPITestCaseMixin, DestroyAPITestCaseMixin):
+
+    """Adds an async destroy view test to the test case."""
+
+    async def aget_destroy_response(self, **kwargs):
+        """Send the destroy request using the async client and return the response.
+
+        :param kwargs: Extra arguments that are passed to the client's ``delete()`` call.
+        :returns: The response object.
+        """
+
+        return await self.async_send_request('destroy', 'delete', self.get_destroy_url(), **kwargs)
+
+    async def test_destroy(self, **kwargs):
+        """Send request to the destroy view endpoint, verify and return the response.
+
+        Also verifies the object does not exist anymore in the database.
+
+        :param kwargs: Extra arguments that are passed to the client's ``delete()`` call.
+        :returns: The view's response.
+        """
+
+        response = await self.aget_destroy_response(**kwargs)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT, response.content)
+
+        get = sync_to_async(self.object.__class__.objects.get, thread_sensitive=True)
+        with self.assertRaises(ObjectDoesNotExist):
+            await get(**{self.lookup_field: self.object_id})
+
+        return response
+
+
+class AsyncReadRESTAPITestCaseMixin(AsyncListAPITestCaseMixin, AsyncDetailAPITestCaseMixin):
+
+    """Adds the async read CRUD operations tests to the test case.
+
+    Includes: :class:`AsyncListAPITestCaseMixin`, :class:`AsyncDetailAPITestCaseMixin`.
+    """
+
+    pass
+
+
+class AsyncWriteRESTAPITestCaseMixin(AsyncCreateAPITestCaseMixin, AsyncUpdateAPITestCaseMixin,
+                                     AsyncDestroyAPITestCaseMixin):
+
+    """Adds the async write CRUD operations tests to the test case.
+
+    Includes: :class:`AsyncCreateAPITestCaseMixin`, :class:`AsyncUpdateAPITestCaseMixin`,
+    :class:`AsyncDestroyAPITestCaseMixin`.
+    """
+
+    pass
+
+
+class AsyncReadWriteRESTAPITestCaseMixin(AsyncReadRESTAPITestCaseMixin, AsyncWriteRESTAPITestCaseMixin):
+
+    """A complete async API test case that covers all successful CRUD operation requests.
+
+    Includes: :class:`AsyncReadRESTAPITestCaseMixin`, :class:`AsyncWriteRESTAPITestCaseMixin`.
+    """
+
+    pass
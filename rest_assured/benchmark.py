@@ -0,0 +1,157 @@
+import json
+import os
+from timeit import default_timer
+
+import six
+
+from rest_assured.utils import summarize
+
+
+def load_baseline(path):
+    """Load a benchmark baseline file.
+
+    :param path: Path of the JSON baseline file.
+    :returns: Dictionary mapping benchmark names to their statistics, empty if the file does not exist.
+    """
+
+    if not os.path.exists(path):
+        return {}
+
+    with open(path) as baseline:
+        return json.load(baseline)
+
+
+def save_baseline(path, results):
+    """Merge the given results into a benchmark baseline file.
+
+    :param path: Path of the JSON baseline file.
+    :param results: Dictionary mapping benchmark names to their statistics.
+    """
+
+    baseline = load_baseline(path)
+    baseline.update(results)
+
+    with open(path, 'w') as output:
+        json.dump(baseline, output, indent=2, sort_keys=True)
+
+
+class BenchmarkAPITestCaseMixin(object):
+
+    """Adds a benchmark test that reuses the endpoint definitions of the test case.
+
+    Each of the CRUD operations supported by the test case is sent ``benchmark_warmup`` times
+    without being measured, and then ``benchmark_iterations`` times while timing it.
+
+    Run the tests with the ``REST_ASSURED_BENCHMARK_SAVE`` environment variable set to save the results
+    as the new baseline, and without it to compare against the saved baseline.
+
+    .. admonition:: example
+
+        .. code:: python
+
+            class EntryBenchmark(BenchmarkAPITestCaseMixin, ReadWriteRESTAPITestCaseMixin, BaseRESTAPITestCase):
+
+                base_name = 'entry'
+                factory_class = factories.Entry
+                create_data = {'headline': 'A new entry'}
+                update_data = {'headline': 'An updated entry'}
+                benchmark_baseline = 'benchmarks.json'
+    """
+
+    #: Operations to benchmark. Defaults to all the operations supported by the test case.
+    benchmark_operations = None
+    #: Number of requests to send before measuring. Defaults to ``5``.
+    benchmark_warmup = 5
+    #: Number of measured requests. Defaults to ``50``.
+    benchmark_iterations = 50
+    #: Path of the JSON baseline file. Defaults to the ``REST_ASSURED_BENCHMARK_BASELINE`` environment variable.
+    benchmark_baseline = None
+    #: The allowed slowdown of the mean duration relative to the baseline. Defaults to ``0.2``, i.e. 20%.
+    benchmark_threshold = 0.2
+
+    def get_benchmark_operations(self):
+        """Return the names of the operations to benchmark.
+
+        By default gets the ``benchmark_operations`` attribute of this class,
+        or all the operations that have a ``get_<operation>_response()`` method.
+
+        :returns: A list of operation names.
+        """
+
+        if self.benchmark_operations is not None:
+            return list(self.benchmark_operations)
+
+        return [operation for operation in ('list', 'detail', 'create', 'update', 'destroy')
+                if hasattr(self, 'get_%s_response' % operation)]
+
+    def get_benchmark_name(self, operation):
+        """Return the name of the benchmark in the baseline file.
+
+        :param operation: Name of the operation, e.g. ``'list'``.
+        :returns: The benchmark's name.
+        """
+
+        return '%s.%s' % (self.base_name, operation)
+
+    def benchmark(self, operation):
+        """Benchmark a single operation and return its statistics.
+
+        Durations are measured in milliseconds. For ``destroy`` a new object is created, without being measured,
+        before each request. For ``create`` every request gets its data from ``get_create_data()``,
+        so override it to return fresh values for unique fields.
+
+        :param operation: Name of the operation, e.g. ``'list'``.
+        :returns: Dictionary of statistics as returned by :func:`rest_assured.utils.summarize`.
+        """
+
+        get_response = getattr(self, 'get_%s_response' % operation)
+        samples = []
+
+        for iteration in range(self.benchmark_warmup + self.benchmark_iterations):
+            if operation == 'destroy':
+                self.object = self.get_object(self.get_factory_class())
+
+            start = default_timer()
+            response = get_response()
+            duration = (default_timer() - start) * 1000
+
+            self.assertLess(response.status_code, 400, getattr(response, 'data', response))
+
+            if iteration >= self.benchmark_warmup:
+                samples.append(duration)
+
+        return summarize(samples)
+
+    def test_benchmark(self):
+        """Benchmark all the operations and compare them against the baseline, or save them as the new baseline.
+
+        :returns: Dictionary mapping benchmark names to their statistics.
+        """
+
+        results = {}
+        for operation in self.get_benchmark_operations():
+            results[self.get_benchmark_name(operation)] = self.benchmark(operation)
+
+        path = self.benchmark_baseline or os.environ.get('REST_ASSURED_BENCHMARK_BASELINE')
+        if not path:
+            return results
+
+        if os.environ.get('REST_ASSURED_BENCHMARK_SAVE'):
+            save_baseline(path, results)
+            return results
+
+        baseline = load_baseline(path)
+        regressions = []
+        for name, stats in sorted(six.iteritems(results)):
+            if name not in baseline:
+                continue
+
+            limit = baseline[name]['mean'] * (1 + self.benchmark_threshold)
+            if stats['mean'] > limit:
+                regressions.append('%s: mean %.2fms, baseline %.2fms' % (name, stats['mean'], baseline[name]['mean']))
+
+        if regressions:
+            self.fail('Benchmarks regressed by more than %d%%:\n%s' % (
+                self.benchmark_threshold * 100, '\n'.join(regressions)))
+
+        return results
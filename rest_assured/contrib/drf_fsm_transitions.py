@@ -1,4 +1,11 @@
-from rest_framework.reverse import reverse
+from collections import OrderedDict
+from timeit import default_timer
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_assured.load import LiveServerClient
+from rest_assured.utils import run_concurrently
 
 
 class TransitionAPITestCaseMixin(object):
@@ -9,6 +16,18 @@ class TransitionAPITestCaseMixin(object):
     the DRF-FSM-Transition library.
     """
 
+    #: Name of the instance's attribute that holds the state, used when walking the transition graph.
+    #: Defaults to ``'status'``.
+    transition_attribute = 'status'
+    #: Names of transitions to skip when walking the transition graph, e.g. ones with conditions. Defaults to ``()``.
+    transition_exclude = ()
+    #: Dictionary mapping transition names to the data of their requests when walking the transition graph.
+    #: Defaults to ``None``.
+    transition_data = None
+    #: List of the measurements of the last walk of the transition graph, a dictionary per transition request with
+    #: the ``transition`` name, its ``source`` and ``target`` states, ``latency`` in milliseconds and ``queries``.
+    transition_stats = None
+
     def transition(self, result, route, attribute='status', from_state=None, data=None):
 
         """Send request to a transition view endpoint, verify and return the response.
@@ -23,10 +42,219 @@ class TransitionAPITestCaseMixin(object):
         if from_state is not None:
             self.object.__class__.objects.filter(pk=self.object.pk).update(**{attribute: from_state})
 
-        updateview = reverse(self.base_name + self.DETAIL_SUFFIX,
-                             args=(self.object.pk,)) + '%s/' % route
-        response = self.client.post(updateview, data)
+        response = self.send_request('transition', 'post', self.get_transition_url(route), data)
 
         self.assertEqual(response.data[attribute], result)
 
         return response
+
+    def get_transition_url(self, route):
+        """Return the url of a transition view endpoint of the main object.
+
+        :param route: The addition to the route, usually the name of the transition action's name.
+        :returns: The url.
+        """
+
+        return self.reverse_url(self.base_name + self.DETAIL_SUFFIX, self.object.pk) + '%s/' % route
+
+    def race_transitions(self, routes, attribute='status', from_state=None, data=None, live_server_url=None):
+        """Send transition requests of the main object simultaneously from several threads, and verify exactly one won.
+
+        Each route is sent from its own thread, so repeat a route to race it against itself, or pass conflicting
+        routes to race them against each other. The threads are released together once all of them are ready.
+        Verifies that exactly one request succeeded and that the state in the database is the one it responded with.
+
+        :Note: The requests are sent using :func:`rest_assured.utils.run_concurrently`, whose threads only see
+            the main object, and only contend on its locks, once it is committed. See there for setting up
+            the test case.
+
+        .. admonition:: example
+
+            .. code:: python
+
+                class OrderAPITestCase(TransitionAPITestCaseMixin, BaseRESTAPITestCase):
+
+                    base_name = 'order'
+                    factory_class = factories.Order
+
+
+                class OrderRaceTestCase(TransactionTestCase):
+
+                    def test_double_payment(self):
+                        case = OrderAPITestCase('run')
+                        case.client = case.client_class()
+                        case.setUp()
+                        case.race_transitions(['pay'] * 4, from_state='new')
+
+        :param routes: The routes of the transitions to send, one per thread.
+        :param attribute: Name of the instance's attribute that holds the state.
+        :param from_state: A state to update the object to, to initialize the "from" state.
+        :param data: Dictionary mapping routes to the data of their requests.
+        :param live_server_url: Url of a live server to send the requests to instead of using the test client.
+        :returns: A tuple ``winner, responses`` of the successful response and the list of all the responses,
+            in the order of ``routes``.
+        """
+
+        if from_state is not None:
+            self.object.__class__.objects.filter(pk=self.object.pk).update(**{attribute: from_state})
+
+        routes = list(routes)
+        data = data or {}
+        get_client = (lambda: LiveServerClient(live_server_url)) if live_server_url else None
+        requests = [lambda clone, route=route: clone.send_request(
+            'transition', 'post', clone.get_transition_url(route), data.get(route)) for route in routes]
+
+        results, elapsed = run_concurrently(self, requests, get_client)
+        responses = [response for response, latency in results]
+
+        errors = [(route, response) for route, response in zip(routes, responses) if isinstance(response, Exception)]
+        if errors:
+            self.fail('Transition requests raised:\n%s' % '\n'.join('%s: %r' % error for error in errors))
+
+        winners = [(route, response) for route, response in zip(routes, responses) if response.status_code < 400]
+        self.assertEqual(len(winners), 1, 'Expected exactly one transition to succeed, got: %s' % ', '.join(
+            '%s (%d)' % (route, response.status_code) for route, response in zip(routes, responses)))
+
+        route, winner = winners[0]
+        state = getattr(self.object.__class__.objects.get(pk=self.object.pk), attribute)
+        self.assertEqual(state, winner.data[attribute], 'Final state is not the one %s responded with' % route)
+
+        return winner, responses
+
+    def get_transition_graph(self, attribute=None):
+        """Return the transition graph of the main object's state field, as defined by django-fsm.
+
+        Wildcard sources, ``'*'`` and ``'+'``, are expanded to the states of the field's choices and of all the
+        other transitions. Transitions with dynamic targets, ``RETURN_VALUE`` and ``GET_STATE``, and the ones in
+        ``transition_exclude``, are left out.
+
+        :param attribute: Name of the instance's attribute that holds the state. Defaults to ``transition_attribute``.
+        :returns: An ordered dictionary mapping each state to a list of ``(transition name, target state)`` tuples.
+        """
+
+        model = self.object.__class__
+        field = model._meta.get_field(attribute or self.transition_attribute)
+
+        transitions = []
+        for transition in field.get_all_transitions(model):
+            # dynamic targets are resolved by django-fsm's ``State`` objects
+            if transition.name in self.transition_exclude or hasattr(transition.target, 'get_state'):
+                continue
+            transitions.append(transition)
+
+        states = [choice[0] for choice in field.flatchoices]
+        for transition in transitions:
+            for state in (transition.source, transition.target):
+                if state not in ('*', '+') and state is not None and state not in states:
+                    states.append(state)
+
+        graph = OrderedDict((state, []) for state in states)
+        for transition in transitions:
+            if transition.source == '*':
+                sources = states
+            elif transition.source == '+':
+                sources = [state for state in states if state != transition.target]
+            else:
+                sources = [transition.source]
+
+            for source in sources:
+                # a transition without a target leaves the state as is
+                target = source if transition.target is None else transition.target
+                graph[source].append((transition.name, target))
+
+        return graph
+
+    def get_transition_paths(self, attribute=None, initial=None):
+        """Return paths through the transition graph that cover every transition reachable from the initial state.
+
+        Each path follows untaken transitions for as long as it can, so the number of paths, and of state resets
+        between them, is kept low.
+
+        :param attribute: Name of the instance's attribute that holds the state. Defaults to ``transition_attribute``.
+        :param initial: The state to walk the graph from. Defaults to the main object's current state.
+        :returns: A list of ``(source state, [(transition name, target state), ...])`` tuples.
+        """
+
+        attribute = attribute or self.transition_attribute
+        graph = self.get_transition_graph(attribute)
+        if initial is None:
+            initial = getattr(self.object, attribute)
+
+        reachable, stack = [initial], [initial]
+        while stack:
+            for name, target in graph.get(stack.pop(), ()):
+                if target not in reachable:
+                    reachable.append(target)
+                    stack.append(target)
+
+        remaining = [(source, name, target) for source in reachable for name, target in graph.get(source, ())]
+
+        paths = []
+        while remaining:
+            # start from the initial state while it has untaken transitions, then from wherever they are left
+            start = initial if any(source == initial for source, name, target in remaining) else remaining[0][0]
+            path, state = [], start
+
+            while True:
+                edge = next((edge for edge in remaining if edge[0] == state), None)
+                if edge is None:
+                    break
+                remaining.remove(edge)
+                path.append(edge[1:])
+                state = edge[2]
+
+            paths.append((start, path))
+
+        return paths
+
+    def walk_transitions(self, attribute=None, initial=None):
+        """Send requests for every transition reachable from the initial state, verify and measure them.
+
+        The main object is reused for all the paths returned by :meth:`get_transition_paths`,
+        and reset to the first state of each path with a single ``update()`` query.
+        The data of each request is taken from ``transition_data``.
+
+        .. admonition:: example
+
+            .. code:: python
+
+                class OrderAPITestCase(TransitionAPITestCaseMixin, BaseRESTAPITestCase):
+
+                    base_name = 'order'
+                    factory_class = factories.Order
+                    transition_exclude = ['refund']
+                    transition_data = {'ship': {'carrier': 'ups'}}
+
+                    def test_transitions(self):
+                        for stats in self.walk_transitions():
+                            self.assertLessEqual(stats['queries'], 6, stats['transition'])
+
+        :param attribute: Name of the instance's attribute that holds the state. Defaults to ``transition_attribute``.
+        :param initial: The state to walk the graph from. Defaults to the main object's current state.
+        :returns: The ``transition_stats`` of the walk.
+        """
+
+        attribute = attribute or self.transition_attribute
+        data = self.transition_data or {}
+        queryset = self.object.__class__.objects.filter(pk=self.object.pk)
+        self.transition_stats = []
+
+        for source, path in self.get_transition_paths(attribute, initial):
+            queryset.update(**{attribute: source})
+
+            for name, target in path:
+                with CaptureQueriesContext(connection) as context:
+                    start = default_timer()
+                    self.transition(target, name, attribute, data=data.get(name))
+                    latency = (default_timer() - start) * 1000
+
+                self.transition_stats.append({
+                    'transition': name,
+                    'source': source,
+                    'target': target,
+                    'latency': latency,
+                    'queries': len(context.captured_queries),
+                })
+                source = target
+
+        return self.transition_stats
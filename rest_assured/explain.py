@@ -0,0 +1,97 @@
+import re
+
+#: Statement prefixes for getting the query plan of a statement, by database vendor.
+EXPLAIN_PREFIXES = {
+    'sqlite': 'EXPLAIN QUERY PLAN ',
+    'postgresql': 'EXPLAIN ',
+    'mysql': 'EXPLAIN ',
+}
+
+_SQLITE_SCAN = re.compile(r'^SCAN (?:TABLE )?"?(\w+)"?(?:\s+AS\s+\w+)?(.*)$')
+_SQLITE_SEARCH = re.compile(r'^SEARCH (?:TABLE )?"?(\w+)"?')
+_SQLITE_INDEX_SCAN = re.compile(r'^\s*USING (?:COVERING )?INDEX\b')
+_SQLITE_SORT = re.compile(r'USE TEMP B-TREE FOR (?:RIGHT PART OF )?ORDER BY')
+# subqueries and CTEs, whose results are scanned by their alias or by a generated name, e.g. ``SUBQUERY 1``
+_SQLITE_SUBQUERY = re.compile(r'^(?:CO-ROUTINE|MATERIALIZE)\s+(.+?)\s*$')
+_SQLITE_SUBQUERY_SCAN = re.compile(r'^SCAN (?:SUBQUERY \d+|subquery_\d+|\(subquery-\d+\))')
+_POSTGRESQL_SCAN = re.compile(r'Seq Scan on "?(\w+)"?')
+_POSTGRESQL_SORT = re.compile(r'^\s*(?:->\s*)?Sort\s+\(')
+
+
+def explain(connection, sql, params=None):
+    """Return the query plan of a statement.
+
+    :param connection: The database connection to run the statement's ``EXPLAIN`` on.
+    :param sql: The SQL of the statement, with placeholders.
+    :param params: The parameters of the statement.
+    :returns: A list of the plan's rows, as dictionaries mapping column names to values.
+    :raises NotImplementedError: If explaining statements is not supported for the database vendor.
+    """
+
+    if connection.vendor not in EXPLAIN_PREFIXES:
+        raise NotImplementedError('Explaining statements is not supported for %s.' % connection.vendor)
+
+    with connection.cursor() as cursor:
+        cursor.execute(EXPLAIN_PREFIXES[connection.vendor] + sql, params or ())
+        columns = [column[0] for column in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def find_plan_problems(vendor, plan, filtered=False):
+    """Find full table scans and sorts that do not use an index in a query plan.
+
+    :param vendor: The database vendor, e.g. ``'sqlite'``.
+    :param plan: The rows of the query plan, as returned by :func:`explain`.
+    :param filtered: Whether the statement filters its rows, e.g. with a ``WHERE`` clause. SQLite scans of an index
+        are only accepted for statements that don't, where they read the rows in the order of the index,
+        since for filtered statements they read the whole index.
+    :returns: A list of ``(kind, table, detail)`` tuples, where ``kind`` is either ``'scan'`` or ``'filesort'``,
+        and ``table`` is the scanned table, or the first table of the plan for sorts.
+    """
+
+    problems = []
+    tables = []
+    subqueries = set()
+
+    if vendor == 'sqlite':
+        for row in plan:
+            subquery = _SQLITE_SUBQUERY.match(row['detail'])
+            if subquery:
+                subqueries.add(subquery.group(1))
+
+    for row in plan:
+        if vendor == 'sqlite':
+            detail = row['detail']
+            scan = _SQLITE_SCAN.match(detail)
+            # the results of a subquery are not a table, the scans of its own tables are listed separately
+            if scan and (scan.group(1) in subqueries or _SQLITE_SUBQUERY_SCAN.match(detail)):
+                scan = None
+            search = scan or _SQLITE_SEARCH.match(detail)
+            table = search.group(1) if search else None
+            if scan and (filtered or not _SQLITE_INDEX_SCAN.match(scan.group(2))):
+                problems.append(('scan', table, detail))
+            if _SQLITE_SORT.search(detail):
+                problems.append(('filesort', tables[0] if tables else None, detail))
+        elif vendor == 'postgresql':
+            detail = list(row.values())[0]
+            scan = _POSTGRESQL_SCAN.search(detail)
+            table = scan.group(1) if scan else None
+            if scan:
+                problems.append(('scan', table, detail.strip()))
+            if _POSTGRESQL_SORT.match(detail):
+                problems.append(('filesort', tables[0] if tables else None, detail.strip()))
+        elif vendor == 'mysql':
+            table = row.get('table')
+            detail = ', '.join('%s=%s' % (key, value) for key, value in sorted(row.items()) if value is not None)
+            if row.get('type') == 'ALL':
+                problems.append(('scan', table, detail))
+            if 'Using filesort' in (row.get('Extra') or ''):
+                problems.append(('filesort', table, detail))
+        else:
+            table = None
+
+        if table and table not in tables:
+            tables.append(table)
+
+    # the sorted table is only known once all the rows are read, for plans that list the sort first
+    return [(kind, table or (tables[0] if tables else None), detail) for kind, table, detail in problems]
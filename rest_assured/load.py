@@ -0,0 +1,199 @@
+import json
+import threading
+import time
+from collections import Counter
+from timeit import default_timer
+
+import six
+from django.db import connections
+from six.moves import queue
+from six.moves.urllib.error import HTTPError
+from six.moves.urllib.parse import urljoin, urlencode
+from six.moves.urllib.request import Request, urlopen
+
+from rest_assured.utils import clone_case, histogram, summarize
+
+#: Upper bounds in milliseconds of the latency histogram buckets.
+LATENCY_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+
+class LiveServerResponse(object):
+
+    """The response of a :class:`LiveServerClient` request."""
+
+    def __init__(self, status_code, content, headers):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+
+    @property
+    def data(self):
+        return json.loads(self.content.decode('utf-8')) if self.content else None
+
+
+class LiveServerClient(object):
+
+    """A minimal client with the interface of the test client, that sends requests over HTTP to a live server.
+
+    Data is sent JSON encoded. Since requests go over the network, ``force_authenticate()`` is not supported,
+    so pass any authentication headers in ``headers``.
+    """
+
+    def __init__(self, base_url, headers=None):
+        self.base_url = base_url
+        self.headers = headers or {}
+
+    def get(self, path, data=None, **kwargs):
+        if data:
+            path += ('&' if '?' in path else '?') + urlencode(data, doseq=True)
+        return self.request('GET', path)
+
+    def post(self, path, data=None, **kwargs):
+        return self.request('POST', path, data)
+
+    def put(self, path, data=None, **kwargs):
+        return self.request('PUT', path, data)
+
+    def patch(self, path, data=None, **kwargs):
+        return self.request('PATCH', path, data)
+
+    def delete(self, path, data=None, **kwargs):
+        return self.request('DELETE', path, data)
+
+    def request(self, method, path, data=None):
+        headers = dict(self.headers, Accept='application/json')
+        body = None
+
+        if data is not None:
+            body = json.dumps(data).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+
+        request = Request(urljoin(self.base_url, path), data=body, headers=headers)
+        request.get_method = lambda: method
+
+        try:
+            response = urlopen(request)
+        except HTTPError as error:
+            response = error
+
+        return LiveServerResponse(response.getcode(), response.read(), dict(response.info().items()))
+
+
+class LoadRunner(object):
+
+    """Generates load on the endpoints of a test case by sending its ``get_*_response()`` requests concurrently.
+
+    Each worker thread sends requests through its own copy of the test case and client,
+    either the in-process test client or a :class:`LiveServerClient` when ``live_server_url`` is given.
+
+    :Note: Worker threads use their own database connections, so the test case should be a ``TransactionTestCase``
+        or a ``LiveServerTestCase``, for the workers to see the objects created in ``setUp()``.
+
+    .. admonition:: example
+
+        .. code:: python
+
+            class EntryLoadTestCase(ReadWriteRESTAPITestCaseMixin, BaseRESTAPITestCase, TransactionTestCase):
+
+                base_name = 'entry'
+                factory_class = factories.Entry
+
+                def test_load(self):
+                    report = LoadRunner(self, operations=['list', 'detail'], concurrency=8, requests=200).run()
+                    self.assertEqual(report['list']['errors'], 0)
+
+    :param case: The test case instance, after ``setUp()``.
+    :param operations: Names of the operations to send. Defaults to ``('list', 'detail')``.
+    :param concurrency: Number of worker threads. Defaults to ``4``.
+    :param requests: Number of requests to send per operation. Defaults to ``100``.
+    :param rate: Total number of requests per second to send, or ``None`` for as fast as possible.
+    :param live_server_url: Url of a live server to send the requests to instead of using the test client.
+    """
+
+    def __init__(self, case, operations=('list', 'detail'), concurrency=4, requests=100, rate=None,
+                 live_server_url=None):
+        self.case = case
+        self.operations = list(operations)
+        self.concurrency = concurrency
+        self.requests = requests
+        self.rate = rate
+        self.live_server_url = live_server_url
+
+    def get_client(self):
+        """Return a new client for a worker thread.
+
+        :returns: A :class:`LiveServerClient` if ``live_server_url`` is set, otherwise ``None`` for the test client.
+        """
+
+        if self.live_server_url:
+            return LiveServerClient(self.live_server_url)
+
+    def run(self):
+        """Send all the requests and return the report.
+
+        :returns: Dictionary mapping each operation to a dictionary with ``requests``, ``errors``, ``error_rate``,
+            ``error_types`` counting the errors by status code, e.g. ``'HTTP 404'``, or by the ``repr()`` of the
+            raised exception, ``throughput`` in requests per second, ``latency`` statistics in milliseconds,
+            and a latency ``histogram`` of ``(bound, count)`` tuples.
+        """
+
+        jobs = queue.Queue()
+        # interleave the operations so they are all under load at the same time
+        for index in range(self.requests * len(self.operations)):
+            jobs.put((index, self.operations[index % len(self.operations)]))
+
+        results = dict((operation, []) for operation in self.operations)
+        lock = threading.Lock()
+        start = default_timer()
+
+        def worker():
+            clone = clone_case(self.case, self.get_client())
+            try:
+                while True:
+                    try:
+                        index, operation = jobs.get_nowait()
+                    except queue.Empty:
+                        return
+
+                    if self.rate:
+                        delay = start + index / float(self.rate) - default_timer()
+                        if delay > 0:
+                            time.sleep(delay)
+
+                    request_start = default_timer()
+                    try:
+                        response = getattr(clone, 'get_%s_response' % operation)()
+                        error = 'HTTP %d' % response.status_code if response.status_code >= 400 else None
+                    except Exception as exception:
+                        error = repr(exception)
+                    duration = (default_timer() - request_start) * 1000
+
+                    with lock:
+                        results[operation].append((duration, error))
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=worker) for _ in range(self.concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        elapsed = default_timer() - start
+
+        report = {}
+        for operation, samples in six.iteritems(results):
+            durations = [duration for duration, error in samples]
+            error_types = Counter(error for duration, error in samples if error)
+            errors = sum(error_types.values())
+            report[operation] = {
+                'requests': len(samples),
+                'errors': errors,
+                'error_types': dict(error_types),
+                'error_rate': errors / float(len(samples)) if samples else 0.0,
+                'throughput': len(samples) / elapsed,
+                'latency': summarize(durations) if durations else None,
+                'histogram': histogram(durations, LATENCY_BUCKETS),
+            }
+
+        return report
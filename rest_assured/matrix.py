@@ -0,0 +1,222 @@
+import re
+import unittest
+
+from rest_framework import mixins
+
+from rest_assured.testcases import (BaseRESTAPITestCase, CreateAPITestCaseMixin, DestroyAPITestCaseMixin,
+                                    DetailAPITestCaseMixin, ListAPITestCaseMixin, UpdateAPITestCaseMixin)
+
+# maps DRF's viewset mixins to the operation they provide and the test case mixin that covers it
+OPERATIONS = (
+    (mixins.ListModelMixin, 'list', ListAPITestCaseMixin),
+    (mixins.RetrieveModelMixin, 'detail', DetailAPITestCaseMixin),
+    (mixins.CreateModelMixin, 'create', CreateAPITestCaseMixin),
+    (mixins.UpdateModelMixin, 'update', UpdateAPITestCaseMixin),
+    (mixins.DestroyModelMixin, 'destroy', DestroyAPITestCaseMixin),
+)
+# attributes an operation requires on the test case to be generated
+REQUIRED_ATTRIBUTES = {
+    'create': 'create_data',
+    'update': 'update_data',
+}
+
+
+class FactoryRegistry(object):
+
+    """Pairs viewsets with the factories, and any other test case attributes, for generating their test cases.
+
+    Viewsets are looked up by their route's base name, then by the viewset class, then by the model of its queryset.
+
+    .. admonition:: example
+
+        .. code:: python
+
+            registry = FactoryRegistry()
+            registry.register(models.Entry, factories.Entry, create_data={'headline': 'Lucifer Sam'})
+            registry.register('author', factories.Author, user_factory=factories.User)
+    """
+
+    def __init__(self):
+        self._entries = {}
+
+    def register(self, key, factory_class, **attributes):
+        """Register a factory class and test case attributes.
+
+        :param key: A route base name, a viewset class or a model class.
+        :param factory_class: The factory class to use for creating the main object of the test case.
+        :param attributes: Extra attributes of the test case, e.g. ``create_data``.
+        """
+
+        self._entries[key] = dict(attributes, factory_class=factory_class)
+
+    def get(self, base_name, viewset):
+        """Return the attributes registered for a route.
+
+        :param base_name: The route's base name.
+        :param viewset: The route's viewset class.
+        :returns: Dictionary of test case attributes, including ``factory_class``, or ``None`` if not registered.
+        """
+
+        queryset = getattr(viewset, 'queryset', None)
+        model = getattr(queryset, 'model', None)
+
+        for key in (base_name, viewset, model):
+            if key is not None and key in self._entries:
+                return self._entries[key]
+
+
+class TestMatrix(object):
+
+    """Generates CRUD test cases for all the viewsets of a DRF router that have a registered factory.
+
+    Test case classes are only constructed when they are first accessed, so building the matrix of
+    a large project is cheap.
+
+    With pytest, the matrix can be emitted as parametrization, which lets pytest-xdist distribute the tests by endpoint:
+
+    .. admonition:: example
+
+        .. code:: python
+
+            matrix = TestMatrix(urls.router, registry, module=__name__)
+
+
+            @pytest.mark.django_db
+            @pytest.mark.parametrize('base_name,operation', matrix.params(), ids=matrix.ids())
+            def test_endpoint(base_name, operation):
+                matrix.run(base_name, operation)
+
+    And for Django's test runner, add the test case classes to the test module:
+
+    .. admonition:: example
+
+        .. code:: python
+
+            TestMatrix(urls.router, registry, module=__name__).contribute_to(globals())
+
+    :param router: The DRF router whose registry to walk.
+    :param registry: A :class:`FactoryRegistry`.
+    :param module: The module name of the test case classes, which also locates their snapshots,
+        usually the ``__name__`` of the test module.
+    :param base_class: The test case base class. Defaults to :class:`rest_assured.testcases.BaseRESTAPITestCase`.
+    """
+
+    # not a test class itself
+    __test__ = False
+
+    def __init__(self, router, registry, module, base_class=BaseRESTAPITestCase):
+        self.router = router
+        self.registry = registry
+        self.module = module
+        self.base_class = base_class
+        self._test_cases = {}
+
+    def endpoints(self):
+        """Return the routes that have registered attributes.
+
+        :returns: A list of ``(base_name, viewset, attributes)`` tuples.
+        """
+
+        endpoints = []
+        for prefix, viewset, base_name in self.router.registry:
+            attributes = self.registry.get(base_name, viewset)
+            if attributes is not None:
+                endpoints.append((base_name, viewset, attributes))
+
+        return endpoints
+
+    def get_operations(self, viewset, attributes):
+        """Return the operations a viewset supports and that can be tested with the given attributes.
+
+        :param viewset: The viewset class.
+        :param attributes: Dictionary of the test case attributes.
+        :returns: A list of ``(operation, test case mixin)`` tuples.
+        """
+
+        operations = []
+        for viewset_mixin, operation, mixin in OPERATIONS:
+            required = REQUIRED_ATTRIBUTES.get(operation)
+            if issubclass(viewset, viewset_mixin) and (required is None or attributes.get(required) is not None):
+                operations.append((operation, mixin))
+
+        return operations
+
+    def params(self):
+        """Return the matrix as a list of ``(base_name, operation)`` tuples, e.g. for ``pytest.mark.parametrize``.
+
+        :returns: The list of parameters.
+        """
+
+        return [(base_name, operation)
+                for base_name, viewset, attributes in self.endpoints()
+                for operation, mixin in self.get_operations(viewset, attributes)]
+
+    def ids(self):
+        """Return the ids of the parameters returned by :meth:`params`.
+
+        :returns: A list of ``'<base_name>-<operation>'`` strings.
+        """
+
+        return ['%s-%s' % param for param in self.params()]
+
+    def get_test_case(self, base_name):
+        """Return the test case class of a route, constructing it on first access.
+
+        :param base_name: The route's base name.
+        :returns: The test case class.
+        """
+
+        if base_name not in self._test_cases:
+            for name, viewset, attributes in self.endpoints():
+                if name == base_name:
+                    break
+            else:
+                raise KeyError(base_name)
+
+            bases = tuple(mixin for operation, mixin in self.get_operations(viewset, attributes))
+            class_attributes = dict(attributes, base_name=base_name, __module__=self.module)
+            self._test_cases[base_name] = type(self.get_class_name(base_name), bases + (self.base_class,),
+                                               class_attributes)
+
+        return self._test_cases[base_name]
+
+    def get_class_name(self, base_name):
+        """Return the name of the test case class of a route.
+
+        :param base_name: The route's base name.
+        :returns: The class name, e.g. ``'RelatedStuffAPITestCase'`` for ``'related-stuff'``.
+        """
+
+        return ''.join(part.capitalize() for part in re.split(r'[^a-zA-Z0-9]+', base_name)) + 'APITestCase'
+
+    def run(self, base_name, operation):
+        """Run a single generated test, raising ``AssertionError`` if it fails.
+
+        :param base_name: The route's base name.
+        :param operation: Name of the operation, e.g. ``'list'``.
+        """
+
+        result = unittest.TestResult()
+        test = self.get_test_case(base_name)('test_%s' % operation)
+        # running through a suite takes care of the class level setup, e.g. ``setUpTestData()``
+        unittest.TestSuite([test]).run(result)
+
+        problems = result.errors + result.failures
+        if problems:
+            raise AssertionError('\n'.join(traceback for test, traceback in problems))
+
+        if result.skipped:
+            raise unittest.SkipTest(result.skipped[0][1])
+
+    def contribute_to(self, namespace):
+        """Construct all the test case classes and add them to a namespace, e.g. a test module's ``globals()``.
+
+        The classes are moved to the namespace's module, if it has a ``__name__``.
+
+        :param namespace: A dictionary to add the classes to by their names.
+        """
+
+        for base_name, viewset, attributes in self.endpoints():
+            test_case = self.get_test_case(base_name)
+            test_case.__module__ = namespace.get('__name__', test_case.__module__)
+            namespace[test_case.__name__] = test_case
@@ -0,0 +1,108 @@
+import cProfile
+import glob
+import os
+import pstats
+import sys
+from contextlib import contextmanager
+
+from six import StringIO
+
+try:
+    import pyinstrument
+except ImportError:
+    pyinstrument = None
+
+#: File extensions of the profiles written by each of the supported profilers.
+EXTENSIONS = {
+    'cprofile': '.prof',
+    'pyinstrument': '.html',
+}
+
+
+@contextmanager
+def profile(path, profiler='cprofile'):
+    """Context manager that profiles the code inside it and writes the profile to a file.
+
+    :param path: Path of the profile file, without an extension.
+    :param profiler: The profiler to use, ``'cprofile'`` or ``'pyinstrument'``, which requires the pyinstrument package.
+    """
+
+    if profiler not in EXTENSIONS:
+        raise ValueError('Unknown profiler: %s' % profiler)
+
+    if profiler == 'pyinstrument' and pyinstrument is None:
+        raise ImportError('Profiling with pyinstrument requires the pyinstrument package.')
+
+    directory = os.path.dirname(path)
+    if directory and not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    # keep profiles of repeated requests of the same test and operation
+    filename = path + EXTENSIONS[profiler]
+    index = 1
+    while os.path.exists(filename):
+        filename = '%s.%d%s' % (path, index, EXTENSIONS[profiler])
+        index += 1
+
+    if profiler == 'pyinstrument':
+        profiler = pyinstrument.Profiler()
+        profiler.start()
+        try:
+            yield
+        finally:
+            profiler.stop()
+            with open(filename, 'w') as output:
+                output.write(profiler.output_html())
+    else:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            profiler.dump_stats(filename)
+
+
+def aggregate_profiles(directory, limit=30, sort='cumulative'):
+    """Return a report of the hottest functions across all the cProfile profiles in a directory.
+
+    :param directory: The directory of the profile files.
+    :param limit: Number of functions to report. Defaults to ``30``.
+    :param sort: The ``pstats`` sort key. Defaults to ``'cumulative'``.
+    :returns: The report as a string, or ``None`` if there are no profiles.
+    """
+
+    paths = sorted(glob.glob(os.path.join(directory, '*' + EXTENSIONS['cprofile'])))
+    if not paths:
+        return None
+
+    output = StringIO()
+    stats = pstats.Stats(paths[0], stream=output)
+    for path in paths[1:]:
+        stats.add(path)
+
+    output.write('Aggregated %d profiles from %s\n' % (len(paths), directory))
+    stats.sort_stats(sort).print_stats(limit)
+
+    return output.getvalue()
+
+
+def main(argv=None):
+    """Print the aggregate report of a profiles directory: ``python -m rest_assured.profiling <directory> [limit]``."""
+
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        sys.stderr.write('usage: python -m rest_assured.profiling <directory> [limit]\n')
+        return 2
+
+    report = aggregate_profiles(argv[0], *[int(arg) for arg in argv[1:2]])
+    if report is None:
+        sys.stderr.write('No profiles found in %s\n' % argv[0])
+        return 1
+
+    sys.stdout.write(report)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
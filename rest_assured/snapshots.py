@@ -0,0 +1,149 @@
+import atexit
+import hashlib
+import json
+import os
+
+import six
+from six import text_type
+
+#: The value masked fields are replaced with.
+MASKED = '<masked>'
+
+
+def normalize(data, mask=()):
+    """Return a JSON serializable copy of response data, with the values of masked fields replaced.
+
+    :param data: The response data.
+    :param mask: Names of fields to mask at any depth, e.g. volatile fields like timestamps.
+    :returns: The normalized data.
+    """
+
+    if isinstance(data, dict):
+        return dict((text_type(key), MASKED if key in mask else normalize(value, mask))
+                    for key, value in six.iteritems(data))
+
+    if isinstance(data, (list, tuple)):
+        return [normalize(item, mask) for item in data]
+
+    if data is None or isinstance(data, (bool, float) + six.integer_types + six.string_types):
+        return data
+
+    return text_type(data)
+
+
+def dumps(data):
+    """Serialize normalized data in a canonical form.
+
+    :param data: The normalized data.
+    :returns: The JSON string.
+    """
+
+    return json.dumps(data, sort_keys=True, separators=(',', ':'))
+
+
+def content_hash(data):
+    """Return the hash of normalized data.
+
+    :param data: The normalized data.
+    :returns: The hex digest of the SHA-256 hash of the data's canonical form.
+    """
+
+    return hashlib.sha256(dumps(data).encode('utf-8')).hexdigest()
+
+
+class SnapshotStore(object):
+
+    """A content-addressed store of snapshots in a single JSON file.
+
+    The file holds an index mapping snapshot names to content hashes, and the contents by their hashes,
+    so identical snapshots are stored once. Changes are kept in memory until :meth:`save` is called.
+
+    :param path: Path of the store's file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.index = {}
+        self.objects = {}
+        #: Whether the store has changes that are not saved to its file yet.
+        self.changed = False
+
+        if os.path.exists(path):
+            with open(path) as store:
+                content = json.load(store)
+            self.index = content['index']
+            self.objects = content['objects']
+
+    def get(self, name):
+        """Return a stored snapshot.
+
+        :param name: Name of the snapshot.
+        :returns: A tuple ``(hash, data)``, or ``None`` if there is no such snapshot.
+        """
+
+        if name not in self.index:
+            return None
+
+        digest = self.index[name]
+        return digest, self.objects[digest]
+
+    def set(self, name, data):
+        """Store a snapshot, without saving the store's file.
+
+        :param name: Name of the snapshot.
+        :param data: The normalized data.
+        :returns: The content hash of the data.
+        """
+
+        digest = content_hash(data)
+        self.index[name] = digest
+        self.objects[digest] = data
+        # drop contents no snapshot refers to anymore
+        referenced = set(self.index.values())
+        self.objects = dict((key, value) for key, value in six.iteritems(self.objects) if key in referenced)
+        self.changed = True
+
+        return digest
+
+    def save(self):
+        """Write the store to its file."""
+
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        with open(self.path, 'w') as store:
+            json.dump({'index': self.index, 'objects': self.objects}, store, indent=1, sort_keys=True)
+
+        self.changed = False
+
+
+_stores = {}
+
+
+def get_store(path):
+    """Return the snapshot store of a file, loading it only once per process.
+
+    :param path: Path of the store's file.
+    :returns: A :class:`SnapshotStore`.
+    """
+
+    path = os.path.abspath(path)
+    if path not in _stores:
+        _stores[path] = SnapshotStore(path)
+
+    return _stores[path]
+
+
+def save_stores():
+    """Write the changed snapshot stores to their files.
+
+    Called after each test case class, and when the process exits.
+    """
+
+    for store in _stores.values():
+        if store.changed:
+            store.save()
+
+
+atexit.register(save_stores)
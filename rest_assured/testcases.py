@@ -1,10 +1,201 @@
-from django.db.models import Manager
-from django.core.exceptions import ObjectDoesNotExist
+import copy
+import csv
+import difflib
+import gzip
+import itertools
+import json
+import os
+import re
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from functools import partial
+from io import BytesIO
+from timeit import default_timer
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Manager, Model
+from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist
+from django.core.signals import setting_changed
+from django.http import Http404
+from django.test.utils import CaptureQueriesContext
+from django.urls import NoReverseMatch, Resolver404, get_resolver, get_script_prefix, get_urlconf, resolve
 import six
 from rest_framework import status
+from rest_framework.permissions import SAFE_METHODS
 from rest_framework.reverse import reverse
 from rest_framework.test import APITestCase
 from six import text_type
+from six.moves.urllib.parse import quote
+
+from rest_assured import explain, profiling, snapshots
+from rest_assured.load import LiveServerClient
+from rest_assured.utils import (append_report, clone_case, get_worker_id, run_concurrently, summarize,
+                                worker_unique)
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def _normalize_sql(sql):
+    # replace literals with placeholders so statements that differ only by their parameters compare equal
+    sql = re.sub(r"'(?:[^']|'')*'", '?', sql)
+    return re.sub(r'\b\d+(?:\.\d+)?\b', '?', sql)
+
+
+def _repeated_statements(small, large):
+    # the statements that ran more times in the ``large`` list of captured queries than in the ``small`` one
+    small = Counter(_normalize_sql(query['sql']) for query in small)
+    large = Counter(_normalize_sql(query['sql']) for query in large)
+    return ['%d -> %d: %s' % (small[sql], count, sql) for sql, count in six.iteritems(large) if count > small[sql]]
+
+
+def _gzip_size(content):
+    buffer = BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode='wb') as compressed:
+        compressed.write(content)
+    return len(buffer.getvalue())
+
+
+def _can_bulk_create(obj):
+    # ``bulk_create()`` only works for concrete models without multi-table inheritance,
+    # whose required relations are already saved
+    if not isinstance(obj, Model) or obj._meta.parents:
+        return False
+
+    return all(getattr(obj, field.attname) is not None
+               for field in obj._meta.concrete_fields if field.is_relation and not field.null)
+
+
+@contextmanager
+def _time_queries(times):
+    # appends the duration in seconds of every query executed inside, more precisely than the debug cursor
+    if not hasattr(connection, 'execute_wrapper'):
+        # Django < 2.0, where the debug cursor's times are rounded to milliseconds, so they are not measured
+        with CaptureQueriesContext(connection) as context:
+            yield
+        times.extend(None for _ in context.captured_queries)
+        return
+
+    def execute(execute, sql, params, many, context):
+        start = default_timer()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            times.append(default_timer() - start)
+
+    with connection.execute_wrapper(execute):
+        yield
+
+
+def _can_explain():
+    # the captured statements are explained, which requires ``execute_wrapper()`` of Django 2.0
+    return hasattr(connection, 'execute_wrapper') and connection.vendor in explain.EXPLAIN_PREFIXES
+
+
+@contextmanager
+def _capture_statements(statements):
+    # appends the ``(sql, params)`` of every statement executed inside, for running them again
+    def execute(execute, sql, params, many, context):
+        statements.append((sql, params))
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(execute):
+        yield
+
+
+def _create_objects(factory, count, bulk=True):
+    if bulk and count and hasattr(factory, 'build'):
+        first = factory.build()
+        # checked on a single object, so nothing more is built when falling back to ``create()``
+        if _can_bulk_create(first):
+            objects = [first] + [factory.build() for _ in range(count - 1)]
+            return first.__class__._default_manager.bulk_create(objects)
+
+    return [factory.create() for _ in range(count)]
+
+
+# placeholders for building detail url templates, one that matches the default DRF lookup regex and one for numeric ids
+_LOOKUP_MARKERS = ('restassuredlookup', '9081726354')
+# characters Django's ``reverse()`` leaves unquoted in url arguments
+_URL_SAFE_CHARS = "!$&'()*+,;=/~:@"
+# resolved urls and detail url templates with their patterns, keyed by the urlconf, script prefix and view name
+_url_cache = {}
+
+
+def _clear_url_cache(setting, **kwargs):
+    if setting == 'ROOT_URLCONF':
+        _url_cache.clear()
+
+
+setting_changed.connect(_clear_url_cache)
+
+
+# primary keys given to unsaved in memory objects
+_in_memory_pks = itertools.count(1)
+# peaks of the ``assert_max_memory()`` blocks of each thread, kept across the ``reset_peak()`` of nested blocks
+_memory_peaks = threading.local()
+_missing = object()
+
+
+def _record_memory_peak():
+    # raises the recorded peaks of the enclosing blocks to the current peak, before it is reset or read
+    peak = tracemalloc.get_traced_memory()[1]
+    peaks = _memory_peaks.__dict__.setdefault('peaks', [])
+    peaks[:] = [max(recorded, peak) for recorded in peaks]
+    return peaks
+
+
+def _restore_attribute(cls, name, original):
+    if original is _missing:
+        delattr(cls, name)
+    else:
+        setattr(cls, name, original)
+
+
+def _get_url_patterns(view_name):
+    resolver = get_resolver(get_urlconf())
+    path = view_name.split(':')
+    name = path.pop()
+    prefix = ''
+
+    for namespace in path:
+        if namespace not in resolver.namespace_dict and namespace in resolver.app_dict:
+            namespace = resolver.app_dict[namespace][0]
+        namespace_prefix, resolver = resolver.namespace_dict[namespace]
+        prefix += namespace_prefix
+
+    return [re.compile('^%s%s' % (re.escape(get_script_prefix()), prefix + possibility[1]))
+            for possibility in resolver.reverse_dict.getlist(name)]
+
+
+def _get_url_template(view_name):
+    for marker in _LOOKUP_MARKERS:
+        try:
+            url = reverse(view_name, args=[marker])
+        except NoReverseMatch:
+            continue
+
+        if url.count(marker) != 1:
+            continue
+
+        # the patterns the url could be reversed from, for validating lookup values like ``reverse()`` does
+        try:
+            patterns = [pattern for pattern in _get_url_patterns(view_name) if pattern.search(url)]
+        except KeyError:
+            return None
+
+        if patterns:
+            return tuple(url.split(marker)), patterns
 
 
 class BaseRESTAPITestCase(APITestCase):
@@ -27,6 +218,72 @@ class BaseRESTAPITestCase(APITestCase):
     object = None
     #: The user instance created if the ``user_factory`` is set and used. Defaults to ``None``.
     user = None
+    #: Whether to create the main object and user once per class in ``setUpTestData()`` instead of before every test.
+    #: Tests are isolated by the transaction rollback of Django's ``TestCase``. Defaults to ``False``.
+    class_fixtures = False
+    #: Dictionary mapping operation names, e.g. ``'list'``, ``'detail'``, ``'create'``, ``'update'`` and ``'destroy'``,
+    #: to the maximum number of queries a single request to that endpoint may execute. Defaults to ``None``.
+    max_queries = None
+    #: Dictionary mapping operation names to latency budgets in milliseconds, which are checked against the 95th
+    #: percentile. A value may also be a dictionary of percentiles, e.g. ``{'p50': 20, 'p95': 50}``. Defaults to ``None``.
+    latency_budget_ms = None
+    #: Number of times to send a safe request, e.g. ``GET``, when checking its latency budget. Defaults to ``10``.
+    latency_repeat = 10
+    #: Path of a JSON lines file to append latency measurements to.
+    #: Defaults to the ``REST_ASSURED_LATENCY_REPORT`` environment variable.
+    latency_report = None
+    #: Dictionary mapping operation names to the maximum memory in kilobytes a single request to that endpoint
+    #: may allocate at its peak. Requires ``tracemalloc``. Defaults to ``None``.
+    max_memory_kb = None
+    #: Whether to track the memory allocations of all requests, even without a ``max_memory_kb`` limit.
+    #: Defaults to ``False``.
+    track_memory = False
+    #: Number of top allocation sites to report for each request. Defaults to ``10``.
+    memory_top_sites = 10
+    #: Dictionary mapping operation names to the memory allocation stats of their last tracked request.
+    memory_stats = None
+    #: Dictionary mapping operation names to the maximum size in bytes of the response content.
+    #: A value may also be a dictionary of limits per encoding, e.g. ``{'raw': 8192, 'gzip': 2048}``,
+    #: where ``'br'`` requires the ``brotli`` package. Defaults to ``None``.
+    max_payload_bytes = None
+    #: Whether to measure the payload sizes of all responses, even without a ``max_payload_bytes`` limit.
+    #: Defaults to ``False``.
+    measure_payload = False
+    #: Dictionary mapping operation names to the payload sizes of their last measured response.
+    payload_sizes = None
+    #: Names of fields in the create and update data whose values are namespaced by the id of the worker process
+    #: when running tests in parallel, to keep unique values from colliding across workers. Defaults to ``()``.
+    worker_unique_fields = ()
+    #: Whether to compare the full response data of the list and detail tests against stored snapshots.
+    #: Set the ``REST_ASSURED_UPDATE_SNAPSHOTS`` environment variable to record missing snapshots and regenerate
+    #: all the others. Defaults to ``False``.
+    use_snapshots = False
+    #: Directory of the snapshot files, one file per test case class. Defaults to the ``REST_ASSURED_SNAPSHOT_DIR``
+    #: environment variable, or a ``snapshots`` directory next to the test case's module.
+    snapshot_dir = None
+    #: Names of volatile fields, e.g. ids or timestamps, whose values are masked at any depth before comparing
+    #: snapshots. Defaults to ``()``.
+    snapshot_mask = ()
+    #: Names of the caching headers the list and detail responses must have, e.g. ``('ETag', 'Cache-Control')``.
+    #: Defaults to ``()``.
+    cache_headers = ()
+    #: Whether to verify that the list and detail endpoints respond to conditional requests, using the response's
+    #: ``ETag`` or ``Last-Modified`` validator, with a ``304 Not Modified`` and an empty body. Defaults to ``False``.
+    check_conditional_get = False
+    #: Directory to write a profile of every request to, one file per test and operation, named after the
+    #: ``base_name``, the operation and the test. Defaults to the ``REST_ASSURED_PROFILE_DIR`` environment variable,
+    #: profiling is disabled if neither is set.
+    profile_dir = None
+    #: The profiler to use, ``'cprofile'`` or ``'pyinstrument'``, which requires the ``pyinstrument`` package.
+    #: Defaults to the ``REST_ASSURED_PROFILER`` environment variable, or ``'cprofile'``.
+    profiler = None
+    #: Whether to build the main object in memory using the factory's ``build()``, without saving it, and serve it
+    #: from the views of ``base_name`` without hitting the database. Only suits read tests, e.g. of serializers.
+    #: Defaults to ``False``.
+    in_memory = False
+
+    _class_user = None
+    _class_object = None
 
     def get_factory_class(self):
         """Return the factory class for generating the main object (or model instance) of this test case.
@@ -44,11 +301,535 @@ class BaseRESTAPITestCase(APITestCase):
         By default this calls the ``create()`` method of the factory class, assuming
         a Django Model or a factory_boy's Factory.
 
+        If ``in_memory`` is set, the factory's ``build()`` method is called instead, when it has one,
+        and an unsaved model instance is given a primary key.
+
         :param factory: The factory class used for creating
         :returns: The main object of this test case.
         """
 
-        return factory.create()
+        if not self.in_memory:
+            return factory.create()
+
+        obj = factory.build() if hasattr(factory, 'build') else factory.create()
+        if isinstance(obj, Model) and obj.pk is None:
+            obj.pk = next(_in_memory_pks)
+
+        return obj
+
+    def refresh_object(self, obj):
+        """Return a fresh copy of the class level main object for the current test.
+
+        Only used when ``class_fixtures`` is set. By default this returns a deep copy of the object,
+        which is cheap and does not hit the database, since the database itself is restored by the
+        transaction rollback at the end of each test.
+        Override it to call ``refresh_from_db()`` if you need the database state instead.
+
+        :param obj: The main object created in ``setUpTestData()``.
+        :returns: The main object for the current test.
+        """
+
+        return copy.deepcopy(obj)
+
+    @classmethod
+    def setUpTestData(cls):
+        """Generates the main object and user instance once for the whole class if ``class_fixtures`` is set."""
+
+        super(BaseRESTAPITestCase, cls).setUpTestData()
+
+        if cls.class_fixtures:
+            # a bare instance, only used for calling the instance level fixture hooks
+            instance = cls.__new__(cls)
+            cls._class_user = instance.create_user()
+            cls._class_object = instance.get_object(instance.get_factory_class())
+
+    @classmethod
+    def tearDownClass(cls):
+        """Writes the snapshots stored by the tests of the class to their files."""
+
+        super(BaseRESTAPITestCase, cls).tearDownClass()
+        snapshots.save_stores()
+
+    def create_user(self):
+        """Create and return the user instance using the ``user_factory`` attribute.
+
+        :returns: The user instance, or ``None`` if ``user_factory`` is not set.
+        """
+
+        user_factory = getattr(self, 'user_factory')
+        if user_factory:
+            return user_factory.create()
+
+    def reverse_url(self, view_name, lookup=None):
+        """Return the url of the given view, optionally for a lookup value of a detail route.
+
+        Urls are resolved once and cached per urlconf. Detail urls are built from a cached template and the lookup
+        value, falling back to ``reverse()`` for routes a template can't be built for, and for lookup values that
+        don't match the route's pattern.
+        The cache is cleared whenever ``ROOT_URLCONF`` is overridden.
+
+        :param view_name: Name of the url pattern.
+        :param lookup: The lookup value for a detail route. Defaults to ``None``.
+        :returns: The url.
+        """
+
+        key = (get_urlconf() or settings.ROOT_URLCONF, get_script_prefix(), view_name, lookup is not None)
+
+        if key not in _url_cache:
+            _url_cache[key] = reverse(view_name) if lookup is None else _get_url_template(view_name)
+
+        if lookup is None:
+            return _url_cache[key]
+
+        lookup = text_type(lookup)
+        if _url_cache[key] is None:
+            return reverse(view_name, args=[lookup])
+
+        template, patterns = _url_cache[key]
+        if not any(pattern.search(lookup.join(template)) for pattern in patterns):
+            # let ``reverse()`` raise ``NoReverseMatch``, or handle lookups only some of the routes accept
+            return reverse(view_name, args=[lookup])
+
+        return quote(lookup.encode('utf-8'), safe=_URL_SAFE_CHARS).join(template)
+
+    @property
+    def worker_id(self):
+        """The id of the worker process when running tests in parallel, or ``None``.
+
+        See :func:`rest_assured.utils.get_worker_id`.
+        """
+
+        return get_worker_id()
+
+    def namespace_data(self, data):
+        """Namespace the values of ``worker_unique_fields`` in the data by the id of the worker process.
+
+        :param data: A dictionary of request data.
+        :returns: A copy of the data with the namespaced values, or the data itself if there's nothing to namespace.
+        """
+
+        fields = [field for field in self.worker_unique_fields if field in (data or {})]
+        if not fields or self.worker_id is None:
+            return data
+
+        data = dict(data)
+        for field in fields:
+            data[field] = worker_unique(data[field])
+
+        return data
+
+    def get_db_queryset(self, fields=()):
+        """Return a queryset of the main object's model for fetching instances from the database to verify them.
+
+        Relations among ``fields`` are fetched along with the instance, using ``select_related()`` for single
+        related objects and ``prefetch_related()`` for multiple ones, so verifying them requires no further queries.
+
+        :param fields: Names of the fields that are going to be verified.
+        :returns: The queryset.
+        """
+
+        model = self.object.__class__
+        queryset = model.objects.all()
+        select, prefetch = [], []
+
+        for name in fields:
+            try:
+                field = model._meta.get_field(name)
+            except FieldDoesNotExist:
+                continue
+
+            if field.many_to_many or field.one_to_many:
+                prefetch.append(name)
+            elif field.one_to_one or (field.many_to_one and field.concrete):
+                select.append(name)
+
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+
+        return queryset
+
+    def get_snapshot_path(self):
+        """Return the path of the snapshot file of this test case class.
+
+        :returns: The path, ``<snapshot_dir>/<module>.<class name>.json``.
+        """
+
+        directory = self.snapshot_dir or os.environ.get('REST_ASSURED_SNAPSHOT_DIR')
+        if not directory:
+            module = sys.modules[type(self).__module__]
+            directory = os.path.join(os.path.dirname(os.path.abspath(module.__file__)), 'snapshots')
+
+        return os.path.join(directory, '%s.%s.json' % (type(self).__module__, type(self).__name__))
+
+    def assert_snapshot(self, operation, data):
+        """Verify that the normalized response data matches the stored snapshot.
+
+        If the ``REST_ASSURED_UPDATE_SNAPSHOTS`` environment variable is set, the snapshot is stored instead,
+        otherwise a missing snapshot fails the test. On mismatch the failure message shows a diff of the data.
+        Stored snapshots are written to their file after the test case class.
+
+        :param operation: Name of the operation, e.g. ``'detail'``.
+        :param data: The response data.
+        """
+
+        store = snapshots.get_store(self.get_snapshot_path())
+        name = '%s.%s' % (self._testMethodName, operation)
+        normalized = snapshots.normalize(data, self.snapshot_mask)
+        stored = store.get(name)
+
+        if os.environ.get('REST_ASSURED_UPDATE_SNAPSHOTS'):
+            store.set(name, normalized)
+            return
+
+        if stored is None:
+            self.fail('Snapshot %s of %s does not exist. Set the REST_ASSURED_UPDATE_SNAPSHOTS environment variable '
+                      'to record it.' % (name, operation))
+
+        digest, expected = stored
+        if snapshots.content_hash(normalized) != digest:
+            diff = difflib.unified_diff(json.dumps(expected, indent=1, sort_keys=True).splitlines(),
+                                        json.dumps(normalized, indent=1, sort_keys=True).splitlines(),
+                                        'snapshot', 'response', lineterm='')
+            self.fail('Response data of %s does not match snapshot %s:\n%s' % (operation, name, '\n'.join(diff)))
+
+    def get_conditional_headers(self, response):
+        """Return the request headers for a conditional request, using the validator of a previous response.
+
+        ``ETag`` is preferred over ``Last-Modified``, since the latter only has a resolution of seconds.
+
+        :param response: The previous response.
+        :returns: Dictionary with either an ``HTTP_IF_NONE_MATCH`` or an ``HTTP_IF_MODIFIED_SINCE`` header,
+            empty if the response has no validator.
+        """
+
+        if response.has_header('ETag'):
+            return {'HTTP_IF_NONE_MATCH': response['ETag']}
+
+        if response.has_header('Last-Modified'):
+            return {'HTTP_IF_MODIFIED_SINCE': response['Last-Modified']}
+
+        return {}
+
+    def check_caching(self, response, get_response):
+        """Verify the caching headers of a response, and that the endpoint responds to conditional requests.
+
+        Checks the response has all the ``cache_headers``, and if ``check_conditional_get`` is set,
+        sends a conditional request and checks for a 304 status code with an empty body.
+
+        :param response: The response to verify.
+        :param get_response: A callable that sends the same request, taking extra headers as keyword arguments.
+        """
+
+        for header in self.cache_headers:
+            self.assertTrue(response.has_header(header), 'Response has no %s header.' % header)
+
+        if not self.check_conditional_get:
+            return
+
+        headers = self.get_conditional_headers(response)
+        self.assertTrue(headers, 'Response has neither an ETag nor a Last-Modified header.')
+
+        not_modified = get_response(**headers)
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(not_modified.content, b'')
+
+    def get_max_queries(self, operation):
+        """Return the maximum number of queries allowed for a request of the given operation.
+
+        By default gets the value for ``operation`` from the ``max_queries`` attribute of this class.
+
+        :param operation: Name of the operation, e.g. ``'list'``.
+        :returns: The maximum number of queries, or ``None`` for no limit.
+        """
+
+        return (getattr(self, 'max_queries') or {}).get(operation)
+
+    @contextmanager
+    def assert_max_queries(self, operation):
+        """Context manager that fails the test if the queries executed inside it exceed the operation's budget.
+
+        The failure message lists all the captured SQL statements.
+
+        :param operation: Name of the operation, e.g. ``'list'``.
+        """
+
+        limit = self.get_max_queries(operation)
+        if limit is None:
+            yield
+            return
+
+        with CaptureQueriesContext(connection) as context:
+            yield
+
+        executed = len(context)
+        if executed > limit:
+            self.fail('%d queries executed by %s request, budget is %d:\n%s' % (
+                executed, operation, limit,
+                '\n'.join('%d. %s' % (i, query['sql']) for i, query in enumerate(context.captured_queries, start=1))
+            ))
+
+    def get_max_memory(self, operation):
+        """Return the maximum memory in kilobytes allowed to be allocated by a request of the given operation.
+
+        By default gets the value for ``operation`` from the ``max_memory_kb`` attribute of this class.
+
+        :param operation: Name of the operation, e.g. ``'list'``.
+        :returns: The maximum memory in kilobytes, or ``None`` for no limit.
+        """
+
+        return (getattr(self, 'max_memory_kb') or {}).get(operation)
+
+    @contextmanager
+    def assert_max_memory(self, operation):
+        """Context manager that tracks the memory allocated inside it and fails the test if it exceeds the limit.
+
+        The peak allocated bytes and the top allocation sites are stored in ``memory_stats`` under ``operation``,
+        and the failure message lists the top allocation sites.
+
+        :Note: When ``tracemalloc`` is already tracing, the peak can only be measured with
+            ``tracemalloc.reset_peak()`` of Python 3.9 and later. Otherwise it is stored as ``None``,
+            and a test with a limit is skipped.
+
+        :param operation: Name of the operation, e.g. ``'list'``.
+        """
+
+        limit = self.get_max_memory(operation)
+        if limit is None and not self.track_memory:
+            yield
+            return
+
+        if tracemalloc is None:
+            self.skipTest('Tracking memory requires tracemalloc.')
+
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+
+        # the snapshot allocates memory itself, so reset the peak after taking it
+        before = tracemalloc.take_snapshot()
+        baseline = tracemalloc.get_traced_memory()[0]
+        has_peak = started or hasattr(tracemalloc, 'reset_peak')
+        if not started and has_peak:
+            _record_memory_peak()
+            tracemalloc.reset_peak()
+
+        peaks = _record_memory_peak()
+        peaks.append(0)
+        try:
+            yield
+            _record_memory_peak()
+            peak = peaks[-1] - baseline if has_peak else None
+            after = tracemalloc.take_snapshot()
+        finally:
+            peaks.pop()
+            if started:
+                tracemalloc.stop()
+
+        top = after.compare_to(before, 'lineno')[:self.memory_top_sites]
+
+        if self.memory_stats is None:
+            self.memory_stats = {}
+        self.memory_stats[operation] = {'peak': peak, 'top': [text_type(stat) for stat in top]}
+
+        if limit is not None and peak is None:
+            self.skipTest('Checking the peak memory while tracemalloc is already tracing requires '
+                          'tracemalloc.reset_peak().')
+
+        if limit is not None and peak > limit * 1024:
+            self.fail('%s request allocated %.1fKB at its peak, limit is %sKB. Top allocation sites:\n%s' % (
+                operation, peak / 1024.0, limit, '\n'.join(self.memory_stats[operation]['top'])))
+
+    def get_profile_path(self, operation):
+        """Return the path of the profile file of a request, without an extension.
+
+        By default the file is in ``profile_dir`` and named ``<base_name>.<operation>.<test case>.<test method>``.
+
+        :param operation: Name of the operation, e.g. ``'list'``.
+        :returns: The path, or ``None`` if profiling is disabled.
+        """
+
+        directory = self.profile_dir or os.environ.get('REST_ASSURED_PROFILE_DIR')
+        if not directory:
+            return None
+
+        return os.path.join(directory, '%s.%s.%s.%s' % (
+            self.base_name, operation, self.__class__.__name__, self._testMethodName))
+
+    @contextmanager
+    def profile_request(self, operation):
+        """Context manager that profiles the code inside it to the file returned by :meth:`get_profile_path`.
+
+        Use :func:`rest_assured.profiling.aggregate_profiles` to report the hottest functions across all the profiles.
+
+        :Note: Profiling slows down the request, so it adds to the first latency sample of the request.
+
+        :param operation: Name of the operation, e.g. ``'list'``.
+        """
+
+        path = self.get_profile_path(operation)
+        if path is None:
+            yield
+            return
+
+        with profiling.profile(path, self.profiler or os.environ.get('REST_ASSURED_PROFILER') or 'cprofile'):
+            yield
+
+    def send_request(self, operation, method, *args, **kwargs):
+        """Send a request using the test client and return the response.
+
+        All the ``get_*_response()`` methods send their requests through here,
+        which makes it a single place to hook into for every request of the test case.
+
+        :param operation: Name of the operation, e.g. ``'list'``.
+        :param method: Name of the client's method to call, e.g. ``'get'``.
+        :param args: Positional arguments that are passed to the client's method.
+        :param kwargs: Extra arguments that are passed to the client's method.
+        :returns: The response object.
+        """
+
+        client_method = getattr(self.client, method)
+        samples = []
+
+        with self.assert_max_queries(operation), self.assert_max_memory(operation), self.profile_request(operation):
+            start = default_timer()
+            response = client_method(*args, **kwargs)
+            samples.append((default_timer() - start) * 1000)
+
+        for _ in range(self.get_latency_repeat(operation, method)):
+            start = default_timer()
+            client_method(*args, **kwargs)
+            samples.append((default_timer() - start) * 1000)
+
+        self.check_response_budgets(operation, response, samples)
+
+        return response
+
+    def get_latency_repeat(self, operation, method):
+        """Return the number of times to send a request again when checking its latency budget.
+
+        Only requests that do not change state, e.g. ``GET``, are repeated.
+
+        :param operation: Name of the operation, e.g. ``'list'``.
+        :param method: Name of the client's method, e.g. ``'get'``.
+        :returns: ``latency_repeat - 1`` for safe requests of an operation with a latency budget, otherwise ``0``.
+        """
+
+        if self.get_latency_budget(operation) is None or method.upper() not in SAFE_METHODS:
+            return 0
+
+        return self.latency_repeat - 1
+
+    def check_response_budgets(self, operation, response, samples):
+        """Verify a response and the durations of its requests against the operation's latency and payload budgets.
+
+        :param operation: Name of the operation, e.g. ``'list'``.
+        :param response: The response object.
+        :param samples: A list of the requests' durations in milliseconds.
+        """
+
+        budget = self.get_latency_budget(operation)
+        if budget is not None:
+            self.check_latency(operation, samples, budget)
+
+        self.check_payload(operation, response)
+
+    def get_max_payload(self, operation):
+        """Return the maximum payload size in bytes allowed for a response of the given operation.
+
+        By default gets the value for ``operation`` from the ``max_payload_bytes`` attribute of this class.
+
+        :param operation: Name of the operation, e.g. ``'list'``.
+        :returns: The limit, a dictionary of limits per encoding, or ``None`` for no limit.
+        """
+
+        return (getattr(self, 'max_payload_bytes') or {}).get(operation)
+
+    def get_payload_sizes(self, content):
+        """Return the sizes of the given response content, raw and compressed.
+
+        :param content: The response content.
+        :returns: Dictionary mapping ``'raw'``, ``'gzip'`` and, if the ``brotli`` package is installed, ``'br'``
+            to the size of the content in bytes.
+        """
+
+        sizes = {'raw': len(content), 'gzip': _gzip_size(content)}
+        if brotli is not None:
+            sizes['br'] = len(brotli.compress(content))
+
+        return sizes
+
+    def check_payload(self, operation, response):
+        """Measure the payload sizes of a response and verify them against the operation's limit.
+
+        The sizes are stored in ``payload_sizes`` under ``operation``. Streaming responses are not measured.
+
+        :param operation: Name of the operation, e.g. ``'list'``.
+        :param response: The response object.
+        :returns: Dictionary of the payload sizes, or ``None`` if they were not measured.
+        """
+
+        limit = self.get_max_payload(operation)
+        if (limit is None and not self.measure_payload) or getattr(response, 'streaming', False):
+            return
+
+        sizes = self.get_payload_sizes(response.content)
+
+        if self.payload_sizes is None:
+            self.payload_sizes = {}
+        self.payload_sizes[operation] = sizes
+
+        if limit is None:
+            return sizes
+
+        if not isinstance(limit, dict):
+            limit = {'raw': limit}
+
+        for encoding, max_size in sorted(six.iteritems(limit)):
+            if encoding not in sizes:
+                self.skipTest('Measuring %s payload size requires the brotli package.' % encoding)
+
+            self.assertLessEqual(sizes[encoding], max_size, '%s payload of %s response is %d bytes, limit is %d bytes' % (
+                encoding, operation, sizes[encoding], max_size))
+
+        return sizes
+
+    def get_latency_budget(self, operation):
+        """Return the latency budget in milliseconds for requests of the given operation.
+
+        By default gets the value for ``operation`` from the ``latency_budget_ms`` attribute of this class.
+
+        :param operation: Name of the operation, e.g. ``'list'``.
+        :returns: The budget, a dictionary of percentile budgets, or ``None`` for no limit.
+        """
+
+        return (getattr(self, 'latency_budget_ms') or {}).get(operation)
+
+    def check_latency(self, operation, samples, budget):
+        """Report the latency statistics of the operation's requests and verify them against the budget.
+
+        :param operation: Name of the operation, e.g. ``'list'``.
+        :param samples: A list of the requests' durations in milliseconds.
+        :param budget: The latency budget in milliseconds for the 95th percentile, or a dictionary of percentile budgets.
+        :returns: Dictionary of the latency statistics.
+        """
+
+        stats = summarize(samples)
+
+        report = self.latency_report or os.environ.get('REST_ASSURED_LATENCY_REPORT')
+        if report:
+            record = dict(stats, test=self.id(), base_name=self.base_name, operation=operation)
+            append_report(report, record)
+
+        if not isinstance(budget, dict):
+            budget = {'p95': budget}
+
+        for key, limit in sorted(six.iteritems(budget)):
+            self.assertLessEqual(stats[key], limit, '%s latency of %s request is %.2fms, budget is %sms' % (
+                key, operation, stats[key], limit))
+
+        return stats
 
     def setUp(self):
         """Generates the main object and user instance if needed.
@@ -56,16 +837,82 @@ class BaseRESTAPITestCase(APITestCase):
         The user instance will be created only if the ``user_factory`` attribute is set to the factory class.
 
         If there is an available user instance, that user will be force authenticated.
+
+        If ``class_fixtures`` is set, the instances created in ``setUpTestData()`` are used instead,
+        so no objects are created per test.
         """
 
-        # create and force authenticate user
-        user_factory = getattr(self, 'user_factory')
-        if user_factory:
-            self.user = user_factory.create()
+        if self.class_fixtures:
+            # accessed through the class to get the original instances created in ``setUpTestData()``
+            self.user = type(self)._class_user
+            self.object = self.refresh_object(type(self)._class_object)
+        else:
+            self.user = self.create_user()
+            # create the object
+            self.object = self.get_object(self.get_factory_class())
+
+        if self.in_memory:
+            self.serve_in_memory()
+
+        # force authenticate user
+        if self.user:
             self.client.force_authenticate(self.user)
 
-        # create the object
-        self.object = self.get_object(self.get_factory_class())
+    def get_view_classes(self):
+        """Return the view classes of the list and detail routes of ``base_name``.
+
+        :returns: A list of the view classes.
+        """
+
+        urls = []
+        for suffix, lookup in ((self.LIST_SUFFIX, None), (self.DETAIL_SUFFIX, getattr(self.object, self.lookup_field))):
+            try:
+                urls.append(self.reverse_url(self.base_name + suffix, lookup))
+            except NoReverseMatch:
+                continue
+
+        classes = []
+        for url in urls:
+            try:
+                view_class = getattr(resolve(url).func, 'cls', None)
+            except Resolver404:
+                continue
+
+            if view_class is not None and view_class not in classes:
+                classes.append(view_class)
+
+        return classes
+
+    def serve_in_memory(self):
+        """Patch the views of ``base_name`` to serve the main object without querying the database.
+
+        The list views serve a list of just the main object, and the detail views serve the main object
+        if the url's lookup matches it, after checking its object permissions, otherwise a 404.
+        The views are restored when the test is cleaned up.
+        """
+
+        obj = self.object
+
+        def get_queryset(view):
+            return [obj]
+
+        def filter_queryset(view, queryset):
+            return queryset
+
+        def get_object(view):
+            lookup_url_kwarg = view.lookup_url_kwarg or view.lookup_field
+            if text_type(view.kwargs.get(lookup_url_kwarg)) != text_type(getattr(obj, view.lookup_field)):
+                raise Http404
+
+            view.check_object_permissions(view.request, obj)
+            return obj
+
+        patches = {'get_queryset': get_queryset, 'filter_queryset': filter_queryset, 'get_object': get_object}
+
+        for view_class in self.get_view_classes():
+            for name, method in six.iteritems(patches):
+                self.addCleanup(_restore_attribute, view_class, name, view_class.__dict__.get(name, _missing))
+                setattr(view_class, name, method)
 
 
 class ListAPITestCaseMixin(object):
@@ -74,6 +921,35 @@ class ListAPITestCaseMixin(object):
 
     #: When using pagination set this attribute to the name of the property in the response data that holds the result set. Defaults to ``None``.
     pagination_results_field = None
+    #: A tuple ``(n, k)`` for checking that the number of queries of the list request does not grow with the
+    #: number of objects, by comparing the queries with ``n`` and then ``k * n`` seeded objects. Defaults to ``None``.
+    list_query_scaling = None
+    #: Number of additional objects to seed before sending the list request.
+    #: When pagination is used all the pages are then fetched and verified. Defaults to ``0``.
+    list_seed_count = 0
+    #: Whether to seed objects using a single ``bulk_create()`` when the factory supports it. Defaults to ``True``.
+    list_seed_bulk = True
+    #: Name of the field that identifies each result, for checking the pages of a list for duplicates.
+    #: Defaults to ``'id'``.
+    list_unique_field = 'id'
+    #: Maximum ratio of the query time of the last page of a list to that of the first page.
+    #: Requires Django 2.0 or later, otherwise it is not checked. Defaults to ``None``.
+    list_page_slowdown = None
+    #: List of the measurements of each page fetched by the last :meth:`check_list_pages`: its ``page`` number,
+    #: ``url``, number of ``results`` and ``queries``, and ``query_time`` and ``latency`` in milliseconds,
+    #: where ``query_time`` is ``None`` before Django 2.0.
+    list_page_stats = None
+    #: Dictionary mapping filter query parameters of the list endpoint to values, for checking that filtering by them
+    #: uses indexes. Defaults to ``None``.
+    list_filter_params = None
+    #: List of values of the ordering query parameter, e.g. ``['name', '-created']``, for checking that ordering by
+    #: them uses indexes. Defaults to ``None``.
+    list_ordering_params = None
+    #: Name of the ordering query parameter. Defaults to ``'ordering'``, as of DRF's ``OrderingFilter``.
+    list_ordering_param = 'ordering'
+    #: Minimum number of rows of a table for a full scan or a sort without an index of it to be flagged.
+    #: Defaults to ``0``.
+    list_scan_threshold = 0
 
     def get_list_url(self):
         """Return the list endpoint url.
@@ -81,7 +957,7 @@ class ListAPITestCaseMixin(object):
         :returns: The url of list endpoint.
         """
 
-        return reverse(self.base_name + self.LIST_SUFFIX)
+        return self.reverse_url(self.base_name + self.LIST_SUFFIX)
 
     def get_list_response(self, **kwargs):
         """Send the list request and return the response.
@@ -90,7 +966,7 @@ class ListAPITestCaseMixin(object):
         :returns: The response object.
         """
 
-        return self.client.get(self.get_list_url(), **kwargs)
+        return self.send_request('list', 'get', self.get_list_url(), **kwargs)
 
     def test_list(self, **kwargs):
         """Send request to the list view endpoint, verify and return the response.
@@ -114,6 +990,9 @@ class ListAPITestCaseMixin(object):
         :returns: The view's response.
         """
 
+        if self.list_seed_count:
+            self.create_list_objects(self.list_seed_count)
+
         response = self.get_list_response(**kwargs)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
@@ -126,8 +1005,405 @@ class ListAPITestCaseMixin(object):
 
         self.assertTrue(len(results) >= 1)
 
+        if self.list_seed_count and self.pagination_results_field:
+            self.check_list_pages(response)
+
+        # not checked where checking indexes isn't supported, instead of skipping the rest of the test
+        if (self.list_filter_params or self.list_ordering_params) and _can_explain():
+            self.check_list_indexes()
+
+        if self.use_snapshots:
+            self.assert_snapshot('list', response.data)
+
+        self.check_caching(response, partial(self.get_list_response, **kwargs))
+
+        if self.list_query_scaling:
+            self.check_list_query_scaling(*self.list_query_scaling, **kwargs)
+
+        return response
+
+    def create_list_objects(self, count):
+        """Create additional objects for the list endpoint.
+
+        If ``list_seed_bulk`` is set and the factory class has a ``build()`` method that returns Django model
+        instances which can be bulk created, e.g. a factory_boy's ``DjangoModelFactory``, all the objects are
+        built and inserted with a single ``bulk_create()``.
+        Otherwise this calls the ``create()`` method of the factory class ``count`` times.
+
+        :Note: Built instances skip anything done on saving, like factory_boy's ``post_generation`` hooks.
+            Bulk created objects only get their primary keys on databases that return them from bulk inserts,
+            e.g. PostgreSQL, but not SQLite before Django 4.0.
+
+        :param count: Number of objects to create.
+        :returns: A list of the created objects.
+        """
+
+        return _create_objects(self.get_factory_class(), count, self.list_seed_bulk)
+
+    def get_list_results(self, response):
+        """Return the result set of a list response.
+
+        :param response: The list view's response.
+        :returns: The results, nested under ``pagination_results_field`` if it is set.
+        """
+
+        if self.pagination_results_field:
+            return response.data[self.pagination_results_field]
+
+        return response.data
+
+    def get_list_expected_count(self, response):
+        """Return the total number of results the pages of a paginated list are expected to have.
+
+        By default gets the ``count`` property of the response, which cursor pagination does not have, and falls back
+        to the number of rows of the main object's model. Override it if the list view filters its results.
+
+        :param response: The response of the first page.
+        :returns: The expected number of results, or ``None`` for not checking it.
+        """
+
+        if 'count' in response.data:
+            return response.data['count']
+
+        if isinstance(self.object, Model):
+            return self.object.__class__._default_manager.count()
+
+    def check_list_pages(self, response=None, **kwargs):
+        """Follow the ``next`` links of a paginated list response and verify the results of all the pages.
+
+        Checks every page has results, that no result appears twice, by its ``list_unique_field``
+        if the results have it, and that the total number of results matches :meth:`get_list_expected_count`, so there are no gaps.
+
+        The query time, number of queries and latency of each fetched page are stored in ``list_page_stats``,
+        which shows whether deep pages get slower, as they do with offset based pagination on large tables,
+        unlike with ``CursorPagination``. If ``list_page_slowdown`` is set, the query time of the last page
+        is checked against that of the first, on Django 2.0 or later.
+
+        .. admonition:: example
+
+            .. code:: python
+
+                class EntryPagesAPITestCase(ListAPITestCaseMixin, BaseRESTAPITestCase):
+
+                    base_name = 'entry'
+                    factory_class = factories.Entry
+                    pagination_results_field = 'results'
+                    list_page_slowdown = 3
+
+                    def test_deep_pages(self):
+                        self.create_list_objects(5000)
+                        self.check_list_pages()
+
+        :param response: The response of the first page. If not given, the first page is fetched and measured too.
+        :param kwargs: Extra arguments that are passed to the client's ``get()`` call of the first page.
+        :returns: A list of all the results.
+        """
+
+        self.list_page_stats = []
+
+        number = 1
+        if response is None:
+            response = self._get_list_page(self.get_list_url(), number, **kwargs)
+
+        results = list(self.get_list_results(response))
+        first = response
+        next_url = response.data.get('next')
+
+        while next_url:
+            number += 1
+            response = self._get_list_page(next_url, number)
+            page = self.get_list_results(response)
+            self.assertTrue(len(page) >= 1, next_url)
+
+            results.extend(page)
+            next_url = response.data.get('next')
+
+        seen = set()
+        for result in results:
+            # results without the unique field can't be told apart from equal ones
+            if not isinstance(result, dict) or self.list_unique_field not in result:
+                continue
+            key = snapshots.dumps(snapshots.normalize(result[self.list_unique_field]))
+            self.assertNotIn(key, seen, 'Result %s appears on more than one page.' % key)
+            seen.add(key)
+
+        expected = self.get_list_expected_count(first)
+        if expected is not None:
+            self.assertEqual(len(results), expected, 'Pages have %d results, expected %d.' % (len(results), expected))
+
+        stats = self.list_page_stats
+        # query times are not measured before Django 2.0
+        if self.list_page_slowdown is not None and len(stats) > 1 and stats[0]['query_time'] is not None:
+            head, tail = stats[0], stats[-1]
+            slowdown = tail['query_time'] / max(head['query_time'], 0.001)
+            self.assertLessEqual(slowdown, self.list_page_slowdown, (
+                'Queries of page %d took %.1f times as long as of page %d (%.2fms to %.2fms), limit is %s' % (
+                    tail['page'], slowdown, head['page'], head['query_time'], tail['query_time'],
+                    self.list_page_slowdown)))
+
+        return results
+
+    def _get_list_page(self, url, number, **kwargs):
+        times = []
+        with _time_queries(times):
+            start = default_timer()
+            response = self.send_request('list', 'get', url, **kwargs)
+            latency = (default_timer() - start) * 1000
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+
+        self.list_page_stats.append({
+            'page': number,
+            'url': url,
+            'results': len(self.get_list_results(response)),
+            'queries': len(times),
+            'query_time': sum(times) * 1000 if None not in times else None,
+            'latency': latency,
+        })
+
         return response
 
+    def get_list_index_params(self):
+        """Return the combinations of query parameters to check the index usage of the list endpoint with.
+
+        By default each of the ``list_filter_params`` and each of the ``list_ordering_params`` on its own,
+        and each filter with each ordering.
+
+        :returns: A list of query parameter dictionaries.
+        """
+
+        filters = [{name: value} for name, value in sorted(six.iteritems(self.list_filter_params or {}))]
+        orderings = [{self.list_ordering_param: value} for value in self.list_ordering_params or ()]
+
+        return filters + orderings + [dict(f, **o) for f in filters for o in orderings]
+
+    def check_list_indexes(self, params=None, **kwargs):
+        """Verify that the queries of the list request use indexes for filtering and ordering.
+
+        Sends the list request with each combination of query parameters, and runs ``EXPLAIN`` on every captured
+        query that filters or orders its results, ``EXPLAIN QUERY PLAN`` on SQLite. Full table scans of filtered
+        queries and sorts that do not use an index, of tables that have at least ``list_scan_threshold`` rows,
+        fail the test.
+        Supports SQLite, PostgreSQL and MySQL, and requires Django 2.0 or later.
+
+        :Note: Query planners may prefer a scan of a small table over an index, so seed enough objects for the plans
+            to be representative, e.g. with :meth:`create_list_objects`.
+
+        .. admonition:: example
+
+            .. code:: python
+
+                class EntryAPITestCase(ListAPITestCaseMixin, BaseRESTAPITestCase):
+
+                    base_name = 'entry'
+                    factory_class = factories.Entry
+                    list_filter_params = {'blog': 1, 'status': 'published'}
+                    list_ordering_params = ['-pub_date']
+
+        :param params: A list of query parameter dictionaries. Defaults to :meth:`get_list_index_params`.
+        :param kwargs: Extra arguments that are passed to the client's ``get()`` call.
+        :returns: A list of dictionaries of the query ``params``, the ``sql`` of each explained query and its
+            ``problems``, a list of ``(kind, table, detail)`` tuples, where ``kind`` is ``'scan'`` or ``'filesort'``.
+        """
+
+        if not hasattr(connection, 'execute_wrapper'):
+            self.skipTest('Checking indexes requires Django 2.0 or later.')
+
+        if connection.vendor not in explain.EXPLAIN_PREFIXES:
+            self.skipTest('Checking indexes is not supported for %s.' % connection.vendor)
+
+        table_names = set(connection.introspection.table_names())
+        row_counts = {}
+
+        def count_rows(table):
+            if table not in row_counts:
+                with connection.cursor() as cursor:
+                    cursor.execute('SELECT COUNT(*) FROM %s' % connection.ops.quote_name(table))
+                    row_counts[table] = cursor.fetchone()[0]
+            return row_counts[table]
+
+        checked = []
+        for query in (self.get_list_index_params() if params is None else params):
+            statements = []
+            with _capture_statements(statements):
+                response = self.get_list_response(data=query, **kwargs)
+            self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+
+            for sql, sql_params in statements:
+                filtered = re.search(r'\bWHERE\b', sql, re.IGNORECASE)
+                # without a filter or an ordering a scan is inevitable
+                if not sql.lstrip().upper().startswith('SELECT') or not (
+                        filtered or re.search(r'\bORDER BY\b', sql, re.IGNORECASE)):
+                    continue
+
+                problems = [(kind, table, detail) for kind, table, detail in explain.find_plan_problems(
+                    connection.vendor, explain.explain(connection, sql, sql_params), filtered=bool(filtered))
+                    if (kind != 'scan' or filtered) and
+                    # aliases and unknown tables are always flagged
+                    (table not in table_names or count_rows(table) >= self.list_scan_threshold)]
+
+                checked.append({'params': query, 'sql': sql, 'problems': problems})
+
+        flagged = [item for item in checked if item['problems']]
+        if flagged:
+            self.fail('List queries do not use indexes:\n%s' % '\n'.join(
+                '%s: %s\n  %s' % (item['params'], item['sql'], '\n  '.join(
+                    '%s of %s: %s' % problem for problem in item['problems'])) for item in flagged))
+
+        return checked
+
+    def check_list_query_scaling(self, n=2, k=5, **kwargs):
+        """Verify that the number of queries of the list request stays constant as the number of objects grows.
+
+        Seeds ``n`` objects and sends the list request, then seeds more objects up to ``k * n`` and sends it again.
+        On failure reports the statements that were repeated per row, which usually indicate a missing
+        ``select_related()`` or ``prefetch_related()``.
+
+        :param n: Number of objects to seed for the first request.
+        :param k: Multiplier of ``n`` for the number of objects of the second request.
+        :param kwargs: Extra arguments that are passed to the client's ``get()`` call.
+        """
+
+        captured = []
+        for size in (n, n * (k - 1)):
+            self.create_list_objects(size)
+            with CaptureQueriesContext(connection) as context:
+                response = self.get_list_response(**kwargs)
+            self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+            captured.append(context.captured_queries)
+
+        small, large = captured
+        if len(large) != len(small):
+            self.fail('Number of queries of list request grows with the number of objects '
+                      '(%d with %d seeded objects, %d with %d seeded objects). Repeated statements:\n%s' % (
+                          len(small), n, len(large), n * k, '\n'.join(_repeated_statements(small, large))))
+
+
+class StreamingListAPITestCaseMixin(ListAPITestCaseMixin):
+
+    """Adds a list view test for streaming endpoints, e.g. CSV or NDJSON exports, to the test case.
+
+    The response's ``streaming_content`` is consumed incrementally and each row is parsed and validated on its own,
+    while measuring the time to first byte, the total time and the peak memory.
+    """
+
+    #: Format of the streamed rows, either ``'ndjson'`` or ``'csv'``, where the first CSV row is the header.
+    #: Defaults to ``'ndjson'``.
+    stream_format = 'ndjson'
+    #: The maximum memory in kilobytes allocated at the peak while sending the request and consuming the stream.
+    #: Requires ``tracemalloc``. Defaults to ``None``.
+    max_stream_memory_kb = None
+    #: Dictionary of the measurements of the last streamed response: ``ttfb`` and ``total`` in milliseconds,
+    #: ``peak_memory`` in bytes, if tracked, and the number of ``chunks`` and ``rows``.
+    #: The memory stats are also stored in ``memory_stats`` under ``'stream'``.
+    stream_stats = None
+
+    _stream_header = None
+
+    def get_max_memory(self, operation):
+        """Return the maximum memory in kilobytes allowed to be allocated by a request of the given operation.
+
+        The ``'stream'`` operation, sending the list request and consuming its stream, gets the
+        ``max_stream_memory_kb`` attribute of this class. Other operations use ``max_memory_kb``.
+
+        :param operation: Name of the operation, e.g. ``'stream'``.
+        :returns: The maximum memory in kilobytes, or ``None`` for no limit.
+        """
+
+        if operation == 'stream':
+            return self.max_stream_memory_kb
+
+        return super(StreamingListAPITestCaseMixin, self).get_max_memory(operation)
+
+    def parse_stream_row(self, line, header=None):
+        """Parse a single line of the streamed content.
+
+        :param line: The line, as bytes.
+        :param header: A list of the CSV header's column names, or ``None``.
+        :returns: The parsed row, a dictionary for NDJSON and for CSV with a header, otherwise a list of values.
+        """
+
+        line = line.decode('utf-8')
+
+        if self.stream_format == 'csv':
+            values = next(csv.reader([line]))
+            return dict(zip(header, values)) if header is not None else values
+
+        return json.loads(line)
+
+    def validate_stream_row(self, row):
+        """Verify a single parsed row. By default checks that the row is not empty.
+
+        Override it for more extensive checks.
+
+        :param row: The parsed row.
+        """
+
+        self.assertTrue(row)
+
+    def test_list(self, **kwargs):
+        """Send request to the streaming list view endpoint, verify the streamed rows and return the response.
+
+        Checks for a 200 status code, that the response is streaming, that there is at least one row,
+        and that the rows were not all buffered into a single chunk.
+        The measurements are stored in ``stream_stats``.
+
+        :param kwargs: Extra arguments that are passed to the client's ``get()`` call.
+        :returns: The view's response.
+        """
+
+        if self.list_seed_count:
+            self.create_list_objects(self.list_seed_count)
+
+        with self.assert_max_memory('stream'):
+            start = default_timer()
+            response = self.get_list_response(**kwargs)
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertTrue(response.streaming, 'Response is not streaming.')
+
+            ttfb = None
+            chunks = rows = 0
+            pending = b''
+            self._stream_header = None
+
+            for chunk in response.streaming_content:
+                if ttfb is None:
+                    ttfb = (default_timer() - start) * 1000
+                chunks += 1
+
+                lines = (pending + chunk).split(b'\n')
+                # the last line may continue in the next chunk
+                pending = lines.pop()
+                for line in lines:
+                    rows += self._consume_stream_line(line)
+
+            rows += self._consume_stream_line(pending)
+
+            total = (default_timer() - start) * 1000
+            self.stream_stats = {'ttfb': ttfb, 'total': total, 'peak_memory': None, 'chunks': chunks, 'rows': rows}
+
+        if self.get_max_memory('stream') is not None or self.track_memory:
+            self.stream_stats['peak_memory'] = self.memory_stats['stream']['peak']
+
+        self.assertTrue(rows >= 1)
+        if rows > 1:
+            self.assertTrue(chunks > 1, 'All %d rows were streamed in a single chunk.' % rows)
+
+        return response
+
+    def _consume_stream_line(self, line):
+        # returns the number of rows consumed, which is 0 for empty lines and the header of a CSV
+        if not line.strip():
+            return 0
+
+        if self.stream_format == 'csv' and self._stream_header is None:
+            self._stream_header = self.parse_stream_row(line)
+            return 0
+
+        self.validate_stream_row(self.parse_stream_row(line, self._stream_header))
+        return 1
+
 
 class DetailAPITestCaseMixin(object):
 
@@ -145,7 +1421,7 @@ class DetailAPITestCaseMixin(object):
         """
 
         object_id = getattr(self.object, self.lookup_field)
-        return reverse(self.base_name + self.DETAIL_SUFFIX, args=[text_type(object_id)])
+        return self.reverse_url(self.base_name + self.DETAIL_SUFFIX, object_id)
 
     def get_detail_response(self, **kwargs):
         """Send the detail request and return the response.
@@ -154,13 +1430,14 @@ class DetailAPITestCaseMixin(object):
         :returns: The response object.
         """
 
-        return self.client.get(self.get_detail_url(), **kwargs)
+        return self.send_request('detail', 'get', self.get_detail_url(), **kwargs)
 
     def test_detail(self, **kwargs):
         """Send request to the detail view endpoint, verify and return the response.
 
         Checks for a 200 status code and that there is an ``id`` property in the ``response.data``
         and that it equals the main object's id.
+        If ``use_snapshots`` is set, the full response data is compared against the stored snapshot instead.
 
         You can extend it for more extensive checks.
 
@@ -192,7 +1469,13 @@ class DetailAPITestCaseMixin(object):
         response = self.get_detail_response(**kwargs)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
-        self._check_attributes(response.data)
+
+        if self.use_snapshots:
+            self.assert_snapshot('detail', response.data)
+        else:
+            self._check_attributes(response.data)
+
+        self.check_caching(response, partial(self.get_detail_response, **kwargs))
 
         return response
 
@@ -219,12 +1502,13 @@ class CreateAPITestCaseMixin(object):
     def get_create_data(self):
         """Return the data used for the create request.
 
-        By default gets the ``create_data`` attribute of this class.
+        By default gets the ``create_data`` attribute of this class, with the values of ``worker_unique_fields``
+        namespaced when running tests in parallel.
 
         :returns: The data dictionary.
         """
 
-        return getattr(self, 'create_data')
+        return self.namespace_data(getattr(self, 'create_data'))
 
     def get_create_url(self):
         """Return the create endpoint url.
@@ -232,7 +1516,7 @@ class CreateAPITestCaseMixin(object):
         :returns: The url of create endpoint.
         """
 
-        return reverse(self._get_create_name())
+        return self.reverse_url(self._get_create_name())
 
     def get_create_response(self, data=None, **kwargs):
         """Send the create request and return the response.
@@ -244,8 +1528,9 @@ class CreateAPITestCaseMixin(object):
 
         if data is None:
             data = self.get_create_data()
+        self.__data = data
 
-        return self.client.post(self.get_create_url(), data or {}, **kwargs)
+        return self.send_request('create', 'post', self.get_create_url(), data or {}, **kwargs)
 
     def get_lookup_from_response(self, data):
         """Return value for looking up the created object in DB.
@@ -273,7 +1558,7 @@ class CreateAPITestCaseMixin(object):
 
         # another sanity check:
         # getting the instance from database simply to see that it's found and does not raise any exception
-        created = self.object.__class__.objects.get(
+        created = self.get_db_queryset(self.__data or ()).get(
             **{self.lookup_field: self.get_lookup_from_response(response.data)})
 
         return response, created
@@ -298,8 +1583,7 @@ class DestroyAPITestCaseMixin(object):
         """
 
         self.object_id = getattr(self.object, self.lookup_field)
-        return reverse(self._get_destroy_name(),
-                       args=(self.object_id,))
+        return self.reverse_url(self._get_destroy_name(), self.object_id)
 
     def get_destroy_response(self, **kwargs):
         """Send the destroy request and return the response.
@@ -308,7 +1592,7 @@ class DestroyAPITestCaseMixin(object):
         :returns: The view's response.
         """
 
-        return self.client.delete(self.get_destroy_url(), **kwargs)
+        return self.send_request('destroy', 'delete', self.get_destroy_url(), **kwargs)
 
     def test_destroy(self, **kwargs):
         """Send request to the destroy view endpoint, verify and return the response.
@@ -350,6 +1634,19 @@ class UpdateAPITestCaseMixin(object):
     update_results = None
     #: The name of the field in the response data for looking up the created object in DB.
     relationship_lookup_field = 'id'
+    #: Whether to verify that the update invalidates the validator, ``ETag`` or ``Last-Modified``,
+    #: of the detail response. Defaults to ``False``.
+    check_cache_invalidation = False
+    #: Number of concurrent update requests to send to the same object after the update test. Defaults to ``None``.
+    update_concurrency = None
+    #: List of data dictionaries to send in the concurrent update requests, in turns. Defaults to ``update_data``.
+    update_variants = None
+    #: Status codes of concurrent update requests that lost to another request, e.g. by optimistic locking,
+    #: which are counted as conflicts rather than failures. Defaults to ``(409, 412)``.
+    update_conflict_statuses = (status.HTTP_409_CONFLICT, status.HTTP_412_PRECONDITION_FAILED)
+    #: Dictionary of the measurements of the last concurrent updates: the number of ``requests`` and ``conflicts``,
+    #: ``throughput`` in requests per second, and statistics in milliseconds of the ``latency`` and ``lock_wait``.
+    update_contention_stats = None
 
     def get_update_url(self):
         """Return the update endpoint url.
@@ -358,8 +1655,7 @@ class UpdateAPITestCaseMixin(object):
         """
 
         self.object_id = getattr(self.object, self.lookup_field)
-        return reverse(self._get_update_name(),
-                       args=(self.object_id,))
+        return self.reverse_url(self._get_update_name(), self.object_id)
 
     def get_update_response(self, data=None, results=None, use_patch=None, **kwargs):
         """Send the update request and return the response.
@@ -383,17 +1679,18 @@ class UpdateAPITestCaseMixin(object):
         if use_patch is None:
             use_patch = self.use_patch
 
-        return self.client.patch(*args, **kwargs) if use_patch else self.client.put(*args, **kwargs)
+        return self.send_request('update', 'patch' if use_patch else 'put', *args, **kwargs)
 
     def get_update_data(self):
         """Return the data used for the update request.
 
-        By default gets the ``update_data`` attribute of this class.
+        By default gets the ``update_data`` attribute of this class, with the values of ``worker_unique_fields``
+        namespaced when running tests in parallel.
 
         :returns: Data dictionary for the update request.
         """
 
-        return getattr(self, 'update_data')
+        return self.namespace_data(getattr(self, 'update_data'))
 
     def get_update_results(self, data=None):
         """Return a dictionary of the expected results of the instance.
@@ -429,18 +1726,104 @@ class UpdateAPITestCaseMixin(object):
         :returns: A tuple ``response, updated`` of the view's response the updated instance.
         """
 
+        if self.check_cache_invalidation:
+            # the update endpoint may differ from the detail one, e.g. with a custom ``update_name``
+            detail_url = (self.get_detail_url() if hasattr(self, 'get_detail_url') else
+                          self.reverse_url(self.base_name + self.DETAIL_SUFFIX, getattr(self.object, self.lookup_field)))
+            headers = self.get_conditional_headers(self.send_request('detail', 'get', detail_url))
+            self.assertTrue(headers, 'Response has neither an ETag nor a Last-Modified header.')
+
         response = self.get_update_response(data, results, use_patch, **kwargs)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
 
-        # getting a fresh copy of the object from DB
-        updated = self.object.__class__.objects.get(**{self.lookup_field: self.object_id})
+        # getting a fresh copy of the object from DB, along with the relations that are going to be checked
+        updated = self.get_db_queryset(self.__data if data is None else data).get(**{self.lookup_field: self.object_id})
         # Sanity check:
         # check that the copy in the database was updated as expected.
         self._update_check_db(updated, data, results)
 
+        if self.check_cache_invalidation:
+            # a stale validator must not get a 304 anymore
+            fresh = self.send_request('detail', 'get', detail_url, **headers)
+            self.assertEqual(fresh.status_code, status.HTTP_200_OK, 'Update did not invalidate the response validator.')
+
+        if self.update_concurrency:
+            self.check_concurrent_updates(use_patch=use_patch, live_server_url=getattr(self, 'live_server_url', None))
+
         return response, updated
 
+    def check_concurrent_updates(self, variants=None, concurrency=None, use_patch=None, live_server_url=None):
+        """Send concurrent update requests with different data to the main object, verify and measure them.
+
+        The requests are sent simultaneously using :func:`rest_assured.utils.run_concurrently`. The lock wait of
+        each request is estimated as its latency above the latency of a single update request sent beforehand,
+        when there is no contention.
+        Verifies that every request either succeeded or got one of the ``update_conflict_statuses``, and that the
+        database row matches one of the successful requests' data entirely, with no fields lost to another request.
+        The measurements are stored in ``update_contention_stats``.
+
+        :Note: The requests are sent from other threads, see :func:`rest_assured.utils.run_concurrently`
+            for setting up the test case.
+
+        :param variants: List of data dictionaries to send in turns. Defaults to ``update_variants``,
+            or the update data.
+        :param concurrency: Number of requests to send. Defaults to ``update_concurrency``, or the number of variants.
+        :param use_patch: Whether to send PATCH requests instead of PUT. Defaults to ``use_patch``.
+        :param live_server_url: Url of a live server to send the requests to instead of using the test client.
+        :returns: The ``update_contention_stats``.
+        """
+
+        variants = variants or self.update_variants or [self.get_update_data()]
+        concurrency = concurrency or self.update_concurrency or len(variants)
+        payloads = [variants[index % len(variants)] for index in range(concurrency)]
+        get_client = (lambda: LiveServerClient(live_server_url)) if live_server_url else None
+
+        # the latency of an uncontended request, to estimate the lock wait of the concurrent ones
+        start = default_timer()
+        response = clone_case(self, get_client and get_client()).get_update_response(payloads[0], {}, use_patch)
+        baseline = (default_timer() - start) * 1000
+        self.assertEqual(response.status_code, status.HTTP_200_OK, 'Uncontended update request failed: %d: %s' % (
+            response.status_code, response.content))
+
+        requests = [lambda clone, payload=payload: clone.get_update_response(payload, {}, use_patch)
+                    for payload in payloads]
+        results, elapsed = run_concurrently(self, requests, get_client)
+
+        failures = ['%r' % response if latency is None else '%d: %s' % (response.status_code, response.content)
+                    for response, latency in results
+                    if latency is None or (response.status_code != status.HTTP_200_OK and
+                                           response.status_code not in self.update_conflict_statuses)]
+        if failures:
+            self.fail('Concurrent update requests failed:\n%s' % '\n'.join(failures))
+
+        succeeded = [payload for payload, (response, latency) in zip(payloads, results)
+                     if response.status_code == status.HTTP_200_OK]
+        self.assertTrue(succeeded, 'All concurrent update requests conflicted.')
+
+        latencies = [latency for response, latency in results]
+        self.update_contention_stats = {
+            'requests': concurrency,
+            'conflicts': concurrency - len(succeeded),
+            'throughput': concurrency / elapsed,
+            'latency': summarize(latencies),
+            'lock_wait': summarize([max(latency - baseline, 0) for latency in latencies]),
+        }
+
+        updated = self.get_db_queryset(set(key for payload in succeeded for key in payload)).get(
+            **{self.lookup_field: getattr(self.object, self.lookup_field)})
+        for payload in succeeded:
+            try:
+                self._update_check_db(updated, payload, {})
+            except AssertionError:
+                continue
+            break
+        else:
+            self.fail('Updated object matches none of the successful concurrent requests, '
+                      'so fields of some requests were lost.')
+
+        return self.update_contention_stats
+
     def _get_update_name(self):
         if hasattr(self, 'update_name'):
             view_name = self.update_name
@@ -474,12 +1857,343 @@ class UpdateAPITestCaseMixin(object):
                     # Handle case of a ManyToMany relation
                     if isinstance(attribute, Manager):
                         items = {self.get_relationship_value(item, key) for item in attribute.all()}
-                        self.assertTrue(set(value).issubset(items), key)
+                        self.assertTrue(set(text_type(item) for item in value).issubset(items), key)
                         continue
 
             self.assertEqual(attribute, results.get(key, value), key)
 
 
+class BulkAPITestCaseMixin(object):
+
+    """Base of the bulk test case mixins, for endpoints that create or update a list of objects in a single request.
+
+    The items of the request data are verified against the database rows, which are all fetched in a single
+    ``__in`` query, and the number of queries and latency of the request can be checked as the batch size grows.
+    """
+
+    #: Names of the fields of the objects built by the factory to send as the data of each item. Defaults to ``None``.
+    bulk_fields = None
+    #: Maximum ratio of the latency of a batch of ``k * n`` objects to the latency of a batch of ``n`` objects,
+    #: when checking the scaling of a bulk request. Defaults to ``None``, for only checking the number of queries.
+    bulk_latency_growth = None
+    #: Dictionary mapping bulk operation names to dictionaries mapping batch sizes to the ``queries`` and latency
+    #: in milliseconds, ``ms``, of their last scaling check.
+    bulk_stats = None
+
+    def get_bulk_item_data(self, obj):
+        """Return the data of a single item of a bulk request from an object.
+
+        Related objects that are not saved yet, like the ones factory_boy's ``build()`` generates for a
+        ``SubFactory``, are saved first, so their primary keys can be sent. Their own related objects must be saved.
+
+        :param obj: An object built by the factory.
+        :returns: Dictionary mapping the ``bulk_fields`` to the object's values, with related objects replaced by
+            their primary keys.
+        """
+
+        data = {}
+        for name in self.bulk_fields or ():
+            value = getattr(obj, name)
+            if isinstance(value, Model):
+                if value.pk is None:
+                    value.save()
+                value = value.pk
+            data[name] = value
+
+        return self.namespace_data(data)
+
+    def check_bulk_rows(self, data, lookup_field):
+        """Verify that every item of the data matches a database row.
+
+        All the rows are fetched with a single ``__in`` query on ``lookup_field``.
+
+        :param data: The list of items of the bulk request.
+        :param lookup_field: Name of the field that identifies each item and its row.
+        :returns: The list of rows, in the order of the items.
+        """
+
+        values = [item[lookup_field] for item in data]
+        queryset = self.get_db_queryset(set(key for item in data for key in item))
+        rows = dict((text_type(getattr(row, lookup_field)), row)
+                    for row in queryset.filter(**{lookup_field + '__in': values}))
+
+        ordered = []
+        for item in data:
+            row = rows.get(text_type(item[lookup_field]))
+            self.assertIsNotNone(row, 'No row found for %s=%s' % (lookup_field, item[lookup_field]))
+
+            for key, value in six.iteritems(item):
+                # check for foreign key
+                attribute = getattr(row, '%s_id' % key) if hasattr(row, '%s_id' % key) else getattr(row, key)
+                if isinstance(attribute, Manager):
+                    items = set(text_type(related.pk) for related in attribute.all())
+                    self.assertTrue(set(text_type(pk) for pk in value).issubset(items), key)
+                    continue
+
+                self.assertEqual(text_type(attribute), text_type(value), key)
+
+            ordered.append(row)
+
+        return ordered
+
+    def check_bulk_scaling(self, operation, n=2, k=5, **kwargs):
+        """Verify that the number of queries of a bulk request stays constant as the batch size grows.
+
+        Sends a batch of ``n`` objects and then a batch of ``k * n`` objects. If ``bulk_latency_growth`` is set,
+        also verifies the latency of the larger batch did not grow by more than that ratio.
+        On failure reports the statements that were repeated per object, which means the endpoint does not really
+        batch its inserts or updates.
+
+        :param operation: Name of the bulk operation, ``'bulk_create'`` or ``'bulk_update'``.
+        :param n: Number of objects of the first batch.
+        :param k: Multiplier of ``n`` for the number of objects of the second batch.
+        :param kwargs: Extra arguments that are passed to the operation's ``get_*_response()`` method.
+        """
+
+        get_data = getattr(self, 'get_%s_data' % operation)
+        get_response = getattr(self, 'get_%s_response' % operation)
+
+        if self.bulk_stats is None:
+            self.bulk_stats = {}
+        stats = self.bulk_stats[operation] = {}
+
+        captured = []
+        for size in (n, n * k):
+            data = get_data(size)
+            with CaptureQueriesContext(connection) as context:
+                start = default_timer()
+                response = get_response(data, **kwargs)
+                elapsed = (default_timer() - start) * 1000
+            self.assertLess(response.status_code, 300, getattr(response, 'data', response))
+
+            captured.append(context.captured_queries)
+            stats[size] = {'queries': len(context.captured_queries), 'ms': elapsed}
+
+        small, large = captured
+        if len(large) != len(small):
+            self.fail('Number of queries of %s request grows with the batch size '
+                      '(%d for %d objects, %d for %d objects). Repeated statements:\n%s' % (
+                          operation, len(small), n, len(large), n * k, '\n'.join(_repeated_statements(small, large))))
+
+        if self.bulk_latency_growth is not None:
+            growth = stats[n * k]['ms'] / max(stats[n]['ms'], 0.001)
+            self.assertLessEqual(growth, self.bulk_latency_growth, (
+                'Latency of %s request grew %.1f times from %d to %d objects (%.2fms to %.2fms), limit is %s' % (
+                    operation, growth, n, n * k, stats[n]['ms'], stats[n * k]['ms'], self.bulk_latency_growth)))
+
+
+class BulkCreateAPITestCaseMixin(BulkAPITestCaseMixin):
+
+    """Adds a bulk create view test to the test case, that POSTs a list of objects built by the factory.
+
+    .. admonition:: example
+
+        .. code:: python
+
+            class EntryBulkAPITestCase(BulkCreateAPITestCaseMixin, BaseRESTAPITestCase):
+
+                base_name = 'entry-bulk'
+                factory_class = factories.Entry
+                # the blog of each built entry is saved, to send its primary key
+                bulk_fields = ['headline', 'blog']
+                bulk_create_lookup_field = 'headline'
+                bulk_create_scaling = (10, 10)
+    """
+
+    #: Number of objects to send in the bulk create request. Defaults to ``10``.
+    bulk_create_size = 10
+    #: Name of the field that identifies each item in the request data and its row in the database.
+    #: It must be unique among the items. Defaults to ``None``, for matching the items with their rows by the
+    #: ``bulk_create_response_lookup_field`` of the response's items, in the same order.
+    bulk_create_lookup_field = None
+    #: The name of the primary key field in the response's items, used when ``bulk_create_lookup_field`` is not set.
+    #: Defaults to ``'id'``.
+    bulk_create_response_lookup_field = 'id'
+    #: A tuple ``(n, k)`` for checking that the number of queries of the bulk create request does not grow with
+    #: the batch size, by comparing batches of ``n`` and ``k * n`` objects. Defaults to ``None``.
+    bulk_create_scaling = None
+
+    def get_bulk_create_url(self):
+        """Return the bulk create endpoint url.
+
+        :returns: The url of the ``bulk_create_name`` view, or the list view of ``base_name``.
+        """
+
+        return self.reverse_url(getattr(self, 'bulk_create_name', self.base_name + self.LIST_SUFFIX))
+
+    def get_bulk_create_data(self, size=None):
+        """Return the list of items for the bulk create request.
+
+        By default builds ``size`` objects with the factory's ``build()`` and takes their ``bulk_fields``.
+
+        :param size: Number of items. Defaults to ``bulk_create_size``.
+        :returns: The list of data dictionaries.
+        """
+
+        factory = self.get_factory_class()
+        size = self.bulk_create_size if size is None else size
+
+        return [self.get_bulk_item_data(factory.build()) for _ in range(size)]
+
+    def get_bulk_create_response(self, data=None, **kwargs):
+        """Send the bulk create request and return the response.
+
+        The data is sent JSON encoded.
+
+        :param data: The list of items for the bulk create request.
+        :param kwargs: Extra arguments that are passed to the client's ``post()`` call.
+        :returns: The response object.
+        """
+
+        if data is None:
+            data = self.get_bulk_create_data()
+
+        kwargs.setdefault('format', 'json')
+
+        return self.send_request('bulk_create', 'post', self.get_bulk_create_url(), data, **kwargs)
+
+    def test_bulk_create(self, data=None, **kwargs):
+        """Send request to the bulk create view endpoint, verify and return the response.
+
+        Also verifies that every item matches a database row, fetching all the rows with a single query,
+        and checks the scaling of the request if ``bulk_create_scaling`` is set.
+
+        :param data: The list of items for the bulk create request.
+        :param kwargs: Extra arguments that are passed to the client's ``post()`` call.
+        :returns: A tuple ``response, created`` of the view's response and the list of created instances.
+        """
+
+        if data is None:
+            data = self.get_bulk_create_data()
+
+        response = self.get_bulk_create_response(data, **kwargs)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, getattr(response, 'data', response))
+        self.assertEqual(len(response.data), len(data))
+
+        lookup_field = self.bulk_create_lookup_field
+        if lookup_field is None:
+            # the built objects have no primary keys, so take them from the response
+            lookup_field = 'pk'
+            pks = [result.get(self.bulk_create_response_lookup_field) for result in response.data]
+            if None in pks:
+                self.fail('Response items have no %r to match them with their rows, '
+                          'set bulk_create_lookup_field to a field that identifies the items.' % (
+                              self.bulk_create_response_lookup_field))
+            data = [dict(item, pk=pk) for item, pk in zip(data, pks)]
+
+        created = self.check_bulk_rows(data, lookup_field)
+
+        if self.bulk_create_scaling:
+            self.check_bulk_scaling('bulk_create', *self.bulk_create_scaling, **kwargs)
+
+        return response, created
+
+
+class BulkUpdateAPITestCaseMixin(BulkAPITestCaseMixin):
+
+    """Adds a bulk update view test to the test case, that PATCHes a list of objects created by the factory.
+
+    .. admonition:: example
+
+        .. code:: python
+
+            class EntryBulkAPITestCase(BulkUpdateAPITestCaseMixin, BaseRESTAPITestCase):
+
+                base_name = 'entry-bulk'
+                factory_class = factories.Entry
+                bulk_update_data = {'rating': 5}
+                bulk_update_scaling = (10, 10)
+    """
+
+    #: Whether to send a PATCH request instead of PUT. Defaults to ``True``.
+    bulk_use_patch = True
+    #: *required*: Dictionary of data to update every object with.
+    bulk_update_data = None
+    #: Number of objects to send in the bulk update request. Defaults to ``10``.
+    bulk_update_size = 10
+    #: Name of the field that identifies each item in the request data and its row in the database.
+    #: Defaults to ``'id'``.
+    bulk_update_lookup_field = 'id'
+    #: A tuple ``(n, k)`` for checking that the number of queries of the bulk update request does not grow with
+    #: the batch size, by comparing batches of ``n`` and ``k * n`` objects. Defaults to ``None``.
+    bulk_update_scaling = None
+
+    def get_bulk_update_url(self):
+        """Return the bulk update endpoint url.
+
+        :returns: The url of the ``bulk_update_name`` view, or the list view of ``base_name``.
+        """
+
+        return self.reverse_url(getattr(self, 'bulk_update_name', self.base_name + self.LIST_SUFFIX))
+
+    def get_bulk_update_data(self, size=None):
+        """Return the list of items for the bulk update request.
+
+        By default creates ``size`` objects with the factory, and returns an item of ``bulk_update_data``
+        for each one, identified by its ``bulk_update_lookup_field``.
+
+        :param size: Number of items. Defaults to ``bulk_update_size``.
+        :returns: The list of data dictionaries.
+        """
+
+        size = self.bulk_update_size if size is None else size
+        # created one by one, since not all databases set the primary keys of bulk created objects
+        objects = [self.object] + _create_objects(self.get_factory_class(), size - 1, bulk=False) if size else []
+        data = self.namespace_data(getattr(self, 'bulk_update_data'))
+
+        return [dict(data, **{self.bulk_update_lookup_field: getattr(obj, self.bulk_update_lookup_field)})
+                for obj in objects]
+
+    def get_bulk_update_response(self, data=None, use_patch=None, **kwargs):
+        """Send the bulk update request and return the response.
+
+        The data is sent JSON encoded.
+
+        :param data: The list of items for the bulk update request.
+        :param use_patch: Whether to send a PATCH request instead of PUT. Defaults to ``bulk_use_patch``.
+        :param kwargs: Extra arguments that are passed to the client's ``put()`` or ``patch()`` call.
+        :returns: The response object.
+        """
+
+        if data is None:
+            data = self.get_bulk_update_data()
+
+        if use_patch is None:
+            use_patch = self.bulk_use_patch
+
+        kwargs.setdefault('format', 'json')
+
+        return self.send_request('bulk_update', 'patch' if use_patch else 'put', self.get_bulk_update_url(), data,
+                                 **kwargs)
+
+    def test_bulk_update(self, data=None, use_patch=None, **kwargs):
+        """Send request to the bulk update view endpoint, verify and return the response.
+
+        Also verifies that every item matches a database row, fetching all the rows with a single query,
+        and checks the scaling of the request if ``bulk_update_scaling`` is set.
+
+        :param data: The list of items for the bulk update request.
+        :param use_patch: Whether to send a PATCH request instead of PUT. Defaults to ``bulk_use_patch``.
+        :param kwargs: Extra arguments that are passed to the client's ``put()`` or ``patch()`` call.
+        :returns: A tuple ``response, updated`` of the view's response and the list of updated instances.
+        """
+
+        if data is None:
+            data = self.get_bulk_update_data()
+
+        response = self.get_bulk_update_response(data, use_patch, **kwargs)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, getattr(response, 'data', response))
+
+        updated = self.check_bulk_rows(data, self.bulk_update_lookup_field)
+
+        if self.bulk_update_scaling:
+            self.check_bulk_scaling('bulk_update', *self.bulk_update_scaling, **kwargs)
+
+        return response, updated
+
+
 class ReadRESTAPITestCaseMixin(ListAPITestCaseMixin, DetailAPITestCaseMixin):
 
     """Adds the read CRUD operations tests to the test case.
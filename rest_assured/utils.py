@@ -0,0 +1,188 @@
+import copy
+import json
+import math
+import os
+import threading
+from timeit import default_timer
+
+
+def percentile(samples, percent):
+    """Return the percentile of the given samples using linear interpolation between the closest ranks.
+
+    :param samples: A sequence of numbers.
+    :param percent: The percentile to calculate, between ``0`` and ``100``.
+    :returns: The value of the percentile.
+    """
+
+    ordered = sorted(samples)
+    if not ordered:
+        raise ValueError('Cannot calculate a percentile of an empty sequence.')
+
+    rank = (len(ordered) - 1) * percent / 100.0
+    lower = int(math.floor(rank))
+    upper = int(math.ceil(rank))
+
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(samples):
+    """Return a dictionary of statistics of the given samples.
+
+    :param samples: A sequence of numbers.
+    :returns: Dictionary with ``count``, ``mean``, ``stdev``, ``min``, ``max``, ``p50``, ``p95`` and ``p99`` keys.
+    """
+
+    count = len(samples)
+    mean = sum(samples) / float(count)
+    variance = sum((sample - mean) ** 2 for sample in samples) / (count - 1) if count > 1 else 0.0
+
+    return {
+        'count': count,
+        'mean': mean,
+        'stdev': math.sqrt(variance),
+        'min': min(samples),
+        'max': max(samples),
+        'p50': percentile(samples, 50),
+        'p95': percentile(samples, 95),
+        'p99': percentile(samples, 99),
+    }
+
+
+def append_report(path, record):
+    """Append a record as a JSON line to a report file.
+
+    :param path: Path of the report file.
+    :param record: A JSON serializable dictionary.
+    """
+
+    with open(path, 'a') as report:
+        report.write(json.dumps(record, sort_keys=True) + '\n')
+
+
+def histogram(samples, bounds):
+    """Return the number of samples in each bucket of the given upper bounds.
+
+    :param samples: A sequence of numbers.
+    :param bounds: A sorted sequence of the buckets' inclusive upper bounds.
+    :returns: A list of ``(bound, count)`` tuples, with a last ``(None, count)`` bucket for samples above all bounds.
+    """
+
+    counts = [0] * (len(bounds) + 1)
+    for sample in samples:
+        index = next((i for i, bound in enumerate(bounds) if sample <= bound), len(bounds))
+        counts[index] += 1
+
+    return list(zip(list(bounds) + [None], counts))
+
+
+def clone_case(case, client=None):
+    """Return a shallow copy of a test case instance with its own client, for sending requests from another thread.
+
+    If the test case has a user, the new client is force authenticated with it.
+
+    :param case: An instance of a :class:`rest_assured.testcases.BaseRESTAPITestCase` subclass, after ``setUp()``.
+    :param client: A client to use instead of a new instance of the test case's ``client_class``.
+    :returns: The copy of the test case.
+    """
+
+    clone = copy.copy(case)
+    clone.client = client or case.client_class()
+
+    if case.user and hasattr(clone.client, 'force_authenticate'):
+        clone.client.force_authenticate(case.user)
+
+    return clone
+
+
+def run_concurrently(case, requests, get_client=None):
+    """Send requests simultaneously from several threads, each with its own copy of the test case and client.
+
+    The threads are released together once all of them are ready, and close their database connections when done.
+
+    :Note: Worker threads use their own database connections, so they only see the objects of the test case when
+        they are committed. Since the API test cases are Django ``TestCase`` subclasses, set them up from a
+        ``TransactionTestCase`` or ``LiveServerTestCase`` test instead.
+
+    :param case: An instance of a :class:`rest_assured.testcases.BaseRESTAPITestCase` subclass, after ``setUp()``.
+    :param requests: A list of callables, one per thread, that send a request using the copy of the test case they
+        are called with and return the response.
+    :param get_client: A callable returning the client of each thread. Defaults to the test case's ``client_class``.
+    :returns: A tuple ``results, elapsed`` of a list of ``(response, latency)`` tuples in the order of ``requests``,
+        with the latency in milliseconds, or ``(exception, None)`` for requests that raised,
+        and the time in seconds it took all the requests to finish.
+    """
+
+    from django.db import connections
+
+    results = [None] * len(requests)
+    ready = threading.Semaphore(0)
+    start = threading.Event()
+
+    def worker(index, request):
+        clone = clone_case(case, get_client() if get_client else None)
+        try:
+            ready.release()
+            start.wait()
+            request_start = default_timer()
+            response = request(clone)
+            results[index] = (response, (default_timer() - request_start) * 1000)
+        except Exception as error:
+            results[index] = (error, None)
+        finally:
+            connections.close_all()
+
+    threads = [threading.Thread(target=worker, args=(index, request)) for index, request in enumerate(requests)]
+    for thread in threads:
+        thread.start()
+    for _ in threads:
+        ready.acquire()
+    started = default_timer()
+    start.set()
+    for thread in threads:
+        thread.join()
+
+    return results, default_timer() - started
+
+
+def get_worker_id():
+    """Return the id of the current worker process when running tests in parallel.
+
+    Uses the ``REST_ASSURED_WORKER_ID`` environment variable if set, e.g. for other parallel runners,
+    and otherwise supports pytest-xdist workers and Django's ``test --parallel`` runner.
+
+    :Note: Django has no public API for the id of its parallel workers, so it is read from the private
+        ``django.test.runner._worker_id`` counter. Set ``REST_ASSURED_WORKER_ID`` if that ever stops working.
+
+    :returns: The worker id, e.g. ``'gw1'`` for pytest-xdist or ``'w1'`` for Django, or ``None`` if not running in parallel.
+    """
+
+    worker_id = os.environ.get('REST_ASSURED_WORKER_ID') or os.environ.get('PYTEST_XDIST_WORKER')
+    if worker_id:
+        return worker_id
+
+    from django.test import runner
+
+    # set by Django's parallel test runner in each worker process, read defensively since it's private
+    django_worker_id = getattr(runner, '_worker_id', 0)
+    if django_worker_id:
+        return 'w%d' % django_worker_id
+
+
+def worker_unique(value):
+    """Return the value namespaced by the id of the current worker process, if running tests in parallel.
+
+    Useful for generating unique values in factories that must not collide across workers, e.g.:
+
+    .. code:: python
+
+        username = factory.Sequence(lambda n: worker_unique('user{0}'.format(n)))
+
+    :param value: The value to namespace.
+    :returns: The namespaced value as a string, e.g. ``'gw1-user3'``, or the value itself if not running in parallel.
+    """
+
+    worker_id = get_worker_id()
+    if worker_id is None:
+        return value
+
+    return '%s-%s' % (worker_id, value)
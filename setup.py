@@ -23,6 +23,7 @@ setup(
     license='BSD',
     packages=find_packages(),
     install_requires=["django>=1.6", "djangorestframework>=2.4.3", "six"],
+    extras_require={"brotli": ["brotli"], "pyinstrument": ["pyinstrument"]},
     zip_safe=False,
     classifiers=[
         'Development Status :: 5 - Production/Stable',
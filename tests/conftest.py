@@ -1,11 +1,18 @@
+import sys
+
 from django.conf import settings
 
+# the async test cases use ``async def``
+collect_ignore = ['test_async.py'] if sys.version_info < (3, 5) else []
+
 
 def pytest_configure():
     settings.configure(
         ROOT_URLCONF='tests.urls',
 
-        ALLOWED_HOSTS=['testserver'],
+        ALLOWED_HOSTS=['testserver', 'localhost'],
+
+        STATIC_URL='/static/',
 
         DATABASES={
             'default': {
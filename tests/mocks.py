@@ -1,8 +1,36 @@
-from rest_framework import viewsets, serializers
+import csv
+import itertools
+import json
+import threading
+import time
+
+import six
+from django.db import transaction
+from django.http import StreamingHttpResponse
+from django.test import override_settings
+from rest_framework import filters, generics, pagination, serializers, status, viewsets
+from rest_framework.response import Response
 
 from rest_assured.testcases import BaseRESTAPITestCase
 from tests.models import Stuff, RelatedStuff, ManyRelatedStuff
 
+try:
+    from rest_framework.decorators import action
+except ImportError:
+    # DRF < 3.8
+    from rest_framework.decorators import detail_route
+    action = None
+
+try:
+    from django_fsm import can_proceed
+    from tests.models import Order
+except ImportError:
+    # django-fsm is not installed
+    Order = None
+
+# serializes the locked transitions, since SQLite ignores ``select_for_update()``
+order_lock = threading.Lock()
+
 
 class MockObject(object):
     pass
@@ -16,12 +44,27 @@ class MockFactory(object):
 
 class StuffFactory(object):
     @classmethod
-    def create(cls, **kwargs):
+    def build(cls, **kwargs):
         if 'name' not in kwargs:
             kwargs['name'] = 'name of stuff'
         if 'answer' not in kwargs:
             kwargs['answer'] = 42
-        return Stuff.objects.create(**kwargs)
+        return Stuff(**kwargs)
+
+    @classmethod
+    def create(cls, **kwargs):
+        obj = cls.build(**kwargs)
+        obj.save()
+        return obj
+
+
+class StuffSequenceFactory(StuffFactory):
+    counter = itertools.count()
+
+    @classmethod
+    def build(cls, **kwargs):
+        kwargs.setdefault('name', 'stuff %d' % next(cls.counter))
+        return super(StuffSequenceFactory, cls).build(**kwargs)
 
 
 class RelatedStuffFactory(object):
@@ -79,6 +122,33 @@ class StuffSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'answer']
 
 
+class StuffBulkListSerializer(serializers.ListSerializer):
+    def create(self, validated_data):
+        return Stuff.objects.bulk_create([Stuff(**item) for item in validated_data])
+
+    def update(self, instances, validated_data):
+        instances = dict((obj.pk, obj) for obj in instances)
+        objects = []
+        # a single ``update()`` per distinct set of values, since ``bulk_update()`` requires Django 2.2
+        groups = {}
+        for item, attributes in zip(self.initial_data, validated_data):
+            obj = instances[item['id']]
+            for key, value in attributes.items():
+                setattr(obj, key, value)
+            objects.append(obj)
+            groups.setdefault(tuple(sorted(attributes.items())), []).append(obj.pk)
+        for attributes, pks in groups.items():
+            Stuff.objects.filter(pk__in=pks).update(**dict(attributes))
+        return objects
+
+
+class StuffBulkSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Stuff
+        fields = ['id', 'name', 'answer']
+        list_serializer_class = StuffBulkListSerializer
+
+
 class StuffHyperlinkedSerializer(serializers.HyperlinkedModelSerializer):
     class Meta:
         model = Stuff
@@ -100,6 +170,14 @@ class RelatedStuffHyperlinkedSerializer(serializers.HyperlinkedModelSerializer):
                                                 view_name='stuff-linked-detail')
 
 
+class RelatedStuffNestedSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = RelatedStuff
+        fields = ['id', 'thing']
+
+    thing = StuffSerializer(read_only=True)
+
+
 class ManyRelatedStuffSerializer(serializers.ModelSerializer):
     class Meta:
         model = ManyRelatedStuff
@@ -121,6 +199,57 @@ class StuffViewSet(viewsets.ModelViewSet):
     paginate_by = 10
 
 
+class StuffPagination(pagination.PageNumberPagination):
+    page_size = 5
+
+
+class StuffPaginatedViewSet(viewsets.ModelViewSet):
+    queryset = Stuff.objects.order_by('pk')
+    serializer_class = StuffSerializer
+    pagination_class = StuffPagination
+
+
+class StuffCursorPagination(pagination.CursorPagination):
+    page_size = 5
+    ordering = 'pk'
+
+
+class StuffCursorViewSet(viewsets.ReadOnlyModelViewSet):
+    queryset = Stuff.objects.all()
+    serializer_class = StuffSerializer
+    pagination_class = StuffCursorPagination
+
+
+class StuffOverlappingPagination(pagination.LimitOffsetPagination):
+    default_limit = 5
+
+    def get_next_link(self):
+        # steps one result short of the page size, so consecutive pages overlap
+        self.limit -= 1
+        link = super(StuffOverlappingPagination, self).get_next_link()
+        self.limit += 1
+        return link
+
+
+class StuffOverlappingViewSet(viewsets.ReadOnlyModelViewSet):
+    queryset = Stuff.objects.order_by('pk')
+    serializer_class = StuffSerializer
+    pagination_class = StuffOverlappingPagination
+
+
+class StuffFilteredViewSet(viewsets.ReadOnlyModelViewSet):
+    serializer_class = StuffSerializer
+    filter_backends = [filters.OrderingFilter]
+    ordering_fields = ['id', 'name']
+
+    def get_queryset(self):
+        queryset = Stuff.objects.all()
+        for field in ('id', 'name'):
+            if field in self.request.query_params:
+                queryset = queryset.filter(**{field: self.request.query_params[field]})
+        return queryset
+
+
 class StuffHyperlinkedViewSet(viewsets.ModelViewSet):
     queryset = Stuff.objects.all()
     serializer_class = StuffHyperlinkedSerializer
@@ -139,6 +268,11 @@ class RelatedStuffHyperlinkedViewSet(viewsets.ModelViewSet):
     paginate_by = 10
 
 
+class RelatedStuffNestedViewSet(viewsets.ReadOnlyModelViewSet):
+    queryset = RelatedStuff.objects.all()
+    serializer_class = RelatedStuffNestedSerializer
+
+
 class ManyRelatedStuffViewSet(viewsets.ModelViewSet):
     queryset = ManyRelatedStuff.objects.all()
     serializer_class = ManyRelatedStuffSerializer
@@ -149,3 +283,126 @@ class ManyRelatedStuffHyperlinkedViewSet(viewsets.ModelViewSet):
     queryset = ManyRelatedStuff.objects.all()
     serializer_class = ManyRelatedStuffHyperlinkedSerializer
     paginate_by = 10
+
+
+class StuffBulkView(generics.GenericAPIView):
+    queryset = Stuff.objects.all()
+    serializer_class = StuffBulkSerializer
+
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    def patch(self, request):
+        instances = self.get_queryset().filter(pk__in=[item['id'] for item in request.data])
+        serializer = self.get_serializer(instances, data=request.data, many=True, partial=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data)
+
+
+class StuffLoopBulkView(StuffBulkView):
+    # the default list serializer saves the objects one by one
+    serializer_class = StuffSerializer
+
+
+def stuff_ndjson(request):
+    def rows():
+        for obj in Stuff.objects.order_by('pk').iterator():
+            yield json.dumps({'id': obj.pk, 'name': obj.name}) + '\n'
+
+    return StreamingHttpResponse(rows(), content_type='application/x-ndjson')
+
+
+def stuff_ndjson_buffered(request):
+    content = ''.join(json.dumps({'id': obj.pk, 'name': obj.name}) + '\n' for obj in Stuff.objects.all())
+    return StreamingHttpResponse(iter([content]), content_type='application/x-ndjson')
+
+
+def stuff_csv(request):
+    def rows():
+        yield 'id,name\n'
+        for obj in Stuff.objects.order_by('pk').iterator():
+            # csv writes native strings on Python 2
+            line = six.StringIO()
+            csv.writer(line).writerow([obj.pk, obj.name])
+            yield line.getvalue()
+
+    return StreamingHttpResponse(rows(), content_type='text/csv')
+
+
+def conditional_get(test_func):
+    # the caching tests need responses with validators, and the handling of conditional requests
+    return override_settings(MIDDLEWARE=['django.middleware.http.ConditionalGetMiddleware'])(test_func)
+
+
+def transition_route(url_path):
+    if action is not None:
+        return action(detail=True, methods=['post'], url_path=url_path)
+
+    return detail_route(methods=['post'], url_path=url_path)
+
+
+if Order is not None:
+    class OrderFactory(object):
+        @classmethod
+        def create(cls, **kwargs):
+            return Order.objects.create(**kwargs)
+
+    class OrderSerializer(serializers.ModelSerializer):
+        class Meta:
+            model = Order
+            fields = ['id', 'status']
+
+    def order_transition(name):
+        def view(self, request, pk=None):
+            obj = self.get_object()
+            getattr(obj, name)()
+            obj.save()
+            return Response(OrderSerializer(obj).data)
+
+        view.__name__ = name
+        return transition_route(name)(view)
+
+    def locked_order_transition(name):
+        def view(self, request, pk=None):
+            with order_lock, transaction.atomic():
+                obj = self.get_queryset().select_for_update().get(pk=pk)
+                if not can_proceed(getattr(obj, name)):
+                    return Response(OrderSerializer(obj).data, status=status.HTTP_409_CONFLICT)
+                getattr(obj, name)()
+                obj.save()
+            return Response(OrderSerializer(obj).data)
+
+        view.__name__ = 'locked_' + name
+        return transition_route('locked-' + name)(view)
+
+    def racy_order_transition(name):
+        def view(self, request, pk=None):
+            obj = self.get_object()
+            # leaves time for the other requests to read the same state
+            time.sleep(0.05)
+            if not can_proceed(getattr(obj, name)):
+                return Response(OrderSerializer(obj).data, status=status.HTTP_409_CONFLICT)
+            getattr(obj, name)()
+            obj.save()
+            return Response(OrderSerializer(obj).data)
+
+        view.__name__ = 'racy_' + name
+        return transition_route('racy-' + name)(view)
+
+    class OrderViewSet(viewsets.ModelViewSet):
+        queryset = Order.objects.all()
+        serializer_class = OrderSerializer
+
+        pay = order_transition('pay')
+        ship = order_transition('ship')
+        cancel = order_transition('cancel')
+        reopen = order_transition('reopen')
+        review = order_transition('review')
+        archive = order_transition('archive')
+        touch = order_transition('touch')
+        locked_pay = locked_order_transition('pay')
+        racy_pay = racy_order_transition('pay')
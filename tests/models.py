@@ -1,6 +1,11 @@
 from django.db import models
 from rest_framework.reverse import reverse
 
+try:
+    from django_fsm import RETURN_VALUE, FSMField, transition
+except ImportError:
+    FSMField = None
+
 
 class Stuff(models.Model):
     name = models.CharField(max_length=200)
@@ -25,3 +30,40 @@ class ManyRelatedStuff(models.Model):
 
     class Meta:
         app_label = 'tests'
+
+
+if FSMField is not None:
+    class Order(models.Model):
+        status = FSMField(default='new', choices=[('new', 'new'), ('paid', 'paid'), ('shipped', 'shipped'),
+                                                  ('cancelled', 'cancelled'), ('archived', 'archived')])
+
+        class Meta:
+            app_label = 'tests'
+
+        @transition(field=status, source='new', target='paid')
+        def pay(self):
+            pass
+
+        @transition(field=status, source='paid', target='shipped')
+        def ship(self):
+            pass
+
+        @transition(field=status, source=['new', 'paid'], target='cancelled')
+        def cancel(self):
+            pass
+
+        @transition(field=status, source='cancelled', target='new')
+        def reopen(self):
+            pass
+
+        @transition(field=status, source='paid', target=RETURN_VALUE('paid', 'shipped'))
+        def review(self):
+            return 'shipped'
+
+        @transition(field=status, source='+', target='archived')
+        def archive(self):
+            pass
+
+        @transition(field=status, source='*', target=None)
+        def touch(self):
+            pass
@@ -0,0 +1,8 @@
+from django.conf.urls import include, url
+
+from tests.urls import router
+
+
+urlpatterns = [
+    url(r'^api/', include(router.urls)),
+]
@@ -0,0 +1,96 @@
+import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+import pytest
+from django.test import TestCase
+
+async_to_sync = pytest.importorskip('asgiref.sync').async_to_sync
+
+from rest_assured.async_testcases import AsyncClient, AsyncReadWriteRESTAPITestCaseMixin  # noqa: E402
+from tests import mocks  # noqa: E402
+from tests.models import Stuff  # noqa: E402
+
+
+@unittest.skipIf(AsyncClient is None, 'Async tests require Django 3.1 or later.')
+class TestAsyncTestCase(TestCase):
+    def get_case(self, **kwargs):
+        class MockAsyncTestCase(AsyncReadWriteRESTAPITestCaseMixin, mocks.MockTestCase):
+            base_name = 'stuff'
+            factory_class = mocks.StuffFactory
+            create_data = {'name': 'moar stuff'}
+            update_data = {'name': 'other things'}
+
+        self.case_class = MockAsyncTestCase
+
+        return MockAsyncTestCase(**kwargs)
+
+    def test_test_list(self):
+        instance = self.get_case(methodName='dummy')
+        instance.setUp()
+        response = async_to_sync(instance.test_list)()
+        assert response.status_code == 200
+
+    def test_test_detail(self):
+        instance = self.get_case(methodName='dummy')
+        instance.setUp()
+        response = async_to_sync(instance.test_detail)()
+        assert response.status_code == 200
+
+    def test_test_create(self):
+        instance = self.get_case(methodName='dummy')
+        instance.setUp()
+        response, created = async_to_sync(instance.test_create)()
+        assert isinstance(created, Stuff)
+        assert created.name == 'moar stuff'
+
+    def test_test_create_gets_data_once(self):
+        instance = self.get_case(methodName='dummy')
+        instance.setUp()
+        with mock.patch.object(instance, 'get_create_data', return_value={'name': 'fresh stuff'}) as get_create_data:
+            response, created = async_to_sync(instance.test_create)()
+        assert get_create_data.call_count == 1
+        assert created.name == 'fresh stuff'
+
+    def test_test_update(self):
+        instance = self.get_case(methodName='dummy')
+        instance.setUp()
+        response, updated = async_to_sync(instance.test_update)()
+        assert updated.name == 'other things'
+
+    def test_test_destroy(self):
+        instance = self.get_case(methodName='dummy')
+        instance.setUp()
+        response = async_to_sync(instance.test_destroy)()
+        assert response.status_code == 204
+
+    def test_async_send_request_checks_payload_and_latency(self):
+        instance = self.get_case(methodName='dummy')
+        instance.max_payload_bytes = {'detail': 1}
+        instance.setUp()
+        with self.assertRaises(AssertionError) as context:
+            async_to_sync(instance.test_detail)()
+        assert 'payload of detail response' in str(context.exception)
+
+        instance = self.get_case(methodName='dummy')
+        instance.latency_budget_ms = {'list': 0}
+        instance.setUp()
+        with self.assertRaises(AssertionError) as context:
+            async_to_sync(instance.test_list)()
+        assert 'latency of list request' in str(context.exception)
+
+    def test_assert_concurrent_requests(self):
+        instance = self.get_case(methodName='dummy')
+        instance.setUp()
+        responses, throughput = async_to_sync(instance.assert_concurrent_requests)('detail', 5)
+        assert len(responses) == 5
+        assert throughput > 0
+
+    def test_assert_concurrent_requests_with_min_throughput(self):
+        instance = self.get_case(methodName='dummy')
+        instance.setUp()
+        with self.assertRaises(AssertionError):
+            async_to_sync(instance.assert_concurrent_requests)('list', 3, min_throughput=float('inf'))
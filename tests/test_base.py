@@ -15,3 +15,20 @@ class TestBaseTestCase:
         instance.setUp()
         assert isinstance(instance.user, mocks.MockUser)
         assert instance.client.handler._force_user is instance.user
+
+    def test_class_fixtures(self):
+        class MockClassFixturesTestCase(mocks.MockTestCase):
+            class_fixtures = True
+
+        MockClassFixturesTestCase.setUpTestData()
+        class_object = MockClassFixturesTestCase._class_object
+        class_user = MockClassFixturesTestCase._class_user
+        assert isinstance(class_object, mocks.MockObject)
+        assert isinstance(class_user, mocks.MockUser)
+
+        instance = MockClassFixturesTestCase(methodName='dummy')
+        instance.setUp()
+        assert isinstance(instance.object, mocks.MockObject)
+        assert instance.object is not class_object
+        assert instance.user is class_user
+        assert instance.client.handler._force_user is instance.user
@@ -0,0 +1,69 @@
+import json
+import os
+import shutil
+import tempfile
+
+from django.test import TestCase
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from rest_assured.benchmark import BenchmarkAPITestCaseMixin, save_baseline
+from rest_assured.testcases import ReadWriteRESTAPITestCaseMixin
+from tests import mocks
+
+
+class TestBenchmarkTestCase(TestCase):
+    def get_case(self, **kwargs):
+        class MockBenchmarkTestCase(BenchmarkAPITestCaseMixin, ReadWriteRESTAPITestCaseMixin, mocks.MockTestCase):
+            base_name = 'stuff'
+            factory_class = mocks.StuffFactory
+            create_data = {'name': 'moar stuff'}
+            update_data = {'name': 'other things'}
+            benchmark_warmup = 1
+            benchmark_iterations = 3
+
+        self.case_class = MockBenchmarkTestCase
+
+        return MockBenchmarkTestCase(**kwargs)
+
+    def get_baseline_path(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        return os.path.join(directory, 'baseline.json')
+
+    def test_get_benchmark_operations(self):
+        instance = self.get_case(methodName='dummy')
+        assert instance.get_benchmark_operations() == ['list', 'detail', 'create', 'update', 'destroy']
+
+    def test_benchmark(self):
+        instance = self.get_case(methodName='dummy')
+        instance.setUp()
+        stats = instance.benchmark('destroy')
+        assert stats['count'] == 3
+        assert stats['min'] <= stats['p50'] <= stats['max']
+
+    def test_test_benchmark_saves_baseline(self):
+        path = self.get_baseline_path()
+        instance = self.get_case(methodName='dummy')
+        instance.benchmark_baseline = path
+        instance.setUp()
+        with mock.patch.dict(os.environ, {'REST_ASSURED_BENCHMARK_SAVE': '1'}):
+            results = instance.test_benchmark()
+
+        with open(path) as baseline:
+            assert sorted(json.load(baseline)) == sorted(results)
+
+    def test_test_benchmark_detects_regressions(self):
+        path = self.get_baseline_path()
+        save_baseline(path, {'stuff.list': {'mean': 0.0}})
+
+        instance = self.get_case(methodName='dummy')
+        instance.benchmark_baseline = path
+        instance.benchmark_operations = ['list']
+        instance.setUp()
+        with self.assertRaises(AssertionError) as context:
+            instance.test_benchmark()
+        assert 'stuff.list' in str(context.exception)
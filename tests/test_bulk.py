@@ -0,0 +1,90 @@
+from django.test import TestCase
+
+from rest_assured.testcases import BulkCreateAPITestCaseMixin, BulkUpdateAPITestCaseMixin
+from tests import mocks
+from tests.models import RelatedStuff, Stuff
+
+
+class TestBulkTestCase(TestCase):
+    def get_case(self, **kwargs):
+        class MockBulkTestCase(BulkCreateAPITestCaseMixin, BulkUpdateAPITestCaseMixin, mocks.MockTestCase):
+            base_name = 'stuff-bulk'
+            factory_class = mocks.StuffSequenceFactory
+            bulk_fields = ['name', 'answer']
+            bulk_create_lookup_field = 'name'
+            bulk_update_data = {'answer': 7}
+
+        self.case_class = MockBulkTestCase
+
+        return MockBulkTestCase(**kwargs)
+
+    def test_get_bulk_create_data(self):
+        instance = self.get_case(methodName='dummy')
+        data = instance.get_bulk_create_data(3)
+        assert len(data) == 3
+        assert len(set(item['name'] for item in data)) == 3
+        assert data[0]['answer'] == 42
+
+    def test_get_bulk_item_data_saves_related_objects(self):
+        instance = self.get_case(methodName='dummy')
+        instance.bulk_fields = ['thing']
+        data = instance.get_bulk_item_data(RelatedStuff(thing=Stuff(name='built stuff')))
+        assert data == {'thing': Stuff.objects.get(name='built stuff').pk}
+
+    def test_test_bulk_create(self):
+        instance = self.get_case(methodName='dummy')
+        instance.setUp()
+        response, created = instance.test_bulk_create()
+        assert len(created) == instance.bulk_create_size
+        assert all(isinstance(obj, Stuff) for obj in created)
+
+    def test_test_bulk_create_matches_response_ids(self):
+        instance = self.get_case(methodName='dummy')
+        instance.base_name = 'stuff-bulk-loop'
+        instance.bulk_create_lookup_field = None
+        instance.setUp()
+        response, created = instance.test_bulk_create()
+        assert [obj.pk for obj in created] == [item['id'] for item in response.data]
+
+    def test_test_bulk_create_without_response_ids(self):
+        instance = self.get_case(methodName='dummy')
+        instance.bulk_create_lookup_field = None
+        instance.bulk_create_response_lookup_field = 'uuid'
+        instance.setUp()
+        with self.assertRaises(AssertionError) as context:
+            instance.test_bulk_create()
+        assert 'set bulk_create_lookup_field' in str(context.exception)
+
+    def test_test_bulk_create_scaling(self):
+        instance = self.get_case(methodName='dummy')
+        instance.bulk_create_scaling = (2, 5)
+        instance.setUp()
+        instance.test_bulk_create()
+        assert instance.bulk_stats['bulk_create'][2]['queries'] == instance.bulk_stats['bulk_create'][10]['queries']
+
+    def test_test_bulk_create_scaling_fails_without_batching(self):
+        instance = self.get_case(methodName='dummy')
+        instance.base_name = 'stuff-bulk-loop'
+        instance.bulk_create_scaling = (2, 5)
+        instance.setUp()
+        with self.assertRaises(AssertionError) as context:
+            instance.test_bulk_create()
+        assert 'Number of queries of bulk_create request grows with the batch size' in str(context.exception)
+
+    def test_test_bulk_update(self):
+        instance = self.get_case(methodName='dummy')
+        instance.bulk_update_scaling = (2, 5)
+        instance.setUp()
+        response, updated = instance.test_bulk_update()
+        assert len(updated) == instance.bulk_update_size
+        assert updated[0].pk == instance.object.pk
+        assert set(Stuff.objects.values_list('answer', flat=True)) == {7}
+
+    def test_test_bulk_update_wrong_results(self):
+        instance = self.get_case(methodName='dummy')
+        instance.setUp()
+        data = instance.get_bulk_update_data(3)
+        instance.get_bulk_update_response(data)
+        data[1]['answer'] = 8
+        with self.assertRaises(AssertionError):
+            instance.check_bulk_rows(data, 'id')
@@ -1,5 +1,12 @@
+import os
+
 from django.test import TestCase
 
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
 from rest_assured.testcases import CreateAPITestCaseMixin
 from tests import mocks
 from tests.models import Stuff
@@ -62,3 +69,30 @@ class TestCreateTestCase(TestCase):
         assert isinstance(created, Stuff)
         assert response.data['name'] == created.name
         assert response.data['url']
+
+    def test_test_create_exceeds_max_queries(self):
+        instance = self.get_case(methodName='dummy')
+        instance.max_queries = {'create': 0, 'list': 0}
+        instance.setUp()
+        with self.assertRaises(AssertionError) as context:
+            instance.test_create()
+        assert 'INSERT' in str(context.exception)
+
+    def test_test_create_with_worker_unique_fields(self):
+        instance = self.get_case(methodName='dummy')
+        instance.worker_unique_fields = ['name']
+        instance.setUp()
+        with mock.patch.dict(os.environ, {'PYTEST_XDIST_WORKER': 'gw1'}):
+            assert instance.worker_id == 'gw1'
+            assert instance.get_create_data() == {'name': 'gw1-moar stuff'}
+            response, created = instance.test_create()
+        assert created.name == 'gw1-moar stuff'
+        assert self.case_class.create_data == {'name': 'moar stuff'}
+
+    def test_test_create_gets_data_once(self):
+        instance = self.get_case(methodName='dummy')
+        instance.setUp()
+        with mock.patch.object(instance, 'get_create_data', return_value={'name': 'fresh stuff'}) as get_create_data:
+            response, created = instance.test_create()
+        assert get_create_data.call_count == 1
+        assert created.name == 'fresh stuff'
@@ -1,5 +1,11 @@
-from django.test import TestCase
+import json
+import os
+import tempfile
 
+from django.test import TestCase, override_settings
+from django.urls import NoReverseMatch
+
+from rest_assured import testcases
 from rest_assured.testcases import DetailAPITestCaseMixin
 from tests import mocks
 
@@ -19,6 +25,36 @@ class TestDetailTestCase(TestCase):
         instance.setUp()
         assert instance.get_detail_url() == '/stuff/%s/' % instance.object.pk
 
+    def test_get_detail_url_is_cached(self):
+        instance = self.get_case(methodName='dummy')
+        instance.setUp()
+        testcases._url_cache.clear()
+        assert instance.get_detail_url() == '/stuff/%s/' % instance.object.pk
+        assert len(testcases._url_cache) == 1
+
+        other = mocks.StuffFactory.create()
+        assert instance.reverse_url('stuff-detail', other.pk) == '/stuff/%s/' % other.pk
+        assert len(testcases._url_cache) == 1
+
+    def test_reverse_url_validates_lookup(self):
+        instance = self.get_case(methodName='dummy')
+        instance.setUp()
+        assert instance.reverse_url('stuff-detail', 'a b') == '/stuff/a%20b/'
+        with self.assertRaises(NoReverseMatch):
+            instance.reverse_url('stuff-detail', 'a.b')
+        with self.assertRaises(NoReverseMatch):
+            instance.reverse_url('stuff-detail', 'a/b')
+
+    def test_get_detail_url_with_overridden_urlconf(self):
+        instance = self.get_case(methodName='dummy')
+        instance.setUp()
+        assert instance.get_detail_url() == '/stuff/%s/' % instance.object.pk
+
+        with override_settings(ROOT_URLCONF='tests.prefixed_urls'):
+            assert instance.get_detail_url() == '/api/stuff/%s/' % instance.object.pk
+
+        assert instance.get_detail_url() == '/stuff/%s/' % instance.object.pk
+
     def test_get_detail_response(self):
         instance = self.get_case(methodName='dummy')
         instance.setUp()
@@ -36,3 +72,107 @@ class TestDetailTestCase(TestCase):
         instance.setUp()
         response = instance.test_detail()
         assert response
+
+    def test_test_detail_with_class_fixtures(self):
+        instance = self.get_case(methodName='dummy')
+        self.case_class.class_fixtures = True
+        self.case_class.setUpTestData()
+        with self.assertNumQueries(0):
+            instance.setUp()
+        assert instance.object.pk == self.case_class._class_object.pk
+        response = instance.test_detail()
+        assert response
+
+    def test_test_detail_within_latency_budget(self):
+        report = tempfile.NamedTemporaryFile(suffix='.jsonl', delete=False)
+        report.close()
+        self.addCleanup(os.remove, report.name)
+
+        instance = self.get_case(methodName='dummy')
+        instance.latency_budget_ms = {'detail': {'p50': 10000, 'p95': 10000}}
+        instance.latency_repeat = 5
+        instance.latency_report = report.name
+        instance.setUp()
+        response = instance.test_detail()
+        assert response
+
+        with open(report.name) as lines:
+            record = json.loads(lines.readline())
+        assert record['operation'] == 'detail'
+        assert record['base_name'] == 'stuff'
+        assert record['count'] == 5
+
+    def test_get_latency_repeat(self):
+        instance = self.get_case(methodName='dummy')
+        instance.latency_repeat = 5
+        assert instance.get_latency_repeat('detail', 'get') == 0
+        instance.latency_budget_ms = {'detail': 100}
+        assert instance.get_latency_repeat('detail', 'get') == 4
+        assert instance.get_latency_repeat('detail', 'post') == 0
+
+    def test_test_detail_exceeds_latency_budget(self):
+        instance = self.get_case(methodName='dummy')
+        instance.latency_budget_ms = {'detail': 0}
+        instance.latency_repeat = 2
+        instance.setUp()
+        with self.assertRaises(AssertionError) as context:
+            instance.test_detail()
+        assert 'p95 latency of detail request' in str(context.exception)
+
+    def test_test_detail_measures_payload(self):
+        instance = self.get_case(methodName='dummy')
+        instance.measure_payload = True
+        instance.setUp()
+        response = instance.test_detail()
+        sizes = instance.payload_sizes['detail']
+        assert sizes['raw'] == len(response.content)
+        assert sizes['gzip'] > 0
+
+    def test_test_detail_exceeds_max_payload(self):
+        instance = self.get_case(methodName='dummy')
+        instance.max_payload_bytes = {'detail': {'raw': 10000, 'gzip': 10}}
+        instance.setUp()
+        with self.assertRaises(AssertionError) as context:
+            instance.test_detail()
+        assert 'gzip payload of detail response' in str(context.exception)
+
+    @mocks.conditional_get
+    def test_test_detail_with_conditional_get(self):
+        instance = self.get_case(methodName='dummy')
+        instance.cache_headers = ['ETag']
+        instance.check_conditional_get = True
+        instance.setUp()
+        response = instance.test_detail()
+        assert instance.get_conditional_headers(response) == {'HTTP_IF_NONE_MATCH': response['ETag']}
+
+    def test_test_detail_missing_cache_headers(self):
+        instance = self.get_case(methodName='dummy')
+        instance.cache_headers = ['Cache-Control']
+        instance.setUp()
+        with self.assertRaises(AssertionError) as context:
+            instance.test_detail()
+        assert 'Cache-Control' in str(context.exception)
+
+    def test_test_detail_in_memory(self):
+        instance = self.get_case(methodName='dummy')
+        self.addCleanup(instance.doCleanups)
+        instance.in_memory = True
+        instance.attributes_to_check = ['id', 'name']
+        with self.assertNumQueries(0):
+            instance.setUp()
+            instance.test_detail()
+        assert instance.object.pk is not None
+        assert mocks.StuffViewSet in instance.get_view_classes()
+
+        # the views are restored by the cleanups
+        instance.doCleanups()
+        assert 'get_object' not in vars(mocks.StuffViewSet)
+        assert instance.get_detail_response().status_code == 404
+
+    def test_test_detail_in_memory_checks_lookup(self):
+        instance = self.get_case(methodName='dummy')
+        self.addCleanup(instance.doCleanups)
+        instance.in_memory = True
+        instance.setUp()
+        response = instance.client.get(instance.reverse_url('stuff-detail', instance.object.pk + 1))
+        assert response.status_code == 404
@@ -0,0 +1,130 @@
+import unittest
+from collections import OrderedDict
+
+from django.test import LiveServerTestCase, TestCase
+
+from rest_assured.contrib.drf_fsm_transitions import TransitionAPITestCaseMixin
+from tests import mocks
+
+
+class TestTransitionPaths(TestCase):
+    def get_case(self, **kwargs):
+        class MockTransitionTestCase(TransitionAPITestCaseMixin, mocks.MockTestCase):
+            base_name = 'stuff'
+
+            def get_transition_graph(self, attribute=None):
+                return OrderedDict([
+                    ('a', [('go', 'b')]),
+                    ('b', [('on', 'c'), ('back', 'a')]),
+                    ('c', []),
+                    ('d', [('jump', 'a')]),
+                ])
+
+        return MockTransitionTestCase(**kwargs)
+
+    def test_get_transition_paths(self):
+        instance = self.get_case(methodName='dummy')
+        assert instance.get_transition_paths(initial='a') == [
+            ('a', [('go', 'b'), ('on', 'c')]),
+            ('b', [('back', 'a')]),
+        ]
+
+    def test_get_transition_paths_from_dead_end(self):
+        instance = self.get_case(methodName='dummy')
+        assert instance.get_transition_paths(initial='c') == []
+
+
+@unittest.skipIf(mocks.Order is None, 'Requires django-fsm.')
+class TestTransitionTestCase(TestCase):
+    def get_case(self, **kwargs):
+        class MockTransitionTestCase(TransitionAPITestCaseMixin, mocks.MockTestCase):
+            base_name = 'order'
+            factory_class = mocks.OrderFactory
+
+        self.case_class = MockTransitionTestCase
+
+        return MockTransitionTestCase(**kwargs)
+
+    def test_transition(self):
+        instance = self.get_case(methodName='dummy')
+        instance.setUp()
+        response = instance.transition('paid', 'pay')
+        assert response.data['status'] == 'paid'
+
+    def test_get_transition_graph(self):
+        instance = self.get_case(methodName='dummy')
+        instance.setUp()
+        graph = instance.get_transition_graph()
+        assert list(graph) == ['new', 'paid', 'shipped', 'cancelled', 'archived']
+        assert sorted(graph['new']) == [('archive', 'archived'), ('cancel', 'cancelled'), ('pay', 'paid'),
+                                        ('touch', 'new')]
+        # the dynamic target of ``review`` is left out
+        assert sorted(graph['paid']) == [('archive', 'archived'), ('cancel', 'cancelled'), ('ship', 'shipped'),
+                                         ('touch', 'paid')]
+        assert sorted(graph['cancelled']) == [('archive', 'archived'), ('reopen', 'new'), ('touch', 'cancelled')]
+        # ``'+'`` sources exclude the target
+        assert graph['archived'] == [('touch', 'archived')]
+
+    def test_get_transition_graph_with_exclude(self):
+        instance = self.get_case(methodName='dummy')
+        instance.transition_exclude = ['touch', 'archive']
+        instance.setUp()
+        graph = instance.get_transition_graph()
+        assert sorted(graph['new']) == [('cancel', 'cancelled'), ('pay', 'paid')]
+        assert graph['shipped'] == graph['archived'] == []
+
+    def test_get_transition_paths(self):
+        instance = self.get_case(methodName='dummy')
+        instance.setUp()
+        graph = instance.get_transition_graph()
+        edges = []
+        for source, path in instance.get_transition_paths():
+            for name, target in path:
+                assert (name, target) in graph[source]
+                edges.append((source, name, target))
+                source = target
+
+        # every transition is taken exactly once
+        assert sorted(edges) == sorted((source, name, target) for source in graph for name, target in graph[source])
+
+    def test_walk_transitions(self):
+        instance = self.get_case(methodName='dummy')
+        instance.transition_exclude = ['touch']
+        instance.setUp()
+        stats = instance.walk_transitions()
+        assert len(stats) == 9
+        assert stats is instance.transition_stats
+        assert all(item['queries'] > 0 and item['latency'] > 0 for item in stats)
+
+    def test_walk_transitions_failure(self):
+        instance = self.get_case(methodName='dummy')
+        instance.setUp()
+        instance.get_transition_graph = lambda attribute=None: OrderedDict([('new', [('pay', 'shipped')])])
+        with self.assertRaises(AssertionError):
+            instance.walk_transitions()
+
+
+@unittest.skipIf(mocks.Order is None, 'Requires django-fsm.')
+class TestRaceTransitionsTestCase(LiveServerTestCase):
+    def get_case(self, **kwargs):
+        class MockTransitionTestCase(TransitionAPITestCaseMixin, mocks.MockTestCase):
+            base_name = 'order'
+            factory_class = mocks.OrderFactory
+
+        return MockTransitionTestCase(**kwargs)
+
+    def test_race_transitions(self):
+        instance = self.get_case(methodName='dummy')
+        instance.setUp()
+        winner, responses = instance.race_transitions(['locked-pay'] * 4, from_state='new',
+                                                      live_server_url=self.live_server_url)
+        assert winner.status_code == 200
+        assert sorted(response.status_code for response in responses) == [200, 409, 409, 409]
+        assert mocks.Order.objects.get(pk=instance.object.pk).status == winner.data['status']
+
+    def test_race_transitions_without_locking(self):
+        instance = self.get_case(methodName='dummy')
+        instance.setUp()
+        with self.assertRaises(AssertionError) as context:
+            instance.race_transitions(['racy-pay'] * 4, from_state='new', live_server_url=self.live_server_url)
+        assert 'Expected exactly one transition to succeed' in str(context.exception)
@@ -0,0 +1,54 @@
+from rest_assured import explain
+
+
+class TestExplain:
+    def test_find_plan_problems_sqlite(self):
+        plan = [
+            {'id': 2, 'parent': 0, 'notused': 0, 'detail': 'SCAN tests_stuff'},
+            {'id': 9, 'parent': 0, 'notused': 0, 'detail': 'USE TEMP B-TREE FOR ORDER BY'},
+        ]
+        assert explain.find_plan_problems('sqlite', plan) == [
+            ('scan', 'tests_stuff', 'SCAN tests_stuff'),
+            ('filesort', 'tests_stuff', 'USE TEMP B-TREE FOR ORDER BY'),
+        ]
+
+    def test_find_plan_problems_sqlite_index(self):
+        plan = [
+            {'detail': 'SEARCH TABLE tests_stuff USING INTEGER PRIMARY KEY (rowid=?)'},
+            {'detail': 'SCAN TABLE tests_relatedstuff USING COVERING INDEX tests_relatedstuff_thing_id'},
+        ]
+        assert explain.find_plan_problems('sqlite', plan) == []
+
+    def test_find_plan_problems_sqlite_index_scan_of_filtered_query(self):
+        # e.g. ``WHERE name = ? ORDER BY rel``, which reads all of the index to find the matching rows
+        plan = [{'detail': 'SCAN t USING INDEX t_rel'}]
+        assert explain.find_plan_problems('sqlite', plan) == []
+        assert explain.find_plan_problems('sqlite', plan, filtered=True) == [('scan', 't', 'SCAN t USING INDEX t_rel')]
+
+    def test_find_plan_problems_sqlite_subquery(self):
+        plan = [
+            {'detail': 'CO-ROUTINE sub'},
+            {'detail': 'SEARCH tests_stuff USING INTEGER PRIMARY KEY (rowid>?)'},
+            {'detail': 'SCAN sub'},
+            {'detail': 'MATERIALIZE 1'},
+            {'detail': 'SCAN tests_relatedstuff'},
+            {'detail': 'SCAN SUBQUERY 1'},
+            {'detail': 'SCAN subquery_2'},
+        ]
+        assert explain.find_plan_problems('sqlite', plan) == [
+            ('scan', 'tests_relatedstuff', 'SCAN tests_relatedstuff'),
+        ]
+
+    def test_find_plan_problems_postgresql(self):
+        plan = [
+            {'QUERY PLAN': 'Sort  (cost=1.02..1.03 rows=1 width=4)'},
+            {'QUERY PLAN': '  Sort Key: name'},
+            {'QUERY PLAN': '  ->  Seq Scan on tests_stuff  (cost=0.00..1.01 rows=1 width=4)'},
+        ]
+        assert [problem[:2] for problem in explain.find_plan_problems('postgresql', plan)] == [
+            ('filesort', 'tests_stuff'), ('scan', 'tests_stuff')]
+
+    def test_find_plan_problems_mysql(self):
+        plan = [{'table': 'tests_stuff', 'type': 'ALL', 'key': None, 'Extra': 'Using where; Using filesort'}]
+        assert [problem[:2] for problem in explain.find_plan_problems('mysql', plan)] == [
+            ('scan', 'tests_stuff'), ('filesort', 'tests_stuff')]
@@ -1,7 +1,21 @@
+import unittest
+
+from django.db import connection
 from django.test import TestCase
 
-from rest_assured.testcases import ListAPITestCaseMixin
+from rest_assured.testcases import ListAPITestCaseMixin, StreamingListAPITestCaseMixin
 from tests import mocks
+from tests.models import Stuff, RelatedStuff
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
 
 
 class TestListTestCase(TestCase):
@@ -32,3 +46,313 @@ class TestListTestCase(TestCase):
         instance.setUp()
         response = instance.test_list()
         assert response
+
+    def test_test_list_within_max_queries(self):
+        instance = self.get_case(methodName='dummy')
+        instance.max_queries = {'list': 1}
+        instance.setUp()
+        response = instance.test_list()
+        assert response
+
+    def test_test_list_exceeds_max_queries(self):
+        instance = self.get_case(methodName='dummy')
+        instance.max_queries = {'list': 0}
+        instance.setUp()
+        with self.assertRaises(AssertionError) as context:
+            instance.test_list()
+        assert 'tests_stuff' in str(context.exception)
+
+    def test_test_list_query_scaling(self):
+        instance = self.get_case(methodName='dummy')
+        instance.list_query_scaling = (2, 5)
+        instance.setUp()
+        response = instance.test_list()
+        assert response
+
+    def test_check_list_query_scaling_reports_repeated_queries(self):
+        class MockNestedListTestCase(ListAPITestCaseMixin, mocks.MockTestCase):
+            base_name = 'relatedstuff-nested'
+            factory_class = mocks.RelatedStuffFactory
+
+        instance = MockNestedListTestCase(methodName='dummy')
+        instance.setUp()
+        with self.assertRaises(AssertionError) as context:
+            instance.check_list_query_scaling(2, 3)
+        assert '"tests_stuff"."id" = ?' in str(context.exception)
+
+    def test_create_list_objects_bulk(self):
+        instance = self.get_case(methodName='dummy')
+        with self.assertNumQueries(1):
+            created = instance.create_list_objects(20)
+        assert len(created) == 20
+        assert Stuff.objects.count() == 20
+
+    def test_create_list_objects_without_bulk(self):
+        instance = self.get_case(methodName='dummy')
+        instance.list_seed_bulk = False
+        with self.assertNumQueries(3):
+            created = instance.create_list_objects(3)
+        assert all(obj.pk for obj in created)
+
+    def test_create_list_objects_falls_back_to_create(self):
+        instance = self.get_case(methodName='dummy')
+        instance.factory_class = mocks.RelatedStuffFactory
+        with self.assertNumQueries(6):
+            created = instance.create_list_objects(3)
+        assert RelatedStuff.objects.count() == 3
+        assert all(obj.pk for obj in created)
+
+    def test_test_list_with_seeded_pages(self):
+        instance = self.get_case(methodName='dummy')
+        instance.base_name = 'stuff-paginated'
+        instance.pagination_results_field = 'results'
+        instance.list_seed_count = 12
+        instance.setUp()
+        response = instance.test_list()
+        assert response
+        assert response.data['count'] == 13
+        assert len(instance.check_list_pages(response)) == 13
+
+    def test_check_list_pages_records_page_stats(self):
+        instance = self.get_case(methodName='dummy')
+        instance.base_name = 'stuff-cursor'
+        instance.pagination_results_field = 'results'
+        instance.setUp()
+        instance.create_list_objects(11)
+        results = instance.check_list_pages()
+        assert len(results) == 12
+        assert [stats['page'] for stats in instance.list_page_stats] == [1, 2, 3]
+        assert [stats['results'] for stats in instance.list_page_stats] == [5, 5, 2]
+        assert all(stats['queries'] >= 1 for stats in instance.list_page_stats)
+        if hasattr(connection, 'execute_wrapper'):
+            assert all(stats['query_time'] >= 0 for stats in instance.list_page_stats)
+        else:
+            assert all(stats['query_time'] is None for stats in instance.list_page_stats)
+
+    def test_check_list_pages_duplicates(self):
+        instance = self.get_case(methodName='dummy')
+        instance.base_name = 'stuff-overlapping'
+        instance.pagination_results_field = 'results'
+        instance.setUp()
+        instance.create_list_objects(6)
+        with self.assertRaises(AssertionError) as context:
+            instance.check_list_pages()
+        assert 'appears on more than one page' in str(context.exception)
+
+    def test_check_list_pages_duplicates_without_unique_field(self):
+        instance = self.get_case(methodName='dummy')
+        instance.base_name = 'stuff-overlapping'
+        instance.pagination_results_field = 'results'
+        instance.list_unique_field = 'uuid'
+        instance.setUp()
+        instance.create_list_objects(6)
+        with self.assertRaises(AssertionError) as context:
+            instance.check_list_pages()
+        # only the total number of results tells them apart
+        assert 'Pages have' in str(context.exception)
+
+    def test_get_list_index_params(self):
+        instance = self.get_case(methodName='dummy')
+        instance.list_filter_params = {'name': 'stuff'}
+        instance.list_ordering_params = ['id', '-name']
+        assert instance.get_list_index_params() == [
+            {'name': 'stuff'}, {'ordering': 'id'}, {'ordering': '-name'},
+            {'name': 'stuff', 'ordering': 'id'}, {'name': 'stuff', 'ordering': '-name'}]
+
+    def test_test_list_checks_indexes(self):
+        instance = self.get_case(methodName='dummy')
+        instance.base_name = 'stuff-filtered'
+        instance.list_filter_params = {'id': 1}
+        instance.list_ordering_params = ['id']
+        instance.setUp()
+        instance.test_list()
+
+        checked = instance.check_list_indexes()
+        assert [item['params'] for item in checked] == [{'id': 1}, {'ordering': 'id'}, {'id': 1, 'ordering': 'id'}]
+        assert not any(item['problems'] for item in checked)
+
+    def test_test_list_without_checking_indexes(self):
+        instance = self.get_case(methodName='dummy')
+        instance.base_name = 'stuff-filtered'
+        instance.list_filter_params = {'id': 1}
+        instance.setUp()
+        with mock.patch('rest_assured.testcases._can_explain', return_value=False), \
+                mock.patch.object(instance, 'check_list_indexes') as check_list_indexes:
+            response = instance.test_list()
+        assert response
+        assert not check_list_indexes.called
+
+    def test_check_list_indexes_flags_scans_and_sorts(self):
+        instance = self.get_case(methodName='dummy')
+        instance.base_name = 'stuff-filtered'
+        instance.setUp()
+        with self.assertRaises(AssertionError) as context:
+            instance.check_list_indexes([{'name': 'name of stuff'}, {'ordering': 'name'}])
+        assert "{'name': 'name of stuff'}" in str(context.exception)
+        assert 'scan of tests_stuff' in str(context.exception)
+        assert 'filesort of tests_stuff' in str(context.exception)
+
+    def test_check_list_indexes_threshold(self):
+        instance = self.get_case(methodName='dummy')
+        instance.base_name = 'stuff-filtered'
+        instance.list_scan_threshold = 2
+        instance.setUp()
+        checked = instance.check_list_indexes([{'name': 'name of stuff'}])
+        assert checked[0]['problems'] == []
+
+    @unittest.skipUnless(hasattr(connection, 'execute_wrapper'), 'Requires Django 2.0 or later.')
+    def test_check_list_pages_slowdown(self):
+        instance = self.get_case(methodName='dummy')
+        instance.base_name = 'stuff-paginated'
+        instance.pagination_results_field = 'results'
+        instance.list_page_slowdown = 0
+        instance.setUp()
+        instance.create_list_objects(6)
+        with self.assertRaises(AssertionError) as context:
+            instance.check_list_pages()
+        assert 'Queries of page 2 took' in str(context.exception)
+
+    def test_test_list_tracks_memory(self):
+        instance = self.get_case(methodName='dummy')
+        instance.track_memory = True
+        instance.memory_top_sites = 3
+        instance.setUp()
+        response = instance.test_list()
+        assert response
+        assert instance.memory_stats['list']['peak'] > 0
+        assert len(instance.memory_stats['list']['top']) == 3
+
+    @unittest.skipUnless(hasattr(tracemalloc, 'reset_peak'), 'Requires tracemalloc.reset_peak().')
+    def test_test_list_resets_peak_memory(self):
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+        blob = bytearray(10 * 1024 * 1024)
+        del blob
+
+        instance = self.get_case(methodName='dummy')
+        instance.track_memory = True
+        instance.setUp()
+        instance.test_list()
+        assert 0 < instance.memory_stats['list']['peak'] < 10 * 1024 * 1024
+
+    @unittest.skipUnless(hasattr(tracemalloc, 'reset_peak'), 'Requires tracemalloc.reset_peak().')
+    def test_assert_max_memory_nested(self):
+        instance = self.get_case(methodName='dummy')
+        instance.track_memory = True
+        with instance.assert_max_memory('outer'):
+            blob = bytearray(4 * 1024 * 1024)
+            del blob
+            with instance.assert_max_memory('inner'):
+                pass
+        assert instance.memory_stats['outer']['peak'] >= 4 * 1024 * 1024
+        assert instance.memory_stats['inner']['peak'] < 4 * 1024 * 1024
+
+    @unittest.skipIf(tracemalloc is None, 'Requires tracemalloc.')
+    def test_test_list_without_reset_peak(self):
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+        without_reset_peak = mock.Mock(wraps=tracemalloc, spec=[name for name in dir(tracemalloc)
+                                                                if name != 'reset_peak'])
+
+        instance = self.get_case(methodName='dummy')
+        instance.max_memory_kb = {'list': 1000}
+        instance.setUp()
+        with mock.patch('rest_assured.testcases.tracemalloc', without_reset_peak):
+            with self.assertRaises(unittest.SkipTest):
+                instance.test_list()
+        assert instance.memory_stats['list']['peak'] is None
+
+    def test_test_list_exceeds_max_memory(self):
+        instance = self.get_case(methodName='dummy')
+        instance.max_memory_kb = {'list': 0}
+        instance.setUp()
+        with self.assertRaises(AssertionError) as context:
+            instance.test_list()
+        assert 'Top allocation sites' in str(context.exception)
+
+    @mocks.conditional_get
+    def test_test_list_with_conditional_get(self):
+        instance = self.get_case(methodName='dummy')
+        instance.check_conditional_get = True
+        instance.setUp()
+        response = instance.test_list()
+        assert response
+
+    @mocks.conditional_get
+    def test_test_list_with_conditional_get_keeps_kwargs(self):
+        instance = self.get_case(methodName='dummy')
+        instance.check_conditional_get = True
+        instance.setUp()
+        with mock.patch.object(instance, 'get_list_response', wraps=instance.get_list_response) as get_list_response:
+            instance.test_list(data={'name': 'name of stuff'})
+        assert get_list_response.call_count == 2
+        assert get_list_response.call_args[1]['data'] == {'name': 'name of stuff'}
+        assert 'HTTP_IF_NONE_MATCH' in get_list_response.call_args[1]
+
+    def test_test_list_in_memory(self):
+        instance = self.get_case(methodName='dummy')
+        self.addCleanup(instance.doCleanups)
+        instance.in_memory = True
+        with self.assertNumQueries(0):
+            instance.setUp()
+            response = instance.test_list()
+        assert response.data[0]['name'] == instance.object.name
+
+
+class TestStreamingListTestCase(TestCase):
+    def get_case(self, **kwargs):
+        class MockStreamingListTestCase(StreamingListAPITestCaseMixin, mocks.MockTestCase):
+            base_name = kwargs.pop('base_name', 'stuff-ndjson')
+            factory_class = mocks.StuffFactory
+            list_seed_count = 4
+
+        self.case_class = MockStreamingListTestCase
+
+        return MockStreamingListTestCase(**kwargs)
+
+    def test_test_list(self):
+        instance = self.get_case(methodName='dummy')
+        instance.max_stream_memory_kb = 10000
+        instance.setUp()
+        response = instance.test_list()
+        assert response
+        assert instance.stream_stats['rows'] == 5
+        assert instance.stream_stats['chunks'] == 5
+        assert 0 < instance.stream_stats['ttfb'] <= instance.stream_stats['total']
+        assert instance.stream_stats['peak_memory'] > 0
+
+    @unittest.skipUnless(hasattr(tracemalloc, 'reset_peak'), 'Requires tracemalloc.reset_peak().')
+    def test_test_list_resets_peak_memory(self):
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+        blob = bytearray(10 * 1024 * 1024)
+        del blob
+
+        instance = self.get_case(methodName='dummy')
+        instance.max_stream_memory_kb = 10000
+        instance.setUp()
+        instance.test_list()
+        assert 0 < instance.stream_stats['peak_memory'] < 10 * 1024 * 1024
+
+    def test_test_list_csv(self):
+        rows = []
+        instance = self.get_case(methodName='dummy', base_name='stuff-csv')
+        instance.stream_format = 'csv'
+        instance.validate_stream_row = rows.append
+        instance.setUp()
+        instance.test_list()
+        assert len(rows) == 5
+        assert rows[0] == {'id': str(instance.object.pk), 'name': 'name of stuff'}
+
+    def test_test_list_buffered(self):
+        instance = self.get_case(methodName='dummy', base_name='stuff-ndjson-buffered')
+        instance.setUp()
+        with self.assertRaises(AssertionError) as context:
+            instance.test_list()
+        assert 'single chunk' in str(context.exception)
+
+    def test_test_list_not_streaming(self):
+        instance = self.get_case(methodName='dummy', base_name='stuff')
+        instance.setUp()
+        with self.assertRaises(AssertionError):
+            instance.test_list()
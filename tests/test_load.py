@@ -0,0 +1,71 @@
+import unittest
+
+from django.db import connection
+from django.test import LiveServerTestCase, TransactionTestCase
+
+from rest_assured.load import LiveServerClient, LoadRunner
+from rest_assured.testcases import ReadRESTAPITestCaseMixin
+from tests import mocks
+
+#: Whether worker threads see the test database, which Django < 2.0 does not share for in-memory SQLite on Python 2.
+SHARED_TEST_DB = getattr(connection.features, 'can_share_in_memory_db', True)
+
+
+def get_case(**kwargs):
+    class MockLoadTestCase(ReadRESTAPITestCaseMixin, mocks.MockTestCase):
+        base_name = 'stuff'
+        factory_class = mocks.StuffFactory
+
+    return MockLoadTestCase(**kwargs)
+
+
+@unittest.skipUnless(SHARED_TEST_DB, 'Requires a test database shared between threads.')
+class TestLoadRunner(TransactionTestCase):
+    def test_run(self):
+        instance = get_case(methodName='dummy')
+        instance.setUp()
+        report = LoadRunner(instance, concurrency=3, requests=10).run()
+        assert sorted(report) == ['detail', 'list']
+        for operation in ('list', 'detail'):
+            assert report[operation]['requests'] == 10
+            assert report[operation]['errors'] == 0
+            assert report[operation]['error_types'] == {}
+            assert report[operation]['throughput'] > 0
+            assert report[operation]['latency']['count'] == 10
+            assert sum(count for bound, count in report[operation]['histogram']) == 10
+
+    def test_run_with_rate(self):
+        instance = get_case(methodName='dummy')
+        instance.setUp()
+        report = LoadRunner(instance, operations=['detail'], concurrency=2, requests=5, rate=50).run()
+        assert report['detail']['requests'] == 5
+        assert report['detail']['throughput'] <= 50 * 1.5
+
+    def test_run_counts_errors(self):
+        instance = get_case(methodName='dummy')
+        instance.setUp()
+        # keep the primary key of the object, so the requests get as far as the view
+        instance.object.__class__.objects.filter(pk=instance.object.pk).delete()
+        report = LoadRunner(instance, operations=['detail'], concurrency=2, requests=4).run()
+        assert report['detail']['errors'] == 4
+        assert report['detail']['error_types'] == {'HTTP 404': 4}
+        assert report['detail']['error_rate'] == 1.0
+
+
+class TestLiveServerLoadRunner(LiveServerTestCase):
+    def test_run(self):
+        instance = get_case(methodName='dummy')
+        instance.setUp()
+        report = LoadRunner(instance, concurrency=2, requests=5, live_server_url=self.live_server_url).run()
+        assert report['list']['requests'] == 5
+        assert report['list']['errors'] == 0
+        assert report['detail']['errors'] == 0
+
+    def test_client(self):
+        client = LiveServerClient(self.live_server_url)
+        response = client.post('/stuff/', {'name': 'live stuff'})
+        assert response.status_code == 201
+        assert response.data['name'] == 'live stuff'
+        assert client.get('/stuff/%s/' % response.data['id']).status_code == 200
+        assert client.delete('/stuff/%s/' % response.data['id']).status_code == 204
+        assert client.get('/stuff/%s/' % response.data['id']).status_code == 404
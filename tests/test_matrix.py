@@ -0,0 +1,89 @@
+import unittest
+
+from django.test import TestCase
+
+from rest_assured.matrix import FactoryRegistry, TestMatrix
+from rest_assured.testcases import BaseRESTAPITestCase, CreateAPITestCaseMixin, ListAPITestCaseMixin
+from tests import mocks, urls
+from tests.models import RelatedStuff
+
+
+def matrix_attributes(matrix, base_name):
+    return dict((name, attributes) for name, viewset, attributes in matrix.endpoints())[base_name]
+
+
+class TestTestMatrix(TestCase):
+    def get_matrix(self):
+        registry = FactoryRegistry()
+        registry.register('stuff', mocks.StuffFactory,
+                          create_data={'name': 'moar stuff'}, update_data={'name': 'other things'})
+        registry.register(mocks.RelatedStuffNestedViewSet, mocks.RelatedStuffFactory)
+        registry.register(RelatedStuff, mocks.RelatedStuffFactory, attributes_to_check=[('thing', lambda o: o.thing_id)])
+        registry.register('relatedstuff-linked', mocks.RelatedStuffFactory, attributes_to_check=[])
+
+        return TestMatrix(urls.router, registry, module=__name__)
+
+    def test_params(self):
+        params = self.get_matrix().params()
+        assert ('stuff', 'list') in params
+        assert ('stuff', 'create') in params
+        assert ('stuff', 'destroy') in params
+        # registered by viewset, which is read only
+        assert ('relatedstuff-nested', 'detail') in params
+        assert ('relatedstuff-nested', 'destroy') not in params
+        # registered by model, without create and update data
+        assert ('relatedstuff', 'list') in params
+        assert ('relatedstuff', 'create') not in params
+        assert ('relatedstuff', 'update') not in params
+        # registered by base name, which takes precedence over the model
+        assert matrix_attributes(self.get_matrix(), 'relatedstuff-linked')['attributes_to_check'] == []
+        # not registered
+        assert not [param for param in params if param[0] == 'stuff-linked']
+
+    def test_ids(self):
+        matrix = self.get_matrix()
+        assert 'stuff-list' in matrix.ids()
+        assert len(matrix.ids()) == len(matrix.params())
+
+    def test_get_test_case(self):
+        matrix = self.get_matrix()
+        assert not matrix._test_cases
+
+        test_case = matrix.get_test_case('stuff')
+        assert test_case.__name__ == 'StuffAPITestCase'
+        assert issubclass(test_case, ListAPITestCaseMixin)
+        assert issubclass(test_case, CreateAPITestCaseMixin)
+        assert issubclass(test_case, BaseRESTAPITestCase)
+        assert test_case.base_name == 'stuff'
+        assert test_case.factory_class is mocks.StuffFactory
+        assert matrix.get_test_case('stuff') is test_case
+        assert list(matrix._test_cases) == ['stuff']
+        # in the given module, so its snapshots are stored next to it
+        assert test_case.__module__ == __name__
+
+        assert not issubclass(matrix.get_test_case('relatedstuff'), CreateAPITestCaseMixin)
+
+        with self.assertRaises(KeyError):
+            matrix.get_test_case('stuff-linked')
+
+    def test_run(self):
+        matrix = self.get_matrix()
+        for base_name, operation in matrix.params():
+            matrix.run(base_name, operation)
+
+    def test_run_failure(self):
+        matrix = self.get_matrix()
+        matrix.get_test_case('stuff').create_data = {'answer': 'not a number'}
+        with self.assertRaises(AssertionError):
+            matrix.run('stuff', 'create')
+
+    def test_contribute_to(self):
+        namespace = {}
+        self.get_matrix().contribute_to(namespace)
+        assert sorted(namespace) == ['RelatedstuffAPITestCase', 'RelatedstuffLinkedAPITestCase',
+                                     'RelatedstuffNestedAPITestCase', 'StuffAPITestCase']
+        assert all(issubclass(test_case, unittest.TestCase) for test_case in namespace.values())
+
+        namespace = {'__name__': 'tests.test_generated'}
+        self.get_matrix().contribute_to(namespace)
+        assert namespace['StuffAPITestCase'].__module__ == 'tests.test_generated'
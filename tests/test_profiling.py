@@ -0,0 +1,71 @@
+import os
+import shutil
+import tempfile
+
+from django.test import TestCase
+
+from rest_assured import profiling
+from rest_assured.testcases import ListAPITestCaseMixin, DetailAPITestCaseMixin
+from tests import mocks
+
+
+class TestProfiling:
+    def test_profile(self, tmpdir):
+        path = str(tmpdir.join('profiles', 'stuff.list'))
+        with profiling.profile(path):
+            sum(range(1000))
+        with profiling.profile(path):
+            sum(range(1000))
+
+        assert sorted(os.listdir(str(tmpdir.join('profiles')))) == ['stuff.list.1.prof', 'stuff.list.prof']
+
+    def test_unknown_profiler(self, tmpdir):
+        try:
+            with profiling.profile(str(tmpdir.join('stuff')), 'unknown'):
+                pass
+        except ValueError:
+            pass
+        else:
+            assert False, 'ValueError not raised'
+
+    def test_aggregate_profiles(self, tmpdir):
+        assert profiling.aggregate_profiles(str(tmpdir)) is None
+
+        for name in ('a', 'b'):
+            with profiling.profile(str(tmpdir.join(name))):
+                sorted(range(1000))
+
+        report = profiling.aggregate_profiles(str(tmpdir), limit=5)
+        assert 'Aggregated 2 profiles' in report
+        assert 'sorted' in report
+
+
+class TestProfilingTestCase(TestCase):
+    def get_case(self, **kwargs):
+        class MockProfilingTestCase(ListAPITestCaseMixin, DetailAPITestCaseMixin, mocks.MockTestCase):
+            base_name = 'stuff'
+            factory_class = mocks.StuffFactory
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        MockProfilingTestCase.profile_dir = directory
+
+        return MockProfilingTestCase(**kwargs)
+
+    def test_get_profile_path(self):
+        instance = self.get_case(methodName='dummy')
+        assert instance.get_profile_path('list') == os.path.join(
+            instance.profile_dir, 'stuff.list.MockProfilingTestCase.dummy')
+
+        instance.profile_dir = None
+        assert instance.get_profile_path('list') is None
+
+    def test_profile_requests(self):
+        instance = self.get_case(methodName='dummy')
+        instance.setUp()
+        instance.test_list()
+        instance.test_detail()
+
+        assert sorted(os.listdir(instance.profile_dir)) == [
+            'stuff.detail.MockProfilingTestCase.dummy.prof', 'stuff.list.MockProfilingTestCase.dummy.prof']
+        assert 'Aggregated 2 profiles' in profiling.aggregate_profiles(instance.profile_dir)
@@ -0,0 +1,106 @@
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
+from decimal import Decimal
+
+from django.test import TestCase
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from rest_assured import snapshots
+from rest_assured.testcases import DetailAPITestCaseMixin
+from tests import mocks
+
+
+class TestSnapshots:
+    def test_normalize(self):
+        data = OrderedDict([('id', 3), ('price', Decimal('1.50')), ('tags', [{'id': 4, 'name': 'a'}])])
+        assert snapshots.normalize(data, mask=['id']) == {
+            'id': snapshots.MASKED, 'price': '1.50', 'tags': [{'id': snapshots.MASKED, 'name': 'a'}]}
+
+    def test_content_hash_ignores_key_order(self):
+        assert snapshots.content_hash({'a': 1, 'b': 2}) == snapshots.content_hash({'b': 2, 'a': 1})
+        assert snapshots.content_hash({'a': 1}) != snapshots.content_hash({'a': 2})
+
+    def test_store(self, tmpdir):
+        path = str(tmpdir.join('store.json'))
+        store = snapshots.SnapshotStore(path)
+        assert store.get('a') is None
+
+        digest = store.set('a', {'name': 'stuff'})
+        store.set('b', {'name': 'stuff'})
+        assert len(store.objects) == 1
+
+        store.set('b', {'name': 'other stuff'})
+        assert snapshots.SnapshotStore(path).get('a') is None
+        store.save()
+        loaded = snapshots.SnapshotStore(path)
+        assert loaded.get('a') == (digest, {'name': 'stuff'})
+        assert loaded.get('b')[1] == {'name': 'other stuff'}
+        assert len(loaded.objects) == 2
+
+
+class TestSnapshotTestCase(TestCase):
+    def get_case(self, **kwargs):
+        class MockSnapshotTestCase(DetailAPITestCaseMixin, mocks.MockTestCase):
+            base_name = 'stuff'
+            factory_class = mocks.StuffFactory
+            use_snapshots = True
+            snapshot_mask = ['id']
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.addCleanup(snapshots._stores.clear)
+        MockSnapshotTestCase.snapshot_dir = directory
+
+        return MockSnapshotTestCase(**kwargs)
+
+    def test_get_snapshot_path(self):
+        instance = self.get_case(methodName='dummy')
+        assert instance.get_snapshot_path() == os.path.join(
+            instance.snapshot_dir, 'tests.test_snapshots.MockSnapshotTestCase.json')
+
+    def test_test_detail_with_snapshots(self):
+        instance = self.get_case(methodName='dummy')
+        instance.setUp()
+        # recording run stores the snapshot, written after the test case class or on exit
+        with mock.patch.dict(os.environ, {'REST_ASSURED_UPDATE_SNAPSHOTS': '1'}):
+            instance.test_detail()
+        assert not os.path.exists(instance.get_snapshot_path())
+        snapshots.save_stores()
+        assert os.path.exists(instance.get_snapshot_path())
+        # then compares against it, masking the id
+        instance.setUp()
+        instance.test_detail()
+
+        instance.object.name = 'changed stuff'
+        instance.object.save()
+        with self.assertRaises(AssertionError) as context:
+            instance.test_detail()
+        assert '+ "name": "changed stuff"' in str(context.exception)
+
+    def test_missing_snapshot(self):
+        instance = self.get_case(methodName='dummy')
+        instance.setUp()
+        with self.assertRaises(AssertionError) as context:
+            instance.test_detail()
+        assert 'Snapshot dummy.detail of detail does not exist' in str(context.exception)
+        assert snapshots.get_store(instance.get_snapshot_path()).get('dummy.detail') is None
+
+    def test_update_snapshots(self):
+        instance = self.get_case(methodName='dummy')
+        instance.setUp()
+        with mock.patch.dict(os.environ, {'REST_ASSURED_UPDATE_SNAPSHOTS': '1'}):
+            instance.test_detail()
+
+            instance.object.name = 'changed stuff'
+            instance.object.save()
+            instance.test_detail()
+        snapshots.save_stores()
+
+        stored = snapshots.SnapshotStore(instance.get_snapshot_path()).get('dummy.detail')
+        assert stored[1]['name'] == 'changed stuff'
@@ -1,9 +1,9 @@
-from django.test import TestCase
+from django.test import LiveServerTestCase, TestCase
 
 from rest_framework.reverse import reverse
 from rest_assured.testcases import UpdateAPITestCaseMixin
 from tests import mocks
-from tests.models import Stuff, RelatedStuff
+from tests.models import Stuff, RelatedStuff, ManyRelatedStuff
 
 
 class TestUpdateTestCase(TestCase):
@@ -98,3 +98,105 @@ class TestUpdateTestCase(TestCase):
         assert response
         assert updated
         assert isinstance(updated, RelatedStuff)
+
+    def test_test_update_with_manytomany(self):
+        instance = self.get_many_related_case(methodName='dummy')
+        instance.setUp()
+        response, updated = instance.test_update()
+        assert response
+        assert isinstance(updated, ManyRelatedStuff)
+        assert sorted(response.data['stuff']) == sorted(thing.id for thing in updated.stuff.all())
+
+    def test_test_update_fetches_relations_for_verification(self):
+        instance = self.get_related_case(methodName='dummy')
+        instance.setUp()
+        response, updated = instance.test_update()
+        with self.assertNumQueries(0):
+            instance._update_check_db(updated)
+
+        instance = self.get_many_related_case(methodName='dummy')
+        instance.setUp()
+        response, updated = instance.test_update()
+        with self.assertNumQueries(0):
+            instance._update_check_db(updated)
+
+    @mocks.conditional_get
+    def test_test_update_invalidates_cache(self):
+        instance = self.get_case(methodName='dummy')
+        instance.check_cache_invalidation = True
+        instance.setUp()
+        response, updated = instance.test_update()
+        assert response
+
+    @mocks.conditional_get
+    def test_test_update_does_not_invalidate_cache(self):
+        instance = self.get_case(methodName='dummy')
+        instance.check_cache_invalidation = True
+        instance.update_data = {'name': 'name of stuff'}
+        instance.setUp()
+        with self.assertRaises(AssertionError) as context:
+            instance.test_update()
+        assert 'invalidate' in str(context.exception)
+
+    @mocks.conditional_get
+    def test_test_update_invalidates_cache_of_detail_url(self):
+        urls = []
+        instance = self.get_case(methodName='dummy')
+        instance.check_cache_invalidation = True
+        instance.update_name = 'stuff-paginated-detail'
+        instance.setUp()
+        send_request = instance.send_request
+
+        def record(operation, method, url, *args, **kwargs):
+            urls.append((operation, url))
+            return send_request(operation, method, url, *args, **kwargs)
+
+        instance.send_request = record
+        instance.test_update()
+        detail_url = '/stuff/%s/' % instance.object.pk
+        assert urls == [('detail', detail_url), ('update', '/stuff-paginated/%s/' % instance.object.pk),
+                        ('detail', detail_url)]
+
+
+class TestConcurrentUpdateTestCase(LiveServerTestCase):
+    def get_case(self, **kwargs):
+        class MockUpdateTestCase(UpdateAPITestCaseMixin, mocks.MockTestCase):
+            base_name = 'stuff'
+            factory_class = mocks.StuffFactory
+            update_data = {'name': 'other things'}
+            update_variants = [{'name': 'first things', 'answer': 1}, {'name': 'second things', 'answer': 2}]
+            update_concurrency = 4
+
+        MockUpdateTestCase.live_server_url = self.live_server_url
+
+        return MockUpdateTestCase(**kwargs)
+
+    def test_test_update_concurrently(self):
+        instance = self.get_case(methodName='dummy')
+        instance.setUp()
+        instance.test_update()
+        stats = instance.update_contention_stats
+        assert stats['requests'] == 4
+        assert stats['conflicts'] == 0
+        assert stats['throughput'] > 0
+        assert stats['latency']['count'] == stats['lock_wait']['count'] == 4
+
+        updated = Stuff.objects.get(pk=instance.object.pk)
+        assert (updated.name, updated.answer) in [('first things', 1), ('second things', 2)]
+
+    def test_check_concurrent_updates_lost_fields(self):
+        instance = self.get_case(methodName='dummy')
+        instance.setUp()
+        # the id is read only, so the row never matches the data
+        with self.assertRaises(AssertionError) as context:
+            instance.check_concurrent_updates([{'name': 'first things', 'id': 0}], concurrency=2,
+                                              live_server_url=self.live_server_url)
+        assert 'lost' in str(context.exception)
+
+    def test_check_concurrent_updates_failing_baseline(self):
+        instance = self.get_case(methodName='dummy')
+        instance.setUp()
+        with self.assertRaises(AssertionError) as context:
+            instance.check_concurrent_updates([{'answer': 'not a number'}], concurrency=2,
+                                              live_server_url=self.live_server_url)
+        assert 'Uncontended update request failed' in str(context.exception)
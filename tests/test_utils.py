@@ -0,0 +1,70 @@
+from rest_assured import utils
+
+
+class TestUtils:
+    def test_percentile(self):
+        samples = [4, 1, 3, 2, 5]
+        assert utils.percentile(samples, 0) == 1
+        assert utils.percentile(samples, 50) == 3
+        assert utils.percentile(samples, 100) == 5
+        assert utils.percentile(samples, 25) == 2
+        assert utils.percentile([1, 2], 50) == 1.5
+
+    def test_summarize(self):
+        stats = utils.summarize([1, 2, 3, 4])
+        assert stats['count'] == 4
+        assert stats['mean'] == 2.5
+        assert stats['min'] == 1
+        assert stats['max'] == 4
+        assert round(stats['stdev'], 4) == 1.291
+        assert stats['p50'] == 2.5
+
+    def test_histogram(self):
+        buckets = utils.histogram([0.5, 1, 3, 7, 100], (1, 5, 10))
+        assert buckets == [(1, 2), (5, 1), (10, 1), (None, 1)]
+
+    def test_get_worker_id(self, monkeypatch):
+        monkeypatch.delenv('REST_ASSURED_WORKER_ID', raising=False)
+        monkeypatch.delenv('PYTEST_XDIST_WORKER', raising=False)
+        assert utils.get_worker_id() is None
+        assert utils.worker_unique('user') == 'user'
+
+        monkeypatch.setenv('PYTEST_XDIST_WORKER', 'gw3')
+        assert utils.get_worker_id() == 'gw3'
+        assert utils.worker_unique('user') == 'gw3-user'
+
+    def test_get_worker_id_from_setting(self, monkeypatch):
+        monkeypatch.setenv('PYTEST_XDIST_WORKER', 'gw3')
+        monkeypatch.setenv('REST_ASSURED_WORKER_ID', 'node2')
+        assert utils.get_worker_id() == 'node2'
+
+    def test_get_worker_id_with_django_parallel_runner(self, monkeypatch):
+        from django.test import runner
+
+        monkeypatch.delenv('REST_ASSURED_WORKER_ID', raising=False)
+        monkeypatch.delenv('PYTEST_XDIST_WORKER', raising=False)
+        monkeypatch.setattr(runner, '_worker_id', 2, raising=False)
+        assert utils.get_worker_id() == 'w2'
+
+    def test_run_concurrently(self):
+        class Case(object):
+            client_class = object
+            user = None
+
+        case = Case()
+        running = []
+
+        def request(clone):
+            running.append(clone)
+            return len(running)
+
+        def failing(clone):
+            raise ValueError('failed')
+
+        results, elapsed = utils.run_concurrently(case, [request, request, failing])
+        assert sorted(response for response, latency in results[:2]) == [1, 2]
+        assert all(latency >= 0 for response, latency in results[:2])
+        assert isinstance(results[2][0], ValueError) and results[2][1] is None
+        # each request gets its own copy of the test case and client
+        assert len(set(id(clone) for clone in running)) == 2 and case not in running
+        assert elapsed > 0
@@ -1,32 +1,59 @@
-from rest_framework import routers
+from django.conf.urls import url
+from rest_framework import VERSION, routers
 
 from tests import mocks
 
 
+# DRF 3.9 renamed ``base_name`` to ``basename`` and later versions dropped it
+BASENAME = 'basename' if tuple(int(part) for part in VERSION.split('.')[:2]) >= (3, 9) else 'base_name'
+
 router = routers.DefaultRouter()
 
 router.register(r'stuff',
                 mocks.StuffViewSet,
-                base_name='stuff')
+                **{BASENAME: 'stuff'})
+
+router.register(r'stuff-paginated',
+                mocks.StuffPaginatedViewSet,
+                **{BASENAME: 'stuff-paginated'})
 
 router.register(r'stuff-linked',
                 mocks.StuffHyperlinkedViewSet,
-                base_name='stuff-linked')
+                **{BASENAME: 'stuff-linked'})
 
 router.register(r'related-stuff',
                 mocks.RelatedStuffViewSet,
-                base_name='relatedstuff')
+                **{BASENAME: 'relatedstuff'})
 
 router.register(r'related-stuff-linked',
                 mocks.RelatedStuffHyperlinkedViewSet,
-                base_name='relatedstuff-linked')
+                **{BASENAME: 'relatedstuff-linked'})
+
+router.register(r'related-stuff-nested',
+                mocks.RelatedStuffNestedViewSet,
+                **{BASENAME: 'relatedstuff-nested'})
 
 router.register(r'many-related-stuff',
-                mocks.RelatedStuffViewSet,
-                base_name='manyrelatedstuff')
+                mocks.ManyRelatedStuffViewSet,
+                **{BASENAME: 'manyrelatedstuff'})
 
 router.register(r'many-related-stuff-linked',
-                mocks.RelatedStuffHyperlinkedViewSet,
-                base_name='manyrelatedstuff-linked')
-
-urlpatterns = router.urls
+                mocks.ManyRelatedStuffHyperlinkedViewSet,
+                **{BASENAME: 'manyrelatedstuff-linked'})
+
+if mocks.Order is not None:
+    router.register(r'order',
+                    mocks.OrderViewSet,
+                    **{BASENAME: 'order'})
+
+urlpatterns = router.urls + [
+    url(r'^stuff-ndjson/$', mocks.stuff_ndjson, name='stuff-ndjson-list'),
+    url(r'^stuff-ndjson-buffered/$', mocks.stuff_ndjson_buffered, name='stuff-ndjson-buffered-list'),
+    url(r'^stuff-csv/$', mocks.stuff_csv, name='stuff-csv-list'),
+    url(r'^stuff-cursor/$', mocks.StuffCursorViewSet.as_view({'get': 'list'}), name='stuff-cursor-list'),
+    url(r'^stuff-overlapping/$', mocks.StuffOverlappingViewSet.as_view({'get': 'list'}),
+        name='stuff-overlapping-list'),
+    url(r'^stuff-filtered/$', mocks.StuffFilteredViewSet.as_view({'get': 'list'}), name='stuff-filtered-list'),
+    url(r'^stuff-bulk/$', mocks.StuffBulkView.as_view(), name='stuff-bulk-list'),
+    url(r'^stuff-bulk-loop/$', mocks.StuffLoopBulkView.as_view(), name='stuff-bulk-loop-list'),
+]